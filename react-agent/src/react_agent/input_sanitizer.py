@@ -21,38 +21,48 @@ DANGEROUS_PATTERNS = [
     r"<\|im_end\|>",
 ]
 
-# 컴파일된 패턴
-COMPILED_PATTERNS = [
-    re.compile(pattern, re.IGNORECASE) for pattern in DANGEROUS_PATTERNS
-]
+# 전체 패턴을 하나의 alternation으로 컴파일 (입력을 한 번만 스캔)
+COMPILED_PATTERN = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(DANGEROUS_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# 가장 짧은 패턴 매치("[INST]")보다 짧은 입력은 스캔할 필요가 없음
+MIN_INJECTION_LENGTH = 6
+
+MAX_INPUT_LENGTH = 10000
+_WHITESPACE = re.compile(r'\s+')
 
 
 def detect_prompt_injection(message: str) -> Tuple[bool, str]:
     """프롬프트 인젝션 시도 감지"""
-    for pattern in COMPILED_PATTERNS:
-        match = pattern.search(message)
-        if match:
-            logger.warning(f"[보안] 프롬프트 인젝션 시도 감지: '{match.group()}'")
-            return True, match.group()
+    if len(message) < MIN_INJECTION_LENGTH:
+        return False, ""
+    match = COMPILED_PATTERN.search(message)
+    if match:
+        logger.warning(f"[보안] 프롬프트 인젝션 시도 감지: '{match.group()}'")
+        return True, match.group()
     return False, ""
 
 
 def sanitize_user_input(message: str, strict: bool = False) -> str:
-    """사용자 입력 정제"""
-    is_dangerous, pattern = detect_prompt_injection(message)
+    """사용자 입력 정제
 
+    공백 정규화와 길이 제한을 먼저 적용한 뒤 인젝션 검사를 한 번만 수행한다.
+    검사 대상이 최대 10,000자로 제한되고, 긴 공백으로 쪼개진 패턴도 잡힌다.
+    """
+    # 기본 정제
+    sanitized = _WHITESPACE.sub(' ', message).strip()
+
+    # 최대 길이 제한 (10,000자)
+    if len(sanitized) > MAX_INPUT_LENGTH:
+        logger.warning(f"[보안] 입력이 너무 깁니다: {len(sanitized)}자 → {MAX_INPUT_LENGTH}자로 자름")
+        sanitized = sanitized[:MAX_INPUT_LENGTH]
+
+    is_dangerous, pattern = detect_prompt_injection(sanitized)
     if is_dangerous:
         if strict:
             raise ValueError(f"잠재적으로 위험한 입력이 감지되었습니다: {pattern}")
         logger.warning(f"[보안] 위험 패턴 감지됨 (비엄격 모드): {pattern}")
 
-    # 기본 정제
-    sanitized = re.sub(r'\s+', ' ', message).strip()
-
-    # 최대 길이 제한 (10,000자)
-    max_length = 10000
-    if len(sanitized) > max_length:
-        logger.warning(f"[보안] 입력이 너무 깁니다: {len(sanitized)}자 → {max_length}자로 자름")
-        sanitized = sanitized[:max_length]
-
     return sanitized
@@ -19,9 +19,13 @@ Usage:
 """
 
 import os
+import copy
 import json
+import queue
+import atexit
 import logging
 import threading
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from contextvars import ContextVar
@@ -74,6 +78,26 @@ def clear_log_context() -> None:
     _log_context.set({})
 
 
+class LogContextFilter(logging.Filter):
+    """Attach the current log context to each record at log-call time.
+
+    Formatters read ``record.log_context`` instead of the ContextVar, so the
+    context stays correct even when records are formatted on another thread.
+    set_log_context() always installs a new dict, so sharing it is safe.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Copy the request context reference onto the record."""
+        record.log_context = _log_context.get()
+        return True
+
+
+def _record_context(record: logging.LogRecord) -> Dict[str, Any]:
+    """Return the context captured on the record, or the live one as fallback."""
+    context = getattr(record, "log_context", None)
+    return get_log_context() if context is None else context
+
+
 class JsonFormatter(logging.Formatter):
     """JSON formatter for structured logging in production.
 
@@ -96,7 +120,7 @@ class JsonFormatter(logging.Formatter):
         "levelname", "levelno", "lineno", "module", "msecs",
         "pathname", "process", "processName", "relativeCreated",
         "stack_info", "exc_info", "exc_text", "thread", "threadName",
-        "taskName", "message",
+        "taskName", "message", "log_context",
     }
 
     def format(self, record: logging.LogRecord) -> str:
@@ -112,8 +136,8 @@ class JsonFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add context from ContextVar
-        context = get_log_context()
+        # Add context captured by LogContextFilter
+        context = _record_context(record)
         if context:
             log_obj["context"] = context
 
@@ -181,7 +205,7 @@ class DevelopmentFormatter(logging.Formatter):
         base = f"{timestamp} {level_str} [{record.name}] {message}"
 
         # Add context if present
-        context = get_log_context()
+        context = _record_context(record)
         if context:
             context_str = " ".join(f"{k}={v}" for k, v in context.items())
             base = f"{base} | {context_str}"
@@ -194,6 +218,38 @@ class DevelopmentFormatter(logging.Formatter):
         return base
 
 
+class _ContextQueueHandler(QueueHandler):
+    """QueueHandler that defers all formatting to the listener thread.
+
+    The stock prepare() renders the record (including the traceback) on the
+    caller's thread; here only the message is merged so that exc_info reaches
+    the real formatter intact and exception formatting happens off-thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args into the message so the record is safe to hand off."""
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+# Active background listener (replaced on each setup_logging call)
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def _supports_color() -> bool:
     """Check if the terminal supports colors."""
     # Check for NO_COLOR environment variable (standard)
@@ -247,10 +303,21 @@ def setup_logging(
     else:
         handler.setFormatter(DevelopmentFormatter())
 
+    # Request threads only enqueue records; formatting and stderr writes run
+    # on a listener thread so a burst of errors cannot block the event loop.
+    # The context filter sits on the queue side, where the ContextVar is live.
+    global _queue_listener
+    _stop_queue_listener()
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    queue_handler = _ContextQueueHandler(log_queue)
+    queue_handler.addFilter(LogContextFilter())
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.handlers = []  # Clear existing handlers
-    root_logger.addHandler(handler)
+    root_logger.addHandler(queue_handler)
     root_logger.setLevel(log_level)
 
     # Reduce noise from third-party libraries
@@ -2,18 +2,23 @@
 
 import os
 import uuid
-import json
+import hashlib
 import time
 import logging
 import asyncio
 import psutil
+import orjson
 import http
 from datetime import datetime
-from typing import Any, Dict, Optional, List
+from typing import Any, AsyncIterator, Dict, Optional, List
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
+try:
+    from fastapi.sse import EventSourceResponse  # FastAPI >= 0.135
+except ImportError:
+    EventSourceResponse = StreamingResponse
 from pydantic import BaseModel, Field
 import uvicorn
 from slowapi import Limiter
@@ -26,8 +31,8 @@ from react_agent.graph_multi import graph   # 멀티 에이전트 그래프 임
 from react_agent.configuration import Configuration  # 기존 설정 클래스
 from langchain_core.messages import AIMessage, HumanMessage   # 랭체인 메세지 타입 임포트
 from react_agent.rag_tool import get_rag_tool  # RAG 도구
-from react_agent.input_sanitizer import sanitize_user_input, detect_prompt_injection  # 입력 검증
-from react_agent.cache_manager import get_cache_manager  # 캐시 매니저
+from react_agent.input_sanitizer import sanitize_user_input  # 입력 검증
+from react_agent.cache_manager import LRUCache, get_cache_manager  # 캐시 매니저
 from react_agent.logging_config import setup_logging, get_logger, LogContext, set_log_context, clear_log_context  # 구조화된 로깅
 
 # Load environment variables
@@ -118,6 +123,37 @@ ACTIVE_REQUESTS = _get_or_create_metric(
     'Number of currently active requests'
 )
 
+# Pre-bound label children for the fixed endpoint/status combinations on the
+# request hot path; skips the per-request labels() lookup and child-creation lock
+_INVOKE_COUNT = {
+    status: REQUEST_COUNT.labels(endpoint="/invoke", method="POST", status=status)
+    for status in ("success", "error")
+}
+_STREAM_COUNT = {
+    status: REQUEST_COUNT.labels(endpoint="/stream", method="POST", status=status)
+    for status in ("started", "success", "error")
+}
+_RUNS_STREAM_COUNT = {
+    status: REQUEST_COUNT.labels(endpoint="/threads/runs/stream", method="POST", status=status)
+    for status in ("started", "success", "error", "cancelled")
+}
+_INVOKE_LATENCY = REQUEST_LATENCY.labels(endpoint="/invoke")
+_STREAM_LATENCY = REQUEST_LATENCY.labels(endpoint="/stream")
+_RUNS_STREAM_LATENCY = REQUEST_LATENCY.labels(endpoint="/threads/runs/stream")
+
+# ERROR_COUNT children for the fixed endpoints above, bound on first use per
+# exception class (bounded by the handful of exception types actually raised)
+_ERROR_COUNT_CHILDREN: Dict[tuple, Any] = {}
+
+
+def _count_error(exc: BaseException, endpoint: str) -> None:
+    """Increment ERROR_COUNT for ``exc`` on a fixed endpoint via a memoized child."""
+    key = (type(exc).__name__, endpoint)
+    child = _ERROR_COUNT_CHILDREN.get(key)
+    if child is None:
+        child = _ERROR_COUNT_CHILDREN[key] = ERROR_COUNT.labels(error_type=key[0], endpoint=endpoint)
+    child.inc()
+
 
 # Helper function to convert LangChain messages to JSON-serializable format
 def message_to_dict(msg):  # 랭체인 메세지를 json으로 변환 -> 프론트엔드 sdk 형식 / 호환을 위함
@@ -215,6 +251,17 @@ def is_streamable_text_message(msg) -> bool:
 
 def serialize_chunk(chunk):
     """Recursively serialize a chunk to JSON-serializable format."""
+    # Fast path: exact-type identity checks skip the MRO walk of isinstance()
+    # for the primitives and plain containers that make up most state leaves
+    t = type(chunk)
+    if t is str or t is int or t is float or t is bool or chunk is None:
+        return chunk
+    if t is dict:
+        return {key: serialize_chunk(value) for key, value in chunk.items()}
+    if t is list:
+        return [serialize_chunk(item) for item in chunk]
+
+    # Slow path: subclasses of dict/list and LangChain/Pydantic objects
     if isinstance(chunk, dict):
         return {key: serialize_chunk(value) for key, value in chunk.items()}
     elif isinstance(chunk, list):
@@ -224,6 +271,143 @@ def serialize_chunk(chunk):
     else:
         return chunk
 
+# Frames with a fixed shape: run_id is hex, thread_id is substituted
+# pre-encoded (it comes from the URL path and may need JSON escaping)
+_SSE_METADATA_TEMPLATE = b'event: metadata\ndata: {"run_id":"%s","thread_id":%s}\n\n'
+_SSE_END_FRAME = b"event: end\ndata: {}\n\n"
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Convert LangChain/Pydantic objects while orjson walks a payload.
+
+    Lets a payload containing message objects be encoded in one traversal
+    instead of a serialize_chunk() pass followed by a dumps() pass.
+    """
+    if hasattr(obj, 'dict') or hasattr(obj, 'model_dump') or hasattr(obj, '__dict__'):
+        return message_to_dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _sse(event: str, payload: Any) -> bytes:
+    """Encode a single SSE frame with orjson.
+
+    Yielding bytes also skips StreamingResponse's str -> bytes re-encoding.
+    """
+    return (
+        b"event: " + event.encode() + b"\ndata: "
+        + orjson.dumps(payload, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        + b"\n\n"
+    )
+
+
+def _extract_text(content: Any) -> str:
+    """Extract the user text from a LangGraph Cloud message ``content``.
+
+    Content is either a plain string or a list of content blocks
+    (``[{'type': 'text', 'text': '...'}, ...]``); only text blocks are kept.
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            part.get("text", "")
+            for part in content
+            if isinstance(part, dict) and part.get("type") == "text"
+        )
+    return str(content)
+
+
+DEFAULT_MODEL = "claude-haiku-4-5"
+
+
+def _graph_config(model: Optional[str], category: Optional[str], thread_id: str) -> Dict[str, Any]:
+    """Build the per-request LangGraph config (only the varying leaves differ)."""
+    return {"configurable": {"model": model or DEFAULT_MODEL, "category": category, "thread_id": thread_id}}
+
+
+# SSE keep-alive: proxies (Nginx/CDN) drop idle connections during long LLM
+# generations, so a comment frame is sent whenever the graph is silent this long
+SSE_PING_INTERVAL_SECONDS = 15.0
+_SSE_KEEPALIVE = b": ping\n\n"
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable Nginx buffering for streaming
+}
+
+# Token frames are only a few bytes each; batch them into one write until
+# either bound is reached (15 ms stays well below perceptible latency)
+SSE_COALESCE_BYTES = 512
+SSE_COALESCE_SECONDS = 0.015
+_SSE_MESSAGES_PREFIX = b"event: messages\n"
+
+
+async def _pace_frames(frames):
+    """Forward SSE frames, coalescing token frames and inserting keep-alives.
+
+    Consecutive ``messages`` frames are buffered until SSE_COALESCE_BYTES or
+    SSE_COALESCE_SECONDS accumulate; any other frame flushes the buffer with
+    it, so ordering is preserved. The next frame is awaited via a task rather
+    than ``wait_for`` so a timeout never cancels (and thereby finalizes) the
+    underlying generator.
+    """
+    iterator = frames.__aiter__()
+    pending = asyncio.ensure_future(iterator.__anext__())
+    buffer = bytearray()
+    flush_at = 0.0
+    try:
+        while True:
+            if buffer:
+                timeout = max(flush_at - time.monotonic(), 0.0)
+            else:
+                timeout = SSE_PING_INTERVAL_SECONDS
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                if buffer:
+                    yield bytes(buffer)
+                    buffer.clear()
+                else:
+                    yield _SSE_KEEPALIVE
+                continue
+            try:
+                frame = pending.result()
+            except StopAsyncIteration:
+                if buffer:
+                    yield bytes(buffer)
+                return
+            pending = asyncio.ensure_future(iterator.__anext__())
+
+            if frame.startswith(_SSE_MESSAGES_PREFIX):
+                if not buffer:
+                    flush_at = time.monotonic() + SSE_COALESCE_SECONDS
+                buffer += frame
+                if len(buffer) < SSE_COALESCE_BYTES:
+                    continue
+            elif buffer:
+                buffer += frame
+            else:
+                yield frame
+                continue
+            yield bytes(buffer)
+            buffer.clear()
+    finally:
+        if not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except BaseException:
+                pass
+
+
+def _event_stream_response(frames) -> StreamingResponse:
+    """Wrap an SSE frame generator in a paced ``text/event-stream`` response."""
+    return EventSourceResponse(
+        _pace_frames(frames),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
+
+
 # Thread activity tracking for memory cleanup
 thread_last_activity: Dict[str, float] = {}
 THREAD_TTL_SECONDS = 90 * 60  # 90 minutes
@@ -235,6 +419,21 @@ def track_thread_activity(thread_id: str) -> None:
     thread_last_activity[thread_id] = time.time()
 
 
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string.
+
+    Formats from a single ``time.time()`` read instead of building a
+    ``datetime`` object, since this runs on every error and health response.
+    """
+    t = time.time()
+    tm = time.gmtime(t)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        f".{int((t % 1) * 1e6):06d}Z"
+    )
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="CarbonAI Agent API",
@@ -299,8 +498,8 @@ def create_error_response(
     Returns:
         JSONResponse with RFC 7807 compliant error body
     """
-    # Generate trace ID for error tracking
-    trace_id = str(uuid.uuid4())[:8]
+    # Generate trace ID for error tracking (opaque, so raw hex is enough)
+    trace_id = os.urandom(4).hex()
 
     # Get HTTP status phrase as default title
     try:
@@ -314,7 +513,7 @@ def create_error_response(
         status=status_code,
         detail=detail,
         instance=str(request.url),
-        timestamp=datetime.now().isoformat(),
+        timestamp=utc_timestamp(),
         trace_id=trace_id
     )
 
@@ -533,7 +732,7 @@ class ChatRequest(BaseModel):
     message: str = Field(..., description="User message")
     thread_id: Optional[str] = Field(None, description="Thread ID for conversation continuity")
     category: Optional[str] = Field(None, description="Category: 탄소배출권, 규제대응, 고객상담")
-    model: Optional[str] = Field("claude-haiku-4-5", description="Model name")
+    model: Optional[str] = Field(DEFAULT_MODEL, description="Model name")
 
 
 class ChatResponse(BaseModel):
@@ -742,7 +941,7 @@ async def health_check():
 
     return {
         "status": overall_status,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": utc_timestamp(),
         "service": "carbonai-agent",
         "version": "1.0.0",
         "components": components,
@@ -767,7 +966,7 @@ async def invoke_agent(request: Request, chat_request: ChatRequest):
         ChatResponse with agent's response
     """
     # Generate request ID for tracing
-    request_id = str(uuid.uuid4())[:8]
+    request_id = os.urandom(4).hex()
     thread_id = chat_request.thread_id or "default"
     category = chat_request.category or "general"
 
@@ -785,21 +984,11 @@ async def invoke_agent(request: Request, chat_request: ChatRequest):
     try:
         logger.info("Invoke request received", extra={"message_length": len(chat_request.message)})
 
-        # 입력 검증
-        is_dangerous, pattern = detect_prompt_injection(chat_request.message)
-        if is_dangerous:
-            logger.warning("Dangerous input detected", extra={"pattern": pattern})
-
+        # 입력 검증 (인젝션 검사는 sanitize_user_input 안에서 한 번만 수행)
         sanitized_message = sanitize_user_input(chat_request.message)
 
         # Prepare configuration
-        config = {
-            "configurable": {
-                "model": chat_request.model or "claude-haiku-4-5",
-                "category": chat_request.category,
-                "thread_id": chat_request.thread_id or "default"
-            }
-        }
+        config = _graph_config(chat_request.model, chat_request.category, thread_id)
 
         # Track agent usage
         AGENT_USAGE.labels(agent_type="invoke", category=category).inc()
@@ -827,14 +1016,14 @@ async def invoke_agent(request: Request, chat_request: ChatRequest):
 
     except Exception as e:
         status = "error"
-        ERROR_COUNT.labels(error_type=type(e).__name__, endpoint="/invoke").inc()
+        _count_error(e, "/invoke")
         logger.error("Invoke request failed", extra={"error": str(e), "error_type": type(e).__name__})
         raise HTTPException(status_code=500, detail=f"Error invoking agent: {str(e)}")
     finally:
         elapsed = time.perf_counter() - start_time
         ACTIVE_REQUESTS.dec()
-        REQUEST_COUNT.labels(endpoint="/invoke", method="POST", status=status).inc()
-        REQUEST_LATENCY.labels(endpoint="/invoke").observe(elapsed)
+        _INVOKE_COUNT[status].inc()
+        _INVOKE_LATENCY.observe(elapsed)
         logger.info("Invoke request completed", extra={"status": status, "duration_seconds": round(elapsed, 3)})
         clear_log_context()
 
@@ -854,12 +1043,12 @@ async def stream_agent(request: Request, chat_request: ChatRequest):
         StreamingResponse with agent's response chunks
     """
     # Generate request ID for tracing
-    request_id = str(uuid.uuid4())[:8]
+    request_id = os.urandom(4).hex()
     thread_id = chat_request.thread_id or "default"
     category = chat_request.category or "general"
 
     start_time = time.perf_counter()
-    REQUEST_COUNT.labels(endpoint="/stream", method="POST", status="started").inc()
+    _STREAM_COUNT["started"].inc()
 
     # Track agent usage
     AGENT_USAGE.labels(agent_type="stream", category=category).inc()
@@ -874,21 +1063,11 @@ async def stream_agent(request: Request, chat_request: ChatRequest):
         )
         logger.info("Stream request received", extra={"message_length": len(chat_request.message)})
 
-        # 입력 검증
-        is_dangerous, pattern = detect_prompt_injection(chat_request.message)
-        if is_dangerous:
-            logger.warning("Dangerous input detected", extra={"pattern": pattern})
-
+        # 입력 검증 (인젝션 검사는 sanitize_user_input 안에서 한 번만 수행)
         sanitized_message = sanitize_user_input(chat_request.message)
 
         # Prepare configuration
-        config = {
-            "configurable": {
-                "model": chat_request.model or "claude-haiku-4-5",
-                "category": chat_request.category,
-                "thread_id": chat_request.thread_id or "default"
-            }
-        }
+        config = _graph_config(chat_request.model, chat_request.category, thread_id)
 
         # Prepare input
         # IMPORTANT: Create HumanMessage object to avoid "complex" serialization
@@ -922,15 +1101,15 @@ async def stream_agent(request: Request, chat_request: ChatRequest):
                         # Skip values events in simple endpoint
 
                 yield "data: [DONE]\n\n"
-                REQUEST_COUNT.labels(endpoint="/stream", method="POST", status="success").inc()
+                _STREAM_COUNT["success"].inc()
 
             except Exception as e:
-                ERROR_COUNT.labels(error_type=type(e).__name__, endpoint="/stream").inc()
-                REQUEST_COUNT.labels(endpoint="/stream", method="POST", status="error").inc()
+                _count_error(e, "/stream")
+                _STREAM_COUNT["error"].inc()
                 yield f"data: Error: {str(e)}\n\n"
             finally:
                 ACTIVE_REQUESTS.dec()
-                REQUEST_LATENCY.labels(endpoint="/stream").observe(time.perf_counter() - stream_start)
+                _STREAM_LATENCY.observe(time.perf_counter() - stream_start)
 
         return StreamingResponse(
             generate(),
@@ -938,148 +1117,321 @@ async def stream_agent(request: Request, chat_request: ChatRequest):
         )
 
     except Exception as e:
-        ERROR_COUNT.labels(error_type=type(e).__name__, endpoint="/stream").inc()
-        REQUEST_COUNT.labels(endpoint="/stream", method="POST", status="error").inc()
+        _count_error(e, "/stream")
+        _STREAM_COUNT["error"].inc()
         raise HTTPException(status_code=500, detail=f"Error streaming agent: {str(e)}")
 
 
+class _StaticJSON:
+    """JSON body serialized once at import time, served as raw bytes.
+
+    Carries a precomputed ETag so clients revalidating with If-None-Match get
+    a bodiless 304 instead of a re-sent payload.
+    """
+
+    __slots__ = ("body", "etag", "headers")
+
+    def __init__(self, payload: Any, max_age: int = 3600, immutable: bool = False):
+        self.body = orjson.dumps(payload)
+        self.etag = f'"{hashlib.md5(self.body).hexdigest()}"'
+        cache_control = f"public, max-age={max_age}, immutable" if immutable else f"public, max-age={max_age}"
+        self.headers = {"ETag": self.etag, "Cache-Control": cache_control}
+
+    def response(self, request: Request) -> Response:
+        """Return 304 on a matching If-None-Match, otherwise the cached body."""
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=self.headers)
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
+
+
+# Placeholder substituted with the JSON-encoded path parameter per request
+_ID_PLACEHOLDER = b'"__ID__"'
+
+_CATEGORIES = _StaticJSON({
+    "categories": [
+        {
+            "id": "탄소배출권",
+            "name": "탄소배출권",
+            "description": "배출권 거래, 구매, 판매, 관리 전문 상담"
+        },
+        {
+            "id": "규제대응",
+            "name": "규제대응",
+            "description": "탄소 규제, 법규, 보고서, 컴플라이언스 대응"
+        },
+        {
+            "id": "고객상담",
+            "name": "고객상담",
+            "description": "1:1 맞춤 상담, 서비스 안내, 문의사항"
+        }
+    ]
+})
+
+_ROOT = _StaticJSON({
+    "service": "CarbonAI Agent API",
+    "version": "1.0.0",
+    "endpoints": {
+        "health_simple": "GET /ok (로드밸런서용)",
+        "health_detailed": "GET /health (상세 상태)",
+        "metrics": "GET /metrics (Prometheus 메트릭)",
+        "invoke": "POST /invoke",
+        "stream": "POST /stream",
+        "categories": "GET /categories"
+    },
+    "docs": "/docs"
+})
+
+_INFO = _StaticJSON({
+    "version": "1.0.0",
+    "service": "CarbonAI Agent API"
+})
+
+# Use a fixed UUID for the assistant
+ASSISTANT_UUID = "fe096781-5601-53d2-b2f6-0d3403f7e9ca"
+
+_ASSISTANT_TEMPLATE = orjson.dumps({
+    "assistant_id": "__ID__",
+    "graph_id": "agent",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "config": {},
+    "metadata": {
+        "name": "CarbonAI Agent",
+        "description": "탄소 배출권 전문 AI 챗봇"
+    }
+})
+# The body is a pure function of the URL's assistant_id, so one ETag (of the
+# template) validates every /assistants/{id} representation
+_ASSISTANT_HEADERS = {
+    "ETag": f'"{hashlib.md5(_ASSISTANT_TEMPLATE).hexdigest()}"',
+    "Cache-Control": "public, max-age=86400, immutable",
+}
+_ASSISTANT_SEARCH_BYTES = (
+    b"[" + _ASSISTANT_TEMPLATE.replace(_ID_PLACEHOLDER, orjson.dumps(ASSISTANT_UUID)) + b"]"
+)
+
+_SCHEMAS = _StaticJSON({
+    "input_schema": {},
+    "output_schema": {},
+    "config_schema": {}
+}, max_age=86400, immutable=True)
+
+_THREAD_STATE_TEMPLATE = orjson.dumps({
+    "values": {},
+    "next": [],
+    "config": {
+        "configurable": {
+            "thread_id": "__ID__"
+        }
+    },
+    "metadata": {},
+    "created_at": "2024-01-01T00:00:00Z",
+    "parent_config": None
+})
+
+# Constant envelope fields; handlers merge in only the per-request keys
+_THREAD_TEMPLATE = {
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+_RUN_RESPONSE_TEMPLATE = {
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "status": "success",
+}
+
+
+
+def _json_bytes_response(body: bytes) -> Response:
+    """Return pre-serialized JSON bytes without re-encoding."""
+    return Response(content=body, media_type="application/json")
+
+
 # Get available categories
 @app.get("/categories")
-async def get_categories():
+async def get_categories(request: Request):
     """Get available conversation categories."""
-    return {
-        "categories": [
-            {
-                "id": "탄소배출권",
-                "name": "탄소배출권",
-                "description": "배출권 거래, 구매, 판매, 관리 전문 상담"
-            },
-            {
-                "id": "규제대응",
-                "name": "규제대응",
-                "description": "탄소 규제, 법규, 보고서, 컴플라이언스 대응"
-            },
-            {
-                "id": "고객상담",
-                "name": "고객상담",
-                "description": "1:1 맞춤 상담, 서비스 안내, 문의사항"
-            }
-        ]
-    }
+    return _CATEGORIES.response(request)
 
 
 # Root endpoint
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint with API information."""
-    return {
-        "service": "CarbonAI Agent API",
-        "version": "1.0.0",
-        "endpoints": {
-            "health_simple": "GET /ok (로드밸런서용)",
-            "health_detailed": "GET /health (상세 상태)",
-            "metrics": "GET /metrics (Prometheus 메트릭)",
-            "invoke": "POST /invoke",
-            "stream": "POST /stream",
-            "categories": "GET /categories"
-        },
-        "docs": "/docs"
-    }
+    return _ROOT.response(request)
 
 
 # ============= LangGraph Cloud API Compatible Endpoints =============
 
 @app.get("/info")
-async def get_info():
+async def get_info(request: Request):
     """Get server information (LangGraph Cloud API compatible)."""
-    return {
-        "version": "1.0.0",
-        "service": "CarbonAI Agent API"
-    }
+    return _INFO.response(request)
 
 
 @app.post("/assistants/search")
 async def search_assistants(request: Request):
     """Search for assistants (LangGraph Cloud API compatible)."""
-    # Use a fixed UUID for the assistant
-    assistant_uuid = "fe096781-5601-53d2-b2f6-0d3403f7e9ca"
-    return [
-        {
-            "assistant_id": assistant_uuid,
-            "graph_id": "agent",
-            "created_at": "2024-01-01T00:00:00Z",
-            "updated_at": "2024-01-01T00:00:00Z",
-            "config": {},
-            "metadata": {
-                "name": "CarbonAI Agent",
-                "description": "탄소 배출권 전문 AI 챗봇"
-            }
-        }
-    ]
+    return _json_bytes_response(_ASSISTANT_SEARCH_BYTES)
 
 
 @app.get("/assistants/{assistant_id}")
-async def get_assistant(assistant_id: str):
+async def get_assistant(assistant_id: str, request: Request):
     """Get assistant by ID (LangGraph Cloud API compatible)."""
+    if request.headers.get("if-none-match") == _ASSISTANT_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_ASSISTANT_HEADERS)
     # Always return the same assistant regardless of ID
-    return {
-        "assistant_id": assistant_id,
-        "graph_id": "agent",
-        "created_at": "2024-01-01T00:00:00Z",
-        "updated_at": "2024-01-01T00:00:00Z",
-        "config": {},
-        "metadata": {
-            "name": "CarbonAI Agent",
-            "description": "탄소 배출권 전문 AI 챗봇"
-        }
-    }
+    return Response(
+        content=_ASSISTANT_TEMPLATE.replace(_ID_PLACEHOLDER, orjson.dumps(assistant_id)),
+        media_type="application/json",
+        headers=_ASSISTANT_HEADERS,
+    )
 
 
 @app.get("/assistants/{assistant_id}/schemas")
-async def get_assistant_schemas(assistant_id: str):
+async def get_assistant_schemas(assistant_id: str, request: Request):
     """Get assistant schemas (LangGraph Cloud API compatible)."""
     # Return empty schemas as we don't use custom input/output schemas
-    return {
-        "input_schema": {},
-        "output_schema": {},
-        "config_schema": {}
-    }
+    return _SCHEMAS.response(request)
 
 
 @app.post("/threads")
 async def create_thread(request: Request):
     """Create a new thread (LangGraph Cloud API compatible)."""
+    # Thread IDs keep the canonical dashed UUID form the LangGraph SDK expects
     thread_id = str(uuid.uuid4())
-    return {
-        "thread_id": thread_id,
-        "created_at": "2024-01-01T00:00:00Z",
-        "updated_at": "2024-01-01T00:00:00Z",
-        "metadata": {}
-    }
+    return {"thread_id": thread_id, **_THREAD_TEMPLATE, "metadata": {}}
 
 
 @app.get("/threads/{thread_id}/state")
 async def get_thread_state(thread_id: str):
     """Get thread state (LangGraph Cloud API compatible)."""
-    return {
-        "values": {},
-        "next": [],
-        "config": {
-            "configurable": {
-                "thread_id": thread_id
-            }
-        },
-        "metadata": {},
-        "created_at": "2024-01-01T00:00:00Z",
-        "parent_config": None
-    }
+    return _json_bytes_response(
+        _THREAD_STATE_TEMPLATE.replace(_ID_PLACEHOLDER, orjson.dumps(thread_id))
+    )
 
 
 @app.post("/threads/search")
 async def search_threads(request: Request):
     """Search for threads (LangGraph Cloud API compatible)."""
     # Return empty list as we don't persist threads
-    return []
+    return _json_bytes_response(b"[]")
+
+
+async def _stream_graph(
+    graph_input: Dict[str, Any], graph_config: Dict[str, Any], thread_id: str
+) -> AsyncIterator[bytes]:
+    """Run the graph and yield LangGraph Cloud SSE frames.
+
+    Emits ``metadata`` first, then hybrid ``messages`` (real-time AI text
+    tokens) and ``values`` (node-level state) frames, then ``end``. Errors
+    propagate so each endpoint can record them before sending _sse_error().
+    """
+    t_total = time.perf_counter()
+    run_id = os.urandom(16).hex()
+    chunk_count = 0
+    values_encoder = _ValuesEncoder()
+
+    # Send metadata event first (required by SDK)
+    yield _SSE_METADATA_TEMPLATE % (run_id.encode(), orjson.dumps(thread_id))
+
+    # HYBRID STREAMING: messages (real-time tokens) + values (node updates)
+    async for event in graph.astream(
+        graph_input,
+        config=graph_config,
+        stream_mode=["messages", "values"]
+    ):
+        chunk_count += 1
+
+        if isinstance(event, tuple) and len(event) == 2:
+            mode, chunk = event
+
+            if mode == "messages":
+                # Extract the raw message for filtering
+                raw_msg = chunk[0] if isinstance(chunk, tuple) and len(chunk) == 2 else chunk
+
+                # Only stream AI text tokens in real-time
+                # Tool calls, MCP results, visualizations → handled by values mode (node-level)
+                if not is_streamable_text_message(raw_msg):
+                    continue
+
+                if isinstance(chunk, tuple) and len(chunk) == 2:
+                    msg, metadata = chunk
+                else:
+                    msg, metadata = chunk, None
+
+                # Single orjson pass: message objects are converted inline by the default hook
+                yield _sse("messages", [msg, metadata or {}])
+
+            elif mode == "values":
+                yield values_encoder.frame(chunk)
+        else:
+            # Fallback for single mode
+            yield values_encoder.frame(event)
+
+    total_elapsed = time.perf_counter() - t_total
+    logger.info("Stream completed", extra={"duration_seconds": round(total_elapsed, 3), "chunk_count": chunk_count})
+    yield _SSE_END_FRAME
+
+
+# Values that cannot change after the snapshot was taken; their fragments are
+# safe to reuse when the same value comes back
+_IMMUTABLE_VALUE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _reuse_token(value: Any) -> Any:
+    """Return a token equal between snapshots only if ``value`` encodes the same.
+
+    Immutable scalars compare by type and value. Anything else returns None
+    and is always re-encoded: a node may mutate a list or dict in place, and
+    ``add_messages`` replaces a message that keeps its id, so neither object
+    identity nor message ids say the content is unchanged.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_VALUE_TYPES:
+        return (value_type, value)
+    return None
+
+
+class _ValuesEncoder:
+    """Encode successive ``values`` snapshots of one run, sharing unchanged keys.
+
+    LangGraph re-emits the full state after every node. Keys whose value is
+    known to be unchanged (see _reuse_token) reuse their JSON fragment
+    rather than being re-walked; mutable values are always re-encoded.
+    """
+
+    __slots__ = ("_fragments",)
+
+    def __init__(self):
+        self._fragments: Dict[str, tuple] = {}
+
+    def frame(self, chunk: Any) -> bytes:
+        """Return the SSE ``values`` frame for a state snapshot."""
+        if type(chunk) is not dict:
+            return _sse("values", serialize_chunk(chunk))
+
+        fragments = self._fragments
+        parts = []
+        for key, value in chunk.items():
+            token = _reuse_token(value)
+            cached = fragments.get(key)
+            if token is not None and cached is not None and cached[0] == token:
+                parts.append(cached[1])
+                continue
+            if type(key) is not str:
+                return _sse("values", serialize_chunk(chunk))
+            fragment = orjson.dumps(key) + b":" + orjson.dumps(
+                value, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+            )
+            fragments[key] = (token, fragment)
+            parts.append(fragment)
+        return b"event: values\ndata: {" + b",".join(parts) + b"}\n\n"
+
+
+def _sse_error(exc: Exception) -> bytes:
+    """Format an exception as an SSE ``error`` frame."""
+    return _sse("error", {"error": str(exc), "message": str(exc)})
 
 
 @app.post("/threads/{thread_id}/runs")
@@ -1100,39 +1452,17 @@ async def create_run(thread_id: str, request: Request):
         stream = body.get("stream", False)
 
         # Prepare user message
-        if messages and len(messages) > 0:
-            content = messages[-1].get("content", "")
-            # content가 리스트 형태인 경우 (LangGraph Cloud 형식)
-            if isinstance(content, list):
-                # [{'type': 'text', 'text': '...'}, ...] 형태에서 텍스트 추출
-                text_parts = []
-                for part in content:
-                    if isinstance(part, dict) and part.get("type") == "text":
-                        text_parts.append(part.get("text", ""))
-                user_message = " ".join(text_parts)
-            else:
-                user_message = str(content)
-        else:
-            user_message = ""
-
-        # 입력 검증
-        is_dangerous, pattern = detect_prompt_injection(user_message)
-        if is_dangerous:
-            logger.warning(f"[보안] 위험한 입력 감지: {pattern}")
+        user_message = _extract_text(messages[-1].get("content", "")) if messages else ""
 
+        # 입력 검증 (인젝션 검사는 sanitize_user_input 안에서 한 번만 수행)
         sanitized_message = sanitize_user_input(user_message)
 
         # Prepare configuration
         # Category can come from either context or config
-        category = context.get("category") or config.get("configurable", {}).get("category")
+        configurable = config.get("configurable", {})
+        category = context.get("category") or configurable.get("category")
 
-        graph_config = {
-            "configurable": {
-                "model": config.get("configurable", {}).get("model", "claude-haiku-4-5"),
-                "category": category,
-                "thread_id": thread_id
-            }
-        }
+        graph_config = _graph_config(configurable.get("model"), category, thread_id)
 
         # Prepare input for graph
         # IMPORTANT: Create HumanMessage object to avoid "complex" serialization
@@ -1145,86 +1475,27 @@ async def create_run(thread_id: str, request: Request):
             # Uses standard SSE format matching LangGraph Cloud protocol
             async def generate():
                 """Generate streaming response in LangGraph Cloud SSE format."""
-                t_total = time.perf_counter()
                 try:
-                    run_id = str(uuid.uuid4())
-
-                    # Send metadata event first
-                    metadata_payload = json.dumps({"run_id": run_id, "thread_id": thread_id}, ensure_ascii=False)
-                    yield f"event: metadata\ndata: {metadata_payload}\n\n"
-
-                    async for event in graph.astream(
-                        graph_input,
-                        config=graph_config,
-                        stream_mode=["messages", "values"]
-                    ):
-                        if isinstance(event, tuple) and len(event) == 2:
-                            mode, chunk = event
-
-                            if mode == "messages":
-                                # Extract the raw message for filtering
-                                raw_msg = chunk[0] if isinstance(chunk, tuple) and len(chunk) == 2 else chunk
-
-                                # Only stream AI text tokens in real-time
-                                # Tool calls, tool results, etc. are handled by values mode
-                                if not is_streamable_text_message(raw_msg):
-                                    continue
-
-                                if isinstance(chunk, tuple) and len(chunk) == 2:
-                                    msg, metadata = chunk
-                                    serialized_msg = serialize_chunk(msg)
-                                    serialized_metadata = serialize_chunk(metadata) if metadata else {}
-                                else:
-                                    serialized_msg = serialize_chunk(chunk)
-                                    serialized_metadata = {}
-
-                                data_json = json.dumps([serialized_msg, serialized_metadata], ensure_ascii=False)
-                                yield f"event: messages\ndata: {data_json}\n\n"
-
-                            elif mode == "values":
-                                serialized_data = serialize_chunk(chunk)
-                                data_json = json.dumps(serialized_data, ensure_ascii=False)
-                                yield f"event: values\ndata: {data_json}\n\n"
-
-                            else:
-                                continue
-                        else:
-                            serialized_chunk = serialize_chunk(event)
-                            data_json = json.dumps(serialized_chunk, ensure_ascii=False)
-                            yield f"event: values\ndata: {data_json}\n\n"
-
-                    total_elapsed = time.perf_counter() - t_total
-                    logger.info(f"⏱️ [전체 요청] {total_elapsed:.2f}초 (thread: {thread_id})")
-                    yield f"event: end\ndata: {{}}\n\n"
-
+                    async for frame in _stream_graph(graph_input, graph_config, thread_id):
+                        yield frame
                 except Exception as e:
-                    import traceback
-                    traceback.print_exc()
-                    error_json = json.dumps({"error": str(e), "message": str(e)})
-                    yield f"event: error\ndata: {error_json}\n\n"
-
-            return StreamingResponse(
-                generate(),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "X-Accel-Buffering": "no",
-                }
-            )
+                    logger.exception(f"Run stream error (thread: {thread_id})")
+                    yield _sse_error(e)
+
+            return _event_stream_response(generate())
         else:
             # Non-streaming response
             result = await graph.ainvoke(graph_input, config=graph_config)
 
-            return {
-                "run_id": str(uuid.uuid4()),
+            # Encoded directly by orjson (messages via the default hook) rather
+            # than FastAPI's recursive jsonable_encoder walk of the full state
+            return _json_bytes_response(orjson.dumps({
+                "run_id": os.urandom(16).hex(),
                 "thread_id": thread_id,
                 "assistant_id": assistant_id,
-                "created_at": "2024-01-01T00:00:00Z",
-                "updated_at": "2024-01-01T00:00:00Z",
-                "status": "success",
+                **_RUN_RESPONSE_TEMPLATE,
                 "values": result
-            }
+            }, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating run: {str(e)}")
@@ -1235,8 +1506,8 @@ async def create_run(thread_id: str, request: Request):
 async def create_run_stream(request: Request, thread_id: str):
     """Create a streaming run in a thread (LangGraph Cloud API compatible)."""
     # Generate request ID for tracing
-    request_id = str(uuid.uuid4())[:8]
-    REQUEST_COUNT.labels(endpoint="/threads/runs/stream", method="POST", status="started").inc()
+    request_id = os.urandom(4).hex()
+    _RUNS_STREAM_COUNT["started"].inc()
 
     try:
         track_thread_activity(thread_id)
@@ -1248,7 +1519,8 @@ async def create_run_stream(request: Request, thread_id: str):
             thread_id=thread_id,
             endpoint="/threads/runs/stream"
         )
-        logger.debug("Stream request body received", extra={"body_keys": list(body.keys())})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Stream request body received", extra={"body_keys": list(body.keys())})
 
         # Extract input from body
         input_data = body.get("input", {})
@@ -1259,31 +1531,15 @@ async def create_run_stream(request: Request, thread_id: str):
         config = body.get("config", {})
 
         # Prepare user message
-        if messages and len(messages) > 0:
-            content = messages[-1].get("content", "")
-            # content가 리스트 형태인 경우 (LangGraph Cloud 형식)
-            if isinstance(content, list):
-                # [{'type': 'text', 'text': '...'}, ...] 형태에서 텍스트 추출
-                text_parts = []
-                for part in content:
-                    if isinstance(part, dict) and part.get("type") == "text":
-                        text_parts.append(part.get("text", ""))
-                user_message = " ".join(text_parts)
-            else:
-                user_message = str(content)
-        else:
-            user_message = ""
-
-        # 입력 검증
-        is_dangerous, pattern = detect_prompt_injection(user_message)
-        if is_dangerous:
-            logger.warning("Dangerous input detected", extra={"pattern": pattern})
+        user_message = _extract_text(messages[-1].get("content", "")) if messages else ""
 
+        # 입력 검증 (인젝션 검사는 sanitize_user_input 안에서 한 번만 수행)
         sanitized_message = sanitize_user_input(user_message)
 
         # Prepare configuration
         # Category can come from either context or config
-        category = context.get("category") or config.get("configurable", {}).get("category")
+        configurable = config.get("configurable", {})
+        category = context.get("category") or configurable.get("category")
 
         # Update log context with category
         set_log_context(category=category or "general")
@@ -1292,13 +1548,7 @@ async def create_run_stream(request: Request, thread_id: str):
         # Track agent usage with category
         AGENT_USAGE.labels(agent_type="langgraph_stream", category=category or "general").inc()
 
-        graph_config = {
-            "configurable": {
-                "model": config.get("configurable", {}).get("model", "claude-haiku-4-5"),
-                "category": category,
-                "thread_id": thread_id
-            }
-        }
+        graph_config = _graph_config(configurable.get("model"), category, thread_id)
 
         # Prepare input for graph
         # IMPORTANT: Create HumanMessage object to avoid "complex" serialization
@@ -1311,67 +1561,12 @@ async def create_run_stream(request: Request, thread_id: str):
         # This matches the LangGraph Cloud protocol expected by @langchain/langgraph-sdk
         async def generate():
             """Generate streaming response with real-time tokens."""
-            import asyncio
             ACTIVE_REQUESTS.inc()
             t_total = time.perf_counter()
             stream_status = "success"
             try:
-                run_id = str(uuid.uuid4())
-                chunk_count = 0
-
-                # Send metadata event first (required by SDK)
-                metadata_payload = json.dumps({"run_id": run_id, "thread_id": thread_id}, ensure_ascii=False)
-                yield f"event: metadata\ndata: {metadata_payload}\n\n"
-
-                # HYBRID STREAMING: messages (real-time tokens) + values (node updates)
-                async for event in graph.astream(
-                    graph_input,
-                    config=graph_config,
-                    stream_mode=["messages", "values"]
-                ):
-                    chunk_count += 1
-
-                    if isinstance(event, tuple) and len(event) == 2:
-                        mode, chunk = event
-
-                        if mode == "messages":
-                            # Extract the raw message for filtering
-                            raw_msg = chunk[0] if isinstance(chunk, tuple) and len(chunk) == 2 else chunk
-
-                            # Only stream AI text tokens in real-time
-                            # Tool calls, MCP results, visualizations → handled by values mode (node-level)
-                            if not is_streamable_text_message(raw_msg):
-                                continue
-
-                            if isinstance(chunk, tuple) and len(chunk) == 2:
-                                msg, metadata = chunk
-                                serialized_msg = serialize_chunk(msg)
-                                serialized_metadata = serialize_chunk(metadata) if metadata else {}
-                            else:
-                                serialized_msg = serialize_chunk(chunk)
-                                serialized_metadata = {}
-
-                            data_json = json.dumps([serialized_msg, serialized_metadata], ensure_ascii=False)
-                            yield f"event: messages\ndata: {data_json}\n\n"
-
-                        elif mode == "values":
-                            serialized_data = serialize_chunk(chunk)
-                            data_json = json.dumps(serialized_data, ensure_ascii=False)
-                            yield f"event: values\ndata: {data_json}\n\n"
-
-                        else:
-                            continue
-                    else:
-                        # Fallback for single mode
-                        serialized_chunk = serialize_chunk(event)
-                        data_json = json.dumps(serialized_chunk, ensure_ascii=False)
-                        yield f"event: values\ndata: {data_json}\n\n"
-
-                # Send end event
-                total_elapsed = time.perf_counter() - t_total
-                logger.info("Stream completed", extra={"duration_seconds": round(total_elapsed, 3), "chunk_count": chunk_count})
-                yield f"event: end\ndata: {{}}\n\n"
-
+                async for frame in _stream_graph(graph_input, graph_config, thread_id):
+                    yield frame
             except asyncio.CancelledError:
                 # Client disconnected - don't yield error event
                 stream_status = "cancelled"
@@ -1379,38 +1574,29 @@ async def create_run_stream(request: Request, thread_id: str):
                 raise
             except Exception as e:
                 stream_status = "error"
-                ERROR_COUNT.labels(error_type=type(e).__name__, endpoint="/threads/runs/stream").inc()
-                logger.error("Streaming error", extra={"error": str(e), "error_type": type(e).__name__})
-                import traceback
-                traceback.print_exc()
-                error_json = json.dumps({"error": str(e), "message": str(e)})
-                yield f"event: error\ndata: {error_json}\n\n"
+                _count_error(e, "/threads/runs/stream")
+                logger.exception("Streaming error", extra={"error": str(e), "error_type": type(e).__name__})
+                yield _sse_error(e)
             finally:
                 ACTIVE_REQUESTS.dec()
-                REQUEST_COUNT.labels(endpoint="/threads/runs/stream", method="POST", status=stream_status).inc()
-                REQUEST_LATENCY.labels(endpoint="/threads/runs/stream").observe(time.perf_counter() - t_total)
+                _RUNS_STREAM_COUNT[stream_status].inc()
+                _RUNS_STREAM_LATENCY.observe(time.perf_counter() - t_total)
                 clear_log_context()
 
-        return StreamingResponse(
-            generate(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",  # Disable Nginx buffering for streaming
-            }
-        )
+        return _event_stream_response(generate())
 
     except Exception as e:
-        ERROR_COUNT.labels(error_type=type(e).__name__, endpoint="/threads/runs/stream").inc()
-        REQUEST_COUNT.labels(endpoint="/threads/runs/stream", method="POST", status="error").inc()
-        logger.error("Stream request failed", extra={"error": str(e), "error_type": type(e).__name__})
-        import traceback
-        traceback.print_exc()
+        _count_error(e, "/threads/runs/stream")
+        _RUNS_STREAM_COUNT["error"].inc()
+        logger.exception("Stream request failed", extra={"error": str(e), "error_type": type(e).__name__})
         clear_log_context()
         raise HTTPException(status_code=500, detail=f"Error creating streaming run: {str(e)}")
 
 
+# Rendered thread history keyed by "thread_id:checkpoint_id"
+_HISTORY_CACHE = LRUCache(max_size=1024)
+
+
 @app.post("/threads/{thread_id}/history")
 @app.get("/threads/{thread_id}/history")
 async def get_thread_history(thread_id: str, request: Request):
@@ -1425,29 +1611,41 @@ async def get_thread_history(thread_id: str, request: Request):
         if not state or not state.values:
             return []
 
+        # History only changes when the checkpoint advances, so repeat polls
+        # of the same checkpoint are served from the rendered bytes
+        checkpoint_id = (state.config or {}).get("configurable", {}).get("checkpoint_id")
+        cache_key = f"{thread_id}:{checkpoint_id}" if checkpoint_id else None
+        if cache_key:
+            cached = _HISTORY_CACHE.get(cache_key)
+            if cached is not None:
+                return _json_bytes_response(cached[0])
+
         # Extract messages from state
         messages = state.values.get("messages", [])
 
-        # Convert messages to serializable format
-        serialized_messages = [message_to_dict(msg) for msg in messages]
-
         # Return as array of StateSnapshot objects (LangGraph SDK format)
         # SDK expects: [{ values: {...}, next: [...], config: {...}, ... }, ...]
-        return [
+        # Message objects are converted by the default hook as orjson reaches
+        # them, so no intermediate list of dicts is built
+        body = orjson.dumps([
             {
-                "values": {"messages": serialized_messages},
+                "values": {"messages": messages},
                 "next": [],
                 "config": config,
                 "metadata": {},
                 "created_at": None,
                 "parent_config": None,
             }
-        ]
+        ], default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+        if cache_key:
+            # Entries are keyed by checkpoint, so they never go stale; LRU bounds memory
+            _HISTORY_CACHE.set(cache_key, body, datetime.max)
+
+        return _json_bytes_response(body)
 
     except Exception as e:
-        print(f"[HISTORY ERROR] {type(e).__name__}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[HISTORY ERROR] {type(e).__name__}: {e}")
         return []
 
 
@@ -1603,7 +1801,12 @@ async def rebuild_vectordb():
 
 # Run server
 if __name__ == "__main__":
+    import importlib.util
+
     port = int(os.environ.get("PORT", 7860))  # Hugging Face Spaces default
+    # Worker processes sidestep the GIL for serialization-heavy load; keep 1
+    # unless the Postgres checkpointer is configured (MemorySaver is per-process)
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
     uvicorn.run(
         "react_agent.server:app",
         host="0.0.0.0",
@@ -1612,4 +1815,8 @@ if __name__ == "__main__":
         log_level="info",
         timeout_keep_alive=75,  # Keep connection alive for 75 seconds
         timeout_graceful_shutdown=30,  # Wait 30s for graceful shutdown
+        # libuv event loop / C HTTP parser (fall back where unavailable, e.g. Windows)
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        workers=workers,
     )
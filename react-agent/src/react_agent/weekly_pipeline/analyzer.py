@@ -5,14 +5,19 @@ extracting summaries, key findings, and implications from preprocessed content.
 """
 
 import asyncio
+import random
 import re
+import string
 from dataclasses import dataclass, field
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
+import anthropic
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from react_agent.agents.expert_panel.config import EXPERT_REGISTRY, ExpertRole
+from react_agent.cache_manager import LRUCache
 
 from .classifier import ClassificationResult
 from .preprocessor import PreprocessedContent
@@ -43,19 +48,16 @@ class AnalysisResult:
     error: Optional[str] = None
 
 
-ANALYSIS_PROMPT = """당신은 {expert_name}입니다.
+# Static per-expert prefix: identical for every content an expert analyzes,
+# so it is sent as a prompt-cached system block (see ExpertAnalyzer.analyze)
+ANALYSIS_SYSTEM_PROMPT = """당신은 탄소시장 및 기후변화 분야의 전문가입니다. 주어진 콘텐츠를 분석하여 요약, 주요 발견, 시사점을 추출합니다.
+
+당신은 {expert_name}입니다.
 
 {expert_persona}
 
 다음 콘텐츠를 분석하여 요약, 주요 발견, 시사점을 추출해주세요.
 
-## 분석 대상 콘텐츠
-
-제목: {title}
-출처: {source}
-내용:
-{content}
-
 ## 응답 형식
 
 반드시 다음 형식으로 응답해주세요:
@@ -75,6 +77,109 @@ ANALYSIS_PROMPT = """당신은 {expert_name}입니다.
 분석 시 당신의 전문 분야({expertise_areas})에 초점을 맞추어 분석해주세요.
 """
 
+# Per-content suffix
+ANALYSIS_CONTENT_PROMPT = """## 분석 대상 콘텐츠
+
+제목: {title}
+출처: {source}
+내용:
+{content}
+"""
+
+# Full prompt template (system prefix followed by content)
+ANALYSIS_PROMPT = ANALYSIS_SYSTEM_PROMPT + "\n" + ANALYSIS_CONTENT_PROMPT
+
+# Literal text around the {title}, {source} and {content} placeholders of
+# ANALYSIS_CONTENT_PROMPT, so the per-call prompt is a join, not a format()
+_CONTENT_FRAGMENTS = tuple(
+    literal for literal, _, _, _ in string.Formatter().parse(ANALYSIS_CONTENT_PROMPT)
+)
+
+
+# "## <name>" section headers of an analysis response; models sometimes use
+# "###" or deeper, so every leading "#" is left out of the name
+_SECTION_HEADER = re.compile(r"^#{2,}\s*(.+?)\s*$", re.MULTILINE)
+
+
+def _render_content_prompt(title: str, source: str, content: str) -> str:
+    """Render ANALYSIS_CONTENT_PROMPT from its pre-split fragments."""
+    head, after_title, after_source, tail = _CONTENT_FRAGMENTS
+    return "".join((head, title, after_title, source, after_source, content, tail))
+
+
+def _truncate_content(content: str, max_chars: int) -> str:
+    """Cut content to max_chars, backing off to the last paragraph break."""
+    if len(content) <= max_chars:
+        return content
+    head = content[:max_chars].rsplit("\n\n", 1)[0]
+    return head + "\n\n[...이하 생략...]"
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Return the text of a streamed message chunk (str or content blocks)."""
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") for block in content if isinstance(block, dict)
+    )
+
+
+class _SectionStreamParser:
+    """Incremental counterpart of ExpertAnalyzer._parse_sections.
+
+    Chunks are split into lines as they arrive; each complete line is either
+    a ``##`` header, which opens a new section, or body text appended to the
+    open section. Headers split across chunk boundaries are handled because
+    only complete lines are inspected. The first occurrence of a header name
+    wins, as in the batch parser.
+    """
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._pending = ""
+        self._sections: Dict[str, List[str]] = {}
+        self._current: Optional[List[str]] = None
+
+    def feed(self, chunk: str) -> None:
+        """Consume the complete lines of a chunk, keeping the partial tail."""
+        self._parts.append(chunk)
+        lines = (self._pending + chunk).split("\n")
+        self._pending = lines.pop()
+        for line in lines:
+            self._consume(line)
+
+    def _consume(self, line: str) -> None:
+        header = _SECTION_HEADER.match(line)
+        if header:
+            name = header.group(1)
+            if name in self._sections:
+                # Body of a repeated header is dropped; the first occurrence wins
+                self._current = None
+            else:
+                self._current = self._sections[name] = []
+        elif self._current is not None:
+            self._current.append(line)
+
+    def close(self) -> Tuple[str, Dict[str, str]]:
+        """Flush the last line and return (full text, sections)."""
+        if self._pending:
+            self._consume(self._pending)
+            self._pending = ""
+        sections = {
+            name: "\n".join(lines).strip() for name, lines in self._sections.items()
+        }
+        return "".join(self._parts), sections
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Return True for transient Anthropic errors (429, 5xx/overloaded, connection)."""
+    if isinstance(error, (anthropic.RateLimitError, anthropic.APIConnectionError)):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code >= 500
+    return False
+
 
 class ExpertAnalyzer:
     """Expert analyzer for parallel content analysis.
@@ -83,65 +188,133 @@ class ExpertAnalyzer:
     extracting summaries, key findings, and implications.
 
     Attributes:
+        FAST_MIN_CONFIDENCE: Classifier confidence required for the fast model.
+        FAST_MAX_CONTENT_CHARS: Longest content routed to the fast model.
         model_name: Name of the LLM model to use.
         llm: LangChain ChatAnthropic instance.
+        fast_model_name: Name of the cheaper model for easy contents.
+        llm_fast: LangChain ChatAnthropic instance for the fast model.
+        max_concurrency: Maximum number of in-flight LLM calls.
+        batch_size: Number of contents dispatched per analyze_batch chunk.
+        retry_attempts: Attempts per LLM call for transient API errors.
+        cache_size: Maximum number of successful results kept in memory.
+        max_content_chars: Longest content body sent to the LLM.
     """
 
-    def __init__(self, model: str = "claude-sonnet-4-20250514") -> None:
+    FAST_MIN_CONFIDENCE = 0.6
+    FAST_MAX_CONTENT_CHARS = 3000
+
+    def __init__(
+        self,
+        model: str = "claude-sonnet-4-20250514",
+        fast_model: str = "claude-haiku-4-5",
+        max_concurrency: int = 8,
+        batch_size: int = 50,
+        retry_attempts: int = 3,
+        cache_size: int = 1024,
+        max_content_chars: int = 8000,
+    ) -> None:
         """Initialize the ExpertAnalyzer.
 
         Args:
             model: Name of the Anthropic model to use for analysis.
+            fast_model: Cheaper model for short contents with a confident,
+                single-expert classification.
+            max_concurrency: Maximum number of concurrent LLM calls, kept
+                below the API rate limit to avoid 429 backoff stalls.
+            batch_size: Contents per analyze_batch chunk; chunks run
+                sequentially to bound the number of pending coroutines.
+            retry_attempts: Attempts per LLM call; rate-limit, connection and
+                5xx/overloaded errors are retried with exponential backoff.
+            cache_size: Successful results kept per (expert, content hash), so
+                re-runs and repeated contents skip the LLM call.
+            max_content_chars: Content bodies longer than this are cut at a
+                paragraph boundary; the analytic signal of an article is
+                mostly in its opening, and input tokens drive cost/latency.
         """
         self.model_name = model
         self.llm = ChatAnthropic(model=model, temperature=0.3)
+        self.fast_model_name = fast_model
+        self.llm_fast = ChatAnthropic(model=fast_model, temperature=0.3)
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.retry_attempts = max(1, retry_attempts)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.cache_size = cache_size
+        self._result_cache = LRUCache(max_size=cache_size)
+        self.max_content_chars = max_content_chars
+
+        # Pre-format each expert's static prefix once. The cache_control marker
+        # only takes effect once a prefix reaches the model's minimum cacheable
+        # length (1024 tokens on Sonnet, more on Haiku); today's prompts are
+        # ~830-930 characters, below that, so the API ignores it without error
+        self._system_blocks: Dict[ExpertRole, List[Dict[str, Any]]] = {
+            role: [
+                {
+                    "type": "text",
+                    "text": ANALYSIS_SYSTEM_PROMPT.format(
+                        expert_name=config.name,
+                        expert_persona=config.persona,
+                        expertise_areas=", ".join(config.expertise),
+                    ),
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+            for role, config in EXPERT_REGISTRY.items()
+        }
 
     async def analyze(
         self,
         content: PreprocessedContent,
         expert_role: ExpertRole,
+        classification: Optional[ClassificationResult] = None,
     ) -> AnalysisResult:
         """Analyze content from the perspective of a specific expert.
 
         Args:
             content: Preprocessed content to analyze.
             expert_role: The expert role to use for analysis.
+            classification: Classifier output for the content; easy contents
+                are routed to the fast model (see _select_llm).
 
         Returns:
             AnalysisResult containing the analysis output.
         """
-        try:
-            # Get expert configuration
-            expert_config = EXPERT_REGISTRY[expert_role]
-
-            # Build the prompt
-            prompt = ANALYSIS_PROMPT.format(
-                expert_name=expert_config.name,
-                expert_persona=expert_config.persona,
-                title=content.clean_title,
-                source=content.original.source,
-                content=content.clean_content,
-                expertise_areas=", ".join(expert_config.expertise),
-            )
+        cache_key = f"{expert_role.value}:{content.content_hash}"
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached[0]
 
-            # Create messages
+        try:
+            # Create messages: cached expert prefix first, per-content part last
             messages = [
-                SystemMessage(
-                    content="당신은 탄소시장 및 기후변화 분야의 전문가입니다. 주어진 콘텐츠를 분석하여 요약, 주요 발견, 시사점을 추출합니다."
+                SystemMessage(content=self._system_blocks[expert_role]),
+                HumanMessage(
+                    content=_render_content_prompt(
+                        content.clean_title,
+                        content.original.source,
+                        _truncate_content(content.clean_content, self.max_content_chars),
+                    )
                 ),
-                HumanMessage(content=prompt),
             ]
 
-            # Call LLM
-            response = await self.llm.ainvoke(messages)
-            response_text = response.content
+            # Call LLM; sections are parsed while the response streams in
+            llm = self._select_llm(content, classification)
+            async with self._semaphore:
+                response_text, sections = await self._stream_with_retry(llm, messages)
 
             # Parse the response
-            return self._parse_analysis(
+            result = self._parse_analysis(
                 response=response_text,
                 expert_role=expert_role,
                 content=content,
+                sections=sections,
             )
+            # An empty or unparseable response is worth retrying, so only
+            # results with content are cached
+            if result.summary or result.key_findings or result.confidence > 0:
+                self._result_cache.set(cache_key, result, datetime.max)
+            return result
 
         except Exception as e:
             # Return error result
@@ -156,6 +329,55 @@ class ExpertAnalyzer:
                 error=f"분석 오류: {str(e)}",
             )
 
+    def _select_llm(
+        self,
+        content: PreprocessedContent,
+        classification: Optional[ClassificationResult],
+    ) -> ChatAnthropic:
+        """Pick the fast model for short, confidently single-expert contents.
+
+        Contents without a classification, flagged for an expert meeting,
+        classified with low confidence or longer than FAST_MAX_CONTENT_CHARS
+        go to the main model.
+        """
+        if (
+            classification is not None
+            and not classification.needs_llm_meeting
+            and classification.confidence >= self.FAST_MIN_CONFIDENCE
+            and len(content.clean_content) < self.FAST_MAX_CONTENT_CHARS
+        ):
+            return self.llm_fast
+        return self.llm
+
+    async def _stream_with_retry(
+        self, llm: ChatAnthropic, messages: List[Any]
+    ) -> Tuple[str, Dict[str, str]]:
+        """Stream the LLM response, retrying transient API errors with backoff.
+
+        Tokens are fed to a _SectionStreamParser as they arrive, so section
+        parsing overlaps with generation. A failed attempt discards its
+        partial output and restarts the stream.
+
+        The backoff sleep happens while the concurrency slot is held, so a
+        rate-limited batch slows down as a whole instead of re-flooding the API.
+
+        Returns:
+            Tuple of (full response text, sections keyed by header).
+        """
+        for attempt in range(self.retry_attempts):
+            parser = _SectionStreamParser()
+            try:
+                async for chunk in llm.astream(messages):
+                    parser.feed(_chunk_text(chunk))
+                return parser.close()
+            except Exception as e:
+                if attempt == self.retry_attempts - 1 or not _is_retryable(e):
+                    raise
+                await asyncio.sleep(min(2**attempt + random.random(), 30))
+
+        # Only reached without a single attempt
+        raise ValueError(f"retry_attempts must be at least 1, got {self.retry_attempts}")
+
     async def analyze_batch(
         self,
         contents: List[PreprocessedContent],
@@ -163,7 +385,8 @@ class ExpertAnalyzer:
     ) -> List[AnalysisResult]:
         """Analyze multiple contents in parallel.
 
-        Each content is analyzed by the expert assigned in its classification.
+        Each content is analyzed by the expert assigned in its classification,
+        which also decides whether the fast model is used.
 
         Args:
             contents: List of preprocessed contents to analyze.
@@ -175,17 +398,53 @@ class ExpertAnalyzer:
         if not contents or not classifications:
             return []
 
-        # Create analysis tasks
-        tasks = []
-        for content, classification in zip(contents, classifications):
-            task = self.analyze(
-                content=content,
-                expert_role=classification.primary_expert,
+        count = min(len(contents), len(classifications))
+        results: List[Any] = [None] * count
+
+        async def run_bucket(
+            expert_role: ExpertRole, groups: List[List[int]]
+        ) -> None:
+            # Each group shares a content hash: analyze its first content once
+            # and fan the result out to every slot of the group
+            def analyze_group(group: List[int]) -> Any:
+                i = group[0]
+                return self.analyze(contents[i], expert_role, classifications[i])
+
+            def scatter(group: List[int], outcome: Any) -> None:
+                for i in group:
+                    results[i] = outcome
+
+            # First request writes the cache before the rest fan out
+            first, rest = groups[0], groups[1:]
+            try:
+                scatter(first, await analyze_group(first))
+            except Exception as e:
+                scatter(first, e)
+            if rest:
+                outcomes = await asyncio.gather(
+                    *(analyze_group(group) for group in rest),
+                    return_exceptions=True,
+                )
+                for group, outcome in zip(rest, outcomes):
+                    scatter(group, outcome)
+
+        for start in range(0, count, self.batch_size):
+            # Bucket by expert so each expert's cached prompt prefix is written
+            # by one request and read by the rest, instead of interleaving roles.
+            # Within a bucket, repeated contents (same article from several
+            # feeds) are grouped by hash so they cost a single call.
+            buckets: Dict[ExpertRole, Dict[str, List[int]]] = {}
+            for i in range(start, min(start + self.batch_size, count)):
+                bucket = buckets.setdefault(classifications[i].primary_expert, {})
+                bucket.setdefault(contents[i].content_hash, []).append(i)
+
+            # Buckets use different prefixes, so they run concurrently
+            await asyncio.gather(
+                *(
+                    run_bucket(role, list(groups.values()))
+                    for role, groups in buckets.items()
+                )
             )
-            tasks.append(task)
-
-        # Execute all tasks in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Convert exceptions to error results
         final_results = []
@@ -212,6 +471,7 @@ class ExpertAnalyzer:
         response: str,
         expert_role: ExpertRole,
         content: PreprocessedContent,
+        sections: Optional[Dict[str, str]] = None,
     ) -> AnalysisResult:
         """Parse LLM response into AnalysisResult.
 
@@ -219,6 +479,8 @@ class ExpertAnalyzer:
             response: Raw LLM response text.
             expert_role: The expert role that performed the analysis.
             content: The original preprocessed content.
+            sections: Sections already parsed while streaming; parsed from
+                ``response`` when omitted.
 
         Returns:
             Parsed AnalysisResult.
@@ -234,14 +496,18 @@ class ExpertAnalyzer:
                 raw_response=response,
             )
 
+        # Split the response into sections in a single pass
+        if sections is None:
+            sections = self._parse_sections(response)
+
         # Extract summary
-        summary = self._extract_section(response, "요약")
+        summary = sections.get("요약", "")
 
         # Extract key findings
-        key_findings = self._extract_list_section(response, "주요 발견")
+        key_findings = self._parse_list_items(sections.get("주요 발견", ""))
 
         # Extract implications
-        implications = self._extract_list_section(response, "시사점")
+        implications = self._parse_list_items(sections.get("시사점", ""))
 
         # Calculate confidence based on completeness
         confidence = self._calculate_confidence(summary, key_findings, implications)
@@ -256,6 +522,47 @@ class ExpertAnalyzer:
             raw_response=response,
         )
 
+    @staticmethod
+    def _parse_sections(text: str) -> Dict[str, str]:
+        """Split a response into sections keyed by their ``##`` header.
+
+        Each section runs from the end of its header line to the start of the
+        next header. The first occurrence of a header name wins.
+
+        Args:
+            text: Full response text.
+
+        Returns:
+            Mapping of section name to stripped section text.
+        """
+        sections: Dict[str, str] = {}
+        headers = list(_SECTION_HEADER.finditer(text))
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+            sections.setdefault(header.group(1), text[header.end():end].strip())
+        return sections
+
+    @staticmethod
+    def _parse_list_items(section_text: str) -> List[str]:
+        """Extract list items (lines starting with - or *) from a section.
+
+        Args:
+            section_text: Text of a single section.
+
+        Returns:
+            List of items from the section.
+        """
+        items = []
+        for line in section_text.splitlines():
+            # Only leading whitespace matters for the marker; items are stripped below
+            line = line.lstrip()
+            if line.startswith(("-", "*")):
+                item = line.lstrip("-*").strip()
+                if item:
+                    items.append(item)
+
+        return items
+
     def _extract_section(self, text: str, section_name: str) -> str:
         """Extract a text section from the response.
 
@@ -266,14 +573,7 @@ class ExpertAnalyzer:
         Returns:
             Extracted section text or empty string.
         """
-        # Pattern to match section header and content until next section or end
-        pattern = rf"##\s*{section_name}\s*\n(.*?)(?=\n##|$)"
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-
-        if match:
-            return match.group(1).strip()
-
-        return ""
+        return self._parse_sections(text).get(section_name, "")
 
     def _extract_list_section(self, text: str, section_name: str) -> List[str]:
         """Extract a list section from the response.
@@ -285,21 +585,7 @@ class ExpertAnalyzer:
         Returns:
             List of items from the section.
         """
-        section_text = self._extract_section(text, section_name)
-
-        if not section_text:
-            return []
-
-        # Extract list items (lines starting with - or *)
-        items = []
-        for line in section_text.split("\n"):
-            line = line.strip()
-            if line.startswith("-") or line.startswith("*"):
-                item = line.lstrip("-*").strip()
-                if item:
-                    items.append(item)
-
-        return items
+        return self._parse_list_items(self._extract_section(text, section_name))
 
     def _calculate_confidence(
         self,
@@ -317,29 +603,16 @@ class ExpertAnalyzer:
         Returns:
             Confidence score between 0.0 and 1.0.
         """
-        score = 0.0
-
-        # Summary contributes 40%
-        if summary:
-            score += 0.4
-            # Bonus for longer summaries
-            if len(summary) > 50:
-                score += 0.1
-
-        # Key findings contribute 30%
-        if key_findings:
-            # Base score for having findings
-            score += 0.15
-            # Bonus for multiple findings (up to 0.15)
-            findings_bonus = min(len(key_findings) / 3, 1.0) * 0.15
-            score += findings_bonus
-
-        # Implications contribute 20%
-        if implications:
-            # Base score for having implications
-            score += 0.1
-            # Bonus for multiple implications (up to 0.1)
-            implications_bonus = min(len(implications) / 2, 1.0) * 0.1
-            score += implications_bonus
-
+        # Summary: 40% for presence, +10% if longer than 50 chars.
+        # Key findings: 15% for presence, up to +15% for three or more.
+        # Implications: 10% for presence, up to +10% for two or more.
+        # Empty lists contribute 0 to both terms, so no branches are needed.
+        score = (
+            0.4 * bool(summary)
+            + 0.1 * (len(summary) > 50)
+            + 0.15 * bool(key_findings)
+            + 0.15 * min(len(key_findings) / 3, 1.0)
+            + 0.1 * bool(implications)
+            + 0.1 * min(len(implications) / 2, 1.0)
+        )
         return min(score, 1.0)
@@ -4,14 +4,52 @@ This module provides a keyword-matching based classifier that assigns
 content to appropriate domain experts based on keyword relevance.
 """
 
+import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from heapq import nlargest
+from operator import itemgetter
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 from react_agent.agents.expert_panel.config import (
     ExpertRole,
     get_expert_keywords,
 )
 
+# Optional: Aho-Corasick automaton matches all expert keywords in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# ASCII keywords such as "NDC" or "CBAM" are matched as whole tokens, which
+# also stops "cop" from matching inside "scope". Korean keywords keep
+# substring matching because particles attach directly to the noun.
+_ASCII_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _is_token_keyword(keyword_lower: str) -> bool:
+    """Return True if the keyword is a single ASCII alphanumeric token."""
+    return _ASCII_TOKEN.fullmatch(keyword_lower) is not None
+
+
+def _text_tokens(text_lower: str) -> Set[str]:
+    """Return the ASCII tokens of the text, plus their singular and stem forms.
+
+    Acronyms are often pluralised ("NDCs", "EUAs", "CERs") or numbered
+    ("COP28", "Scope1"); a token ending in "s" also yields itself without
+    the "s", and one ending in digits yields itself without them.
+    """
+    tokens = set(_ASCII_TOKEN.findall(text_lower))
+    variants = [token[:-1] for token in tokens if len(token) > 2 and token[-1] == "s"]
+    for token in tokens:
+        if token[-1].isdigit():
+            stem = token.rstrip("0123456789")
+            if stem:
+                variants.append(stem)
+    tokens.update(variants)
+    return tokens
+
 
 @dataclass
 class ClassificationResult:
@@ -49,15 +87,62 @@ class RuleBasedClassifier:
     Attributes:
         LOW_CONFIDENCE_THRESHOLD: Minimum confidence to avoid LLM meeting.
         MULTI_EXPERT_THRESHOLD: Number of relevant experts triggering LLM meeting.
+        DEFAULT_EXPERT: Expert assigned when no keyword matches.
         expert_keywords: Mapping of expert roles to their keywords.
     """
 
     LOW_CONFIDENCE_THRESHOLD = 0.3
     MULTI_EXPERT_THRESHOLD = 3
+    DEFAULT_EXPERT = ExpertRole.POLICY_EXPERT
 
     def __init__(self) -> None:
         """Initialize the classifier with expert keywords."""
         self.expert_keywords: Dict[ExpertRole, List[str]] = get_expert_keywords()
+        # Keywords are fixed after init: lowercase them once, not per document
+        self._expert_keywords_lower: Dict[ExpertRole, List[Tuple[str, str, bool]]] = {
+            role: [
+                (keyword.lower(), keyword, _is_token_keyword(keyword.lower()))
+                for keyword in keywords
+            ]
+            for role, keywords in self.expert_keywords.items()
+        }
+        self._token_keywords: Dict[ExpertRole, FrozenSet[str]] = {
+            role: frozenset(kw_lower for kw_lower, _, is_token in entries if is_token)
+            for role, entries in self._expert_keywords_lower.items()
+        }
+        self._keyword_counts: Dict[ExpertRole, int] = {
+            role: len(keywords) for role, keywords in self.expert_keywords.items()
+        }
+        self._automaton = self._build_automaton() if AHOCORASICK_AVAILABLE else None
+        self._default_reason = self._generate_reason(self.DEFAULT_EXPERT, [])
+
+    def _build_automaton(self) -> "ahocorasick.Automaton":
+        """Build one automaton over the substring-matched keywords (lowercased).
+
+        Single-token ASCII keywords are left out; they are looked up in the
+        text's token set instead. Each word maps to the (role, original
+        keyword) pairs that share it, since the same keyword can belong to
+        several experts.
+        """
+        owners: Dict[str, List[Tuple[ExpertRole, str]]] = {}
+        for role, entries in self._expert_keywords_lower.items():
+            for keyword_lower, keyword, is_token in entries:
+                if keyword_lower and not is_token:
+                    owners.setdefault(keyword_lower, []).append((role, keyword))
+
+        automaton = ahocorasick.Automaton()
+        for keyword_lower, entries in owners.items():
+            automaton.add_word(keyword_lower, entries)
+        automaton.make_automaton()
+        return automaton
+
+    def _find_keywords(self, text_lower: str) -> Dict[ExpertRole, Set[str]]:
+        """Scan the text once and collect matched keywords per expert."""
+        found: Dict[ExpertRole, Set[str]] = {}
+        for _, entries in self._automaton.iter(text_lower):
+            for role, keyword in entries:
+                found.setdefault(role, set()).add(keyword)
+        return found
 
     def classify(self, text: str) -> ClassificationResult:
         """Classify text and assign to appropriate expert.
@@ -72,39 +157,60 @@ class RuleBasedClassifier:
         all_scores: Dict[ExpertRole, float] = {}
         matched_keywords: Dict[ExpertRole, List[str]] = {}
 
-        for role, keywords in self.expert_keywords.items():
-            score, matched = self._calculate_score(text, keywords)
-            all_scores[role] = score
+        # Lowercase and tokenize once rather than once per expert
+        text_lower = text.lower()
+        text_tokens = _text_tokens(text_lower)
+        found = self._find_keywords(text_lower) if self._automaton is not None else None
+        for role, entries in self._expert_keywords_lower.items():
+            token_hits = self._token_keywords[role] & text_tokens
+            if found is not None:
+                # Single pass over the text; matched lists keep keyword order
+                hits = found.get(role, ())
+                matched = [
+                    kw for kw_lower, kw, is_token in entries
+                    if (kw_lower in token_hits if is_token else kw in hits)
+                ]
+            else:
+                matched = [
+                    kw for kw_lower, kw, is_token in entries
+                    if (kw_lower in token_hits if is_token else kw_lower in text_lower)
+                ]
+            count = self._keyword_counts[role]
+            all_scores[role] = len(matched) / count if count else 0.0
             if matched:
                 matched_keywords[role] = matched
 
-        # Sort experts by score
-        sorted_experts = sorted(
-            all_scores.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )
+        # Off-topic content: nothing to rank, always low confidence
+        if not matched_keywords:
+            return ClassificationResult(
+                primary_expert=self.DEFAULT_EXPERT,
+                primary_score=0.0,
+                all_scores=all_scores,
+                confidence=0.0,
+                needs_llm_meeting=True,
+                reason=self._default_reason,
+            )
+
+        # Top two experts by score (ties keep registry order, like sorted())
+        top_experts = nlargest(2, all_scores.items(), key=itemgetter(1))
 
         # Get primary expert
-        primary_expert, primary_score = sorted_experts[0]
+        primary_expert, primary_score = top_experts[0]
 
         # Get secondary expert if applicable
         secondary_expert: Optional[ExpertRole] = None
         secondary_score = 0.0
-        if len(sorted_experts) > 1 and sorted_experts[1][1] > 0:
-            secondary_expert, secondary_score = sorted_experts[1]
+        if len(top_experts) > 1 and top_experts[1][1] > 0:
+            secondary_expert, secondary_score = top_experts[1]
 
         # Calculate confidence
+        # (a keyword matched, so primary_score > 0 here)
         total_keywords = sum(len(kw) for kw in matched_keywords.values())
-        max_possible = len(text.split())  # Rough estimate
-        if max_possible > 0 and primary_score > 0:
-            # Confidence based on primary score relative to others
-            confidence = primary_score / max(1.0, sum(all_scores.values()))
-            # Boost confidence if many keywords matched
-            if total_keywords >= 3:
-                confidence = min(1.0, confidence * 1.2)
-        else:
-            confidence = 0.0
+        # Confidence based on primary score relative to others
+        confidence = primary_score / max(1.0, sum(all_scores.values()))
+        # Boost confidence if many keywords matched
+        if total_keywords >= 3:
+            confidence = min(1.0, confidence * 1.2)
 
         # Determine if LLM meeting is needed
         needs_llm = self._needs_llm_meeting(all_scores, confidence, matched_keywords)
@@ -128,21 +234,32 @@ class RuleBasedClassifier:
         self,
         text: str,
         keywords: List[str],
+        text_lower: Optional[str] = None,
+        text_tokens: Optional[Set[str]] = None,
     ) -> Tuple[float, List[str]]:
         """Calculate relevance score based on keyword matching.
 
         Args:
             text: The text to analyze.
             keywords: List of keywords to match against.
+            text_lower: Pre-lowercased ``text``, shared across experts by classify().
+            text_tokens: ASCII tokens of ``text_lower`` for single-token keywords.
 
         Returns:
             Tuple of (score, list of matched keywords).
         """
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
+        if text_tokens is None:
+            text_tokens = _text_tokens(text_lower)
         matched: List[str] = []
 
         for keyword in keywords:
-            if keyword.lower() in text_lower:
+            keyword_lower = keyword.lower()
+            if _is_token_keyword(keyword_lower):
+                if keyword_lower in text_tokens:
+                    matched.append(keyword)
+            elif keyword_lower in text_lower:
                 matched.append(keyword)
 
         # Score is the proportion of keywords matched
@@ -221,10 +338,15 @@ class RuleBasedClassifier:
     def classify_batch(self, texts: List[str]) -> List[ClassificationResult]:
         """Classify multiple texts in batch.
 
+        Keyword tables and the automaton are built once in __init__ and
+        shared by every text. Texts are scanned serially: the automaton's
+        iterator holds the GIL, so a thread pool measured no faster.
+
         Args:
             texts: List of content texts to classify.
 
         Returns:
             List of ClassificationResult for each text.
         """
-        return [self.classify(text) for text in texts]
+        classify = self.classify
+        return [classify(text) for text in texts]
@@ -4,23 +4,33 @@ This module provides functionality to generate and register dynamic expert
 configurations from NewExpertProposal objects created during LLM expert meetings.
 """
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from react_agent.agents.expert_panel.config import ExpertConfig, ExpertRole
 from .expert_meeting import NewExpertProposal
 
+# Optional: Aho-Corasick automaton matches all domain keywords in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 # Module-level storage for dynamic experts
 _DYNAMIC_EXPERTS: Dict[str, ExpertConfig] = {}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DynamicExpertRole:
     """Dynamic expert role that can be created at runtime.
 
     Unlike ExpertRole enum which has fixed values, DynamicExpertRole
-    allows creating new role identifiers dynamically.
+    allows creating new role identifiers dynamically. Instances are
+    immutable and compare and hash by value, so they can be used in
+    sets and as dict keys.
 
     Attributes:
         value: The string identifier for this role.
@@ -32,16 +42,6 @@ class DynamicExpertRole:
         """Return the role value as string."""
         return self.value
 
-    def __hash__(self) -> int:
-        """Make DynamicExpertRole hashable for use in sets/dicts."""
-        return hash(self.value)
-
-    def __eq__(self, other: object) -> bool:
-        """Compare DynamicExpertRole instances by value."""
-        if isinstance(other, DynamicExpertRole):
-            return self.value == other.value
-        return False
-
 
 class ExpertGenerator:
     """Generator for creating ExpertConfig from NewExpertProposal.
@@ -130,12 +130,30 @@ class ExpertGenerator:
         # Join expertise into searchable text
         expertise_text = " ".join(expertise).lower()
 
-        # Count matches for each domain
-        domain_scores: Dict[str, int] = {}
-        for domain, keywords in self._DOMAIN_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw.lower() in expertise_text)
-            if score > 0:
-                domain_scores[domain] = score
+        # Count distinct matched keywords for each domain
+        if _DOMAIN_AUTOMATON is not None:
+            matched: Set[Tuple[str, str]] = set()
+            for _, owners in _DOMAIN_AUTOMATON.iter(expertise_text):
+                matched.update(owners)
+            counts = Counter(domain for domain, _ in matched)
+        else:
+            counts = Counter()
+            best = 0
+            for domain, keywords in _DOMAIN_KEYWORDS_LOWER.items():
+                # max() below keeps the first of equal scores, so a later
+                # domain has to beat the best strictly; skip any that cannot
+                if len(keywords) <= best:
+                    continue
+                count = sum(1 for kw in keywords if kw in expertise_text)
+                counts[domain] = count
+                best = max(best, count)
+
+        # Keep _DOMAIN_KEYWORDS order so ties resolve as before
+        domain_scores: Dict[str, int] = {
+            domain: counts[domain]
+            for domain in self._DOMAIN_KEYWORDS
+            if counts[domain] > 0
+        }
 
         # Return domain with highest score, or default
         if domain_scores:
@@ -145,6 +163,33 @@ class ExpertGenerator:
         return "탄소"
 
 
+# Domain keywords are fixed: lowercase them once at import
+_DOMAIN_KEYWORDS_LOWER: Dict[str, Tuple[str, ...]] = {
+    domain: tuple(kw.lower() for kw in keywords)
+    for domain, keywords in ExpertGenerator._DOMAIN_KEYWORDS.items()
+}
+
+
+def _build_domain_automaton() -> "ahocorasick.Automaton":
+    """Build one automaton over every domain keyword (lowercased).
+
+    Each word maps to the (domain, keyword) pairs that share it.
+    """
+    owners: Dict[str, List[Tuple[str, str]]] = {}
+    for domain, keywords in _DOMAIN_KEYWORDS_LOWER.items():
+        for kw in keywords:
+            owners.setdefault(kw, []).append((domain, kw))
+
+    automaton = ahocorasick.Automaton()
+    for kw, entries in owners.items():
+        automaton.add_word(kw, entries)
+    automaton.make_automaton()
+    return automaton
+
+
+_DOMAIN_AUTOMATON = _build_domain_automaton() if AHOCORASICK_AVAILABLE else None
+
+
 def register_dynamic_expert(proposal: NewExpertProposal) -> bool:
     """Register a new dynamic expert from a proposal.
 
@@ -5,15 +5,24 @@ conduct a "meeting" to determine appropriate expert assignment for complex
 content that cannot be resolved by rule-based classification.
 """
 
-import json
+import asyncio
+import hashlib
 import re
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import orjson
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from react_agent.agents.expert_panel.config import ExpertRole, EXPERT_REGISTRY
+from react_agent.cache_manager import LRUCache
+
+# JSON body of a ```json ... ``` (or bare ```) block in the LLM response
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+
+_PARSE_FALLBACK_REASONING = "JSON 파싱 실패로 기본 전문가 할당"
 
 
 @dataclass
@@ -51,6 +60,7 @@ class MeetingResult:
         reasoning: Explanation of the decision-making process.
         consensus_score: Agreement score among experts (0.0-1.0).
         raw_response: The raw LLM response for debugging.
+        error: Error message if the meeting call failed.
     """
 
     assigned_experts: List[ExpertRole]
@@ -58,6 +68,19 @@ class MeetingResult:
     reasoning: str
     consensus_score: float
     raw_response: str = ""
+    error: Optional[str] = None
+
+
+def _copy_result(result: MeetingResult) -> MeetingResult:
+    """Copy a meeting result down to its lists, so callers never share the cached one."""
+    return replace(
+        result,
+        assigned_experts=list(result.assigned_experts),
+        new_expert_proposals=[
+            replace(proposal, expertise=list(proposal.expertise), keywords=list(proposal.keywords))
+            for proposal in result.new_expert_proposals
+        ],
+    )
 
 
 MEETING_SYSTEM_PROMPT = """당신은 탄소 전문가 패널 회의의 진행자입니다.
@@ -113,16 +136,48 @@ class ExpertMeeting:
     Attributes:
         model_name: The name of the LLM model to use.
         llm: The ChatAnthropic LLM instance.
+        system_prompt: The meeting system prompt with the expert list filled in.
+        max_concurrency: Maximum number of in-flight meeting calls.
+        CACHE_TTL: How long a meeting result is reused for the same content.
     """
 
-    def __init__(self, model: str = "claude-sonnet-4-20250514") -> None:
+    CACHE_TTL = timedelta(days=7)
+
+    def __init__(
+        self,
+        model: str = "claude-sonnet-4-20250514",
+        max_concurrency: int = 8,
+        cache_size: int = 1024,
+    ) -> None:
         """Initialize the expert meeting engine.
 
         Args:
             model: The model name to use for the LLM.
+            max_concurrency: Maximum number of concurrent meeting calls in
+                conduct_meetings, kept low to respect API rate limits.
+            cache_size: Meeting results kept per (title, content), so the
+                same article seen through several feeds costs one call.
         """
         self.model_name = model
         self.llm = ChatAnthropic(model=model)
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.cache_size = cache_size
+        self._result_cache = LRUCache(max_size=cache_size)
+
+        # EXPERT_REGISTRY is static, so the system prompt is rendered once and
+        # sent byte-identical on every meeting; cache_control lets Anthropic
+        # reuse the prefix instead of re-reading it per call
+        self.system_prompt = MEETING_SYSTEM_PROMPT.format(
+            expert_list=self._get_expert_list()
+        )
+        self._system_blocks: List[Dict[str, Any]] = [
+            {
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
 
     def _get_expert_list(self) -> str:
         """Generate a formatted string of current experts.
@@ -155,8 +210,14 @@ class ExpertMeeting:
         Returns:
             MeetingResult containing the expert assignment decision.
         """
-        expert_list = self._get_expert_list()
-        system_prompt = MEETING_SYSTEM_PROMPT.format(expert_list=expert_list)
+        # Only the first 3000 characters reach the prompt. The source is left
+        # out of the key so mirrored articles share one result.
+        cache_key = hashlib.sha256(
+            f"{title}\0{content[:3000]}".encode()
+        ).hexdigest()
+        cached = self._result_cache.get(cache_key)
+        if cached is not None and cached[1] > datetime.now():
+            return _copy_result(cached[0])
 
         user_message = f"""다음 콘텐츠에 대해 전문가 회의를 진행하고 담당 전문가를 결정해주세요.
 
@@ -174,14 +235,65 @@ class ExpertMeeting:
 """
 
         messages = [
-            SystemMessage(content=system_prompt),
+            SystemMessage(content=self._system_blocks),
             HumanMessage(content=user_message),
         ]
 
         response = await self.llm.ainvoke(messages)
         response_text = response.content if hasattr(response, "content") else str(response)
 
-        return self._parse_response(response_text)
+        result = self._parse_response(response_text)
+        # A parse failure is worth retrying next time, so it is not cached
+        if result.reasoning != _PARSE_FALLBACK_REASONING:
+            self._result_cache.set(
+                cache_key, _copy_result(result), datetime.now() + self.CACHE_TTL
+            )
+        return result
+
+    async def conduct_meetings(
+        self,
+        items: Sequence[Tuple[str, str, str]],
+    ) -> List[MeetingResult]:
+        """Conduct meetings for several contents concurrently.
+
+        At most max_concurrency meetings are in flight at once. A failed
+        meeting does not cancel the others; it yields the default
+        assignment with ``error`` set. A cancelled meeting is re-raised.
+
+        Args:
+            items: (content, title, source) tuples.
+
+        Returns:
+            List of MeetingResult in the same order as items.
+        """
+
+        async def meet(content: str, title: str, source: str) -> MeetingResult:
+            async with self._semaphore:
+                return await self.conduct_meeting(content, title, source)
+
+        outcomes = await asyncio.gather(
+            *(meet(*item) for item in items),
+            return_exceptions=True,
+        )
+
+        results: List[MeetingResult] = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                results.append(
+                    MeetingResult(
+                        assigned_experts=[ExpertRole.POLICY_EXPERT],
+                        new_expert_proposals=[],
+                        reasoning="회의 오류로 기본 전문가 할당",
+                        consensus_score=0.0,
+                        error=str(outcome),
+                    )
+                )
+            elif isinstance(outcome, BaseException):
+                # CancelledError and friends are not meeting failures
+                raise outcome
+            else:
+                results.append(outcome)
+        return results
 
     def _parse_response(self, response: str) -> MeetingResult:
         """Parse the LLM response into a MeetingResult.
@@ -193,7 +305,7 @@ class ExpertMeeting:
             MeetingResult parsed from the response.
         """
         # Try to extract JSON from markdown code block
-        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", response)
+        json_match = _JSON_BLOCK_RE.search(response)
         if json_match:
             json_str = json_match.group(1)
         else:
@@ -201,7 +313,7 @@ class ExpertMeeting:
             json_str = response.strip()
 
         try:
-            data = json.loads(json_str)
+            data = orjson.loads(json_str)
 
             # Parse assigned experts
             assigned_experts = []
@@ -237,12 +349,14 @@ class ExpertMeeting:
                 raw_response=response,
             )
 
-        except (json.JSONDecodeError, KeyError, TypeError):
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError):
+            # ValueError: non-numeric consensus_score; AttributeError: JSON
+            # that is not an object (e.g. a bare list)
             # Fallback to default result if parsing fails
             return MeetingResult(
                 assigned_experts=[ExpertRole.POLICY_EXPERT],
                 new_expert_proposals=[],
-                reasoning="JSON 파싱 실패로 기본 전문가 할당",
+                reasoning=_PARSE_FALLBACK_REASONING,
                 consensus_score=0.0,
                 raw_response=response,
             )
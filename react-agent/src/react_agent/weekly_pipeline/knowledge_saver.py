@@ -9,10 +9,14 @@ import logging
 import hashlib
 import unicodedata
 import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Union
 
+from react_agent.agents.expert_panel.config import ExpertRole
 from .preprocessor import PreprocessedContent
 from .classifier import ClassificationResult
 from .analyzer import AnalysisResult
@@ -29,6 +33,44 @@ CATEGORY_FOLDER_MAP = {
     "MRV_EXPERT": "MRV검증",
 }
 
+# Markdown document layout up to the analysis section; see _build_document
+_DOCUMENT_HEADER_TEMPLATE = """---
+title: "{title}"
+source: "{source}"
+url: "{url}"
+published_date: "{published}"
+crawled_date: "{crawled}"
+category: "{category}"
+language: "{language}"
+word_count: {word_count}
+{related}---
+
+# {title}
+
+## 메타데이터
+
+- **출처**: {source}
+- **원문 URL**: {url}
+- **발행일**: {published}
+- **분류**: {category}
+
+"""
+
+# Filename patterns, compiled once for every title in a batch
+# Keep Korean characters, alphanumeric, spaces, hyphens, underscores
+_INVALID_CHARS_RE = re.compile(r'[^\w\s가-힣\-]')
+_MULTISPACE_RE = re.compile(r'\s+')
+# ASCII titles: delete what _INVALID_CHARS_RE would, in one str.translate pass
+# (whitespace is kept here and collapsed afterwards, as in the regex path)
+_ASCII_INVALID_TABLE = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(128))
+    if not (ch.isalnum() or ch.isspace() or ch in '_-')
+))
+
+
+# Body hash -> saved file path, kept in the knowledge base root
+INDEX_FILENAME = ".index.db"
+
 
 def get_knowledge_base_path() -> Path:
     """Get the knowledge base directory path."""
@@ -50,15 +92,21 @@ def sanitize_filename(title: str, max_length: int = 100) -> str:
     Returns:
         Sanitized filename string
     """
-    # Normalize unicode characters
-    normalized = unicodedata.normalize('NFC', title)
-
-    # Remove or replace invalid characters
-    # Keep Korean characters, alphanumeric, spaces, hyphens, underscores
-    cleaned = re.sub(r'[^\w\s가-힣\-]', '', normalized)
-
-    # Replace multiple spaces with single space
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    if title.isascii():
+        # ASCII is already NFC; translate + split/join match the regexes
+        cleaned = ' '.join(title.translate(_ASCII_INVALID_TABLE).split())
+    else:
+        # Normalize unicode characters; crawled titles are usually NFC already
+        if unicodedata.is_normalized('NFC', title):
+            normalized = title
+        else:
+            normalized = unicodedata.normalize('NFC', title)
+
+        # Remove or replace invalid characters
+        cleaned = _INVALID_CHARS_RE.sub('', normalized)
+
+        # Replace multiple spaces with single space
+        cleaned = _MULTISPACE_RE.sub(' ', cleaned).strip()
 
     # Replace spaces with underscores
     cleaned = cleaned.replace(' ', '_')
@@ -73,16 +121,68 @@ def sanitize_filename(title: str, max_length: int = 100) -> str:
     return cleaned or "untitled"
 
 
-def get_content_hash(content: str) -> str:
+def get_content_hash(content: Union[str, bytes]) -> str:
     """Generate a short hash for content deduplication.
 
+    The suffix is part of every saved filename, so it stays the first 8
+    hex characters of MD5; another algorithm would rename existing
+    documents and defeat the exclusive-create duplicate check.
+
     Args:
-        content: Content string to hash
+        content: Content string (or its UTF-8 bytes) to hash
 
     Returns:
         8-character hash string
     """
-    return hashlib.md5(content.encode()).hexdigest()[:8]
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.md5(content).hexdigest()[:8]
+
+
+def _index_key(body: bytes) -> str:
+    """Return the index key for an encoded document body.
+
+    Always full MD5, unlike PreprocessedContent.content_hash, whose
+    algorithm depends on whether xxhash is installed; an index written in
+    one environment must still match in another.
+    """
+    return hashlib.md5(body).hexdigest()
+
+
+def _write_new_file(path: Path, chunks: Iterable[bytes], sync: bool = False) -> None:
+    """Create ``path`` exclusively and write ``chunks`` through a raw descriptor.
+
+    Skips the text-mode wrapper and its buffer: the document is encoded
+    by the caller and written piece by piece with os.write, so large
+    parts never have to be joined first. Raises FileExistsError if
+    the file is already there; a partially written file is removed. With
+    ``sync``, the data is flushed to disk before the descriptor is closed.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+        if sync:
+            os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(path)
+        raise
+    os.close(fd)
+
+
+def _fsync_directory(path: str) -> None:
+    """Flush a directory's entries to disk (no-op where unsupported)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 class KnowledgeSaver:
@@ -92,28 +192,97 @@ class KnowledgeSaver:
     ready for vector DB indexing.
     """
 
-    def __init__(self, base_path: Optional[Path] = None):
+    def __init__(self, base_path: Optional[Path] = None, max_workers: int = 8):
         """Initialize the knowledge saver.
 
         Args:
             base_path: Base path for the knowledge base. If None, uses default.
+            max_workers: Number of threads save_batch writes documents with.
         """
         self.base_path = base_path or get_knowledge_base_path()
+        self.max_workers = max_workers
+        # Resolved once; save_content looks folders up by expert role
+        self._folder_paths: Dict[str, Path] = {
+            role: self.base_path / folder for role, folder in CATEGORY_FOLDER_MAP.items()
+        }
+        # Same paths keyed by the enum itself, so the common case skips .upper()
+        self._role_paths: Dict[ExpertRole, Path] = {
+            role: self.base_path / self.get_category_folder(role.value)
+            for role in ExpertRole
+        }
         self._ensure_directories()
         self._saved_hashes: set = set()
+        self._hashes_lock = threading.Lock()
+        self._index = self._open_index()
+
+    def _open_index(self) -> Optional[sqlite3.Connection]:
+        """Open the body hash (see _index_key) -> file path index kept across runs.
+
+        The connection is shared by save_batch workers and only used under
+        _hashes_lock. Returns None (in-memory dedup only) if the database
+        cannot be opened.
+        """
+        try:
+            index = sqlite3.connect(
+                self.base_path / INDEX_FILENAME, check_same_thread=False
+            )
+            index.execute(
+                "CREATE TABLE IF NOT EXISTS docs (hash TEXT PRIMARY KEY, path TEXT)"
+            )
+            index.commit()
+            return index
+        except sqlite3.Error as e:
+            logger.warning(f"Knowledge base index unavailable: {e}")
+            return None
+
+    def _lookup_index(self, index_key: str) -> Optional[str]:
+        """Return the indexed path for an index key; call with _hashes_lock held."""
+        if self._index is None:
+            return None
+        try:
+            row = self._index.execute(
+                "SELECT path FROM docs WHERE hash = ?", (index_key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def _record_index(self, index_key: str, path: str) -> None:
+        """Add a saved document to the index (committed by the caller)."""
+        if self._index is None:
+            return
+        with self._hashes_lock:
+            try:
+                self._index.execute(
+                    "INSERT OR REPLACE INTO docs (hash, path) VALUES (?, ?)",
+                    (index_key, path),
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to index '{path}': {e}")
+
+    def _commit_index(self) -> None:
+        """Commit pending index rows; one transaction per save call or batch."""
+        if self._index is None:
+            return
+        with self._hashes_lock:
+            try:
+                self._index.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to commit knowledge base index: {e}")
 
     def _ensure_directories(self):
         """Ensure all category directories exist."""
         self.base_path.mkdir(parents=True, exist_ok=True)
 
-        for folder in CATEGORY_FOLDER_MAP.values():
-            folder_path = self.base_path / folder
+        for folder_path in self._folder_paths.values():
             folder_path.mkdir(exist_ok=True)
 
-            # Create .gitkeep if empty
-            gitkeep = folder_path / ".gitkeep"
-            if not gitkeep.exists() and not list(folder_path.glob("*.md")):
-                gitkeep.touch()
+            # Create .gitkeep if empty; scandir stops at the first entry
+            # instead of listing a folder that may hold many documents
+            with os.scandir(folder_path) as entries:
+                is_empty = next(entries, None) is None
+            if is_empty:
+                (folder_path / ".gitkeep").touch()
 
     def get_category_folder(self, expert_role: str) -> str:
         """Get the folder name for an expert role.
@@ -143,42 +312,78 @@ class KnowledgeSaver:
         Returns:
             Path to the saved file, or None if skipped/failed
         """
-        try:
-            # Check for duplicates
-            content_hash = content.content_hash
+        result = self._save_content(content, classification, analysis)
+        self._commit_index()
+        return result
+
+    def _save_content(
+        self,
+        content: PreprocessedContent,
+        classification: ClassificationResult,
+        analysis: Optional[AnalysisResult] = None,
+        crawled_date: Optional[str] = None,
+        durable: bool = False,
+    ) -> Optional[str]:
+        """Save one content item, leaving its index row uncommitted."""
+        # Check for duplicates; the hash is claimed under the lock so that
+        # concurrent save_batch workers never write the same content twice
+        content_hash = content.content_hash
+        # Encoded once: keys the index, hashed for the filename and written
+        # as the body
+        body = content.clean_content.encode("utf-8")
+        index_key = _index_key(body)
+        with self._hashes_lock:
             if content_hash in self._saved_hashes:
                 logger.debug(f"Skipping duplicate content: {content.clean_title}")
                 return None
+            self._saved_hashes.add(content_hash)
+            indexed_path = self._lookup_index(index_key)
 
+        # Saved by an earlier run: skip building the document at all
+        if indexed_path is not None and os.path.exists(indexed_path):
+            logger.debug(f"Already in knowledge base: {indexed_path}")
+            return indexed_path
+
+        try:
             # Determine category folder
-            expert_role = classification.primary_expert.value.upper()
-            folder = self.get_category_folder(expert_role)
-            folder_path = self.base_path / folder
+            folder_path = self._role_paths.get(classification.primary_expert)
+            if folder_path is None:
+                # Roles outside ExpertRole (e.g. dynamic experts)
+                expert_role = classification.primary_expert.value
+                folder_path = self.base_path / self.get_category_folder(expert_role)
+                folder_path.mkdir(exist_ok=True)
 
             # Generate filename
             date_str = content.original.published_date.strftime("%Y%m%d")
             title_slug = sanitize_filename(content.clean_title)
-            hash_suffix = get_content_hash(content.clean_content)
+            hash_suffix = get_content_hash(body)
             filename = f"{date_str}_{title_slug}_{hash_suffix}.md"
             filepath = folder_path / filename
 
-            # Skip if file already exists
-            if filepath.exists():
+            # Build everything before the original content
+            head = self._build_document_head(
+                content, classification, analysis, crawled_date
+            )
+
+            # Exclusive create: one open() both checks for an existing file
+            # and creates the new one, instead of a stat() before the write
+            try:
+                _write_new_file(
+                    filepath, (head.encode("utf-8"), body, b"\n"), sync=durable
+                )
+            except FileExistsError:
                 logger.debug(f"File already exists: {filepath}")
-                self._saved_hashes.add(content_hash)
+                self._record_index(index_key, str(filepath))
                 return str(filepath)
 
-            # Build document content
-            document = self._build_document(content, classification, analysis)
-
-            # Write to file
-            filepath.write_text(document, encoding="utf-8")
-            self._saved_hashes.add(content_hash)
-
+            self._record_index(index_key, str(filepath))
             logger.info(f"Saved to knowledge base: {filepath.name}")
             return str(filepath)
 
         except Exception as e:
+            # Release the claim so a later attempt can retry this content
+            with self._hashes_lock:
+                self._saved_hashes.discard(content_hash)
             logger.error(f"Failed to save content '{content.clean_title}': {e}")
             return None
 
@@ -187,6 +392,7 @@ class KnowledgeSaver:
         content: PreprocessedContent,
         classification: ClassificationResult,
         analysis: Optional[AnalysisResult] = None,
+        crawled_date: Optional[str] = None,
     ) -> str:
         """Build a markdown document from content and analysis.
 
@@ -194,75 +400,81 @@ class KnowledgeSaver:
             content: Preprocessed content
             classification: Classification result
             analysis: Optional analysis result
+            crawled_date: Crawl date (YYYY-MM-DD); today if None
 
         Returns:
             Markdown formatted document string
         """
-        lines = []
-
-        # YAML frontmatter
-        lines.append("---")
-        lines.append(f"title: \"{content.clean_title}\"")
-        lines.append(f"source: \"{content.original.source}\"")
-        lines.append(f"url: \"{content.original.url}\"")
-        lines.append(f"published_date: \"{content.original.published_date.strftime('%Y-%m-%d')}\"")
-        lines.append(f"crawled_date: \"{datetime.now().strftime('%Y-%m-%d')}\"")
-        lines.append(f"category: \"{classification.primary_expert.value}\"")
-        lines.append(f"language: \"{content.original.language}\"")
-        lines.append(f"word_count: {content.word_count}")
-        if classification.secondary_expert:
-            lines.append(f"related_categories: \"{classification.secondary_expert.value}\"")
-        lines.append("---")
-        lines.append("")
-
-        # Title
-        lines.append(f"# {content.clean_title}")
-        lines.append("")
-
-        # Metadata summary
-        lines.append("## 메타데이터")
-        lines.append("")
-        lines.append(f"- **출처**: {content.original.source}")
-        lines.append(f"- **원문 URL**: {content.original.url}")
-        lines.append(f"- **발행일**: {content.original.published_date.strftime('%Y-%m-%d')}")
-        lines.append(f"- **분류**: {classification.primary_expert.value}")
-        lines.append("")
+        head = self._build_document_head(content, classification, analysis, crawled_date)
+        return f"{head}{content.clean_content}\n"
+
+    def _build_document_head(
+        self,
+        content: PreprocessedContent,
+        classification: ClassificationResult,
+        analysis: Optional[AnalysisResult] = None,
+        crawled_date: Optional[str] = None,
+    ) -> str:
+        """Build the document up to the original content.
+
+        The original content itself follows this head, then one newline;
+        see _build_document.
+
+        Args:
+            content: Preprocessed content
+            classification: Classification result
+            analysis: Optional analysis result
+            crawled_date: Crawl date (YYYY-MM-DD); today if None
+
+        Returns:
+            Markdown formatted head string
+        """
+        published = content.original.published_date.strftime('%Y-%m-%d')
+        category = classification.primary_expert.value
+        related = (
+            f"related_categories: \"{classification.secondary_expert.value}\"\n"
+            if classification.secondary_expert
+            else ""
+        )
+
+        # YAML frontmatter, title and metadata summary
+        header = _DOCUMENT_HEADER_TEMPLATE.format(
+            title=content.clean_title,
+            source=content.original.source,
+            url=content.original.url,
+            published=published,
+            crawled=crawled_date or datetime.now().strftime('%Y-%m-%d'),
+            category=category,
+            language=content.original.language,
+            word_count=content.word_count,
+            related=related,
+        )
 
         # Analysis section (if available)
+        analysis_block = ""
         if analysis and not analysis.error:
-            lines.append("## 전문가 분석")
-            lines.append("")
-
+            sections = ["## 전문가 분석\n\n"]
             if analysis.summary:
-                lines.append("### 요약")
-                lines.append(analysis.summary)
-                lines.append("")
-
+                sections.append(f"### 요약\n{analysis.summary}\n\n")
             if analysis.key_findings:
-                lines.append("### 주요 발견")
-                for finding in analysis.key_findings:
-                    lines.append(f"- {finding}")
-                lines.append("")
-
+                findings = "".join(f"- {finding}\n" for finding in analysis.key_findings)
+                sections.append(f"### 주요 발견\n{findings}\n")
             if analysis.implications:
-                lines.append("### 시사점")
-                for implication in analysis.implications:
-                    lines.append(f"- {implication}")
-                lines.append("")
-
-        # Original content
-        lines.append("## 원문 내용")
-        lines.append("")
-        lines.append(content.clean_content)
-        lines.append("")
+                implications = "".join(
+                    f"- {implication}\n" for implication in analysis.implications
+                )
+                sections.append(f"### 시사점\n{implications}\n")
+            analysis_block = "".join(sections)
 
-        return "\n".join(lines)
+        # Original content heading
+        return f"{header}{analysis_block}## 원문 내용\n\n"
 
     def save_batch(
         self,
         contents: List[PreprocessedContent],
         classifications: List[ClassificationResult],
         analyses: Optional[List[AnalysisResult]] = None,
+        durable: bool = False,
     ) -> int:
         """Save multiple contents to the knowledge base.
 
@@ -270,18 +482,36 @@ class KnowledgeSaver:
             contents: List of preprocessed contents
             classifications: List of classification results
             analyses: Optional list of analysis results
+            durable: Flush written documents and their folders to disk
+                before returning
 
         Returns:
             Number of successfully saved documents
         """
-        saved_count = 0
-
-        for i, (content, classification) in enumerate(zip(contents, classifications)):
-            analysis = analyses[i] if analyses and i < len(analyses) else None
-
-            result = self.save_content(content, classification, analysis)
-            if result:
-                saved_count += 1
+        # One crawl date for the whole batch, formatted once
+        crawled_date = datetime.now().strftime('%Y-%m-%d')
+        items = [
+            (
+                content,
+                classification,
+                analyses[i] if analyses and i < len(analyses) else None,
+                crawled_date,
+                durable,
+            )
+            for i, (content, classification) in enumerate(zip(contents, classifications))
+        ]
+        # File writes release the GIL, so a few threads overlap the disk I/O
+        workers = max(1, min(self.max_workers, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda item: self._save_content(*item), items))
+        # One index transaction for the whole batch
+        self._commit_index()
+        if durable:
+            # Files were synced by the workers in parallel; each touched
+            # folder's entries need only one fsync for the whole batch
+            for folder in {os.path.dirname(result) for result in results if result}:
+                _fsync_directory(folder)
+        saved_count = sum(1 for result in results if result)
 
         logger.info(f"Saved {saved_count}/{len(contents)} documents to knowledge base")
         return saved_count
@@ -303,17 +533,24 @@ class KnowledgeSaver:
 
         latest_mtime = 0.0
 
-        for folder in CATEGORY_FOLDER_MAP.values():
-            folder_path = self.base_path / folder
-            if folder_path.exists():
-                docs = list(folder_path.glob("*.md"))
-                stats["by_category"][folder] = len(docs)
-                stats["total_documents"] += len(docs)
-
-                for doc in docs:
-                    mtime = doc.stat().st_mtime
-                    if mtime > latest_mtime:
-                        latest_mtime = mtime
+        for folder, folder_path in zip(
+            CATEGORY_FOLDER_MAP.values(), self._folder_paths.values()
+        ):
+            # Count and date documents in one scandir pass, without a Path
+            # object per file
+            try:
+                with os.scandir(folder_path) as entries:
+                    count = 0
+                    for entry in entries:
+                        if entry.name.endswith(".md"):
+                            count += 1
+                            mtime = entry.stat().st_mtime
+                            if mtime > latest_mtime:
+                                latest_mtime = mtime
+            except FileNotFoundError:
+                continue
+            stats["by_category"][folder] = count
+            stats["total_documents"] += count
 
         if latest_mtime > 0:
             stats["last_updated"] = datetime.fromtimestamp(latest_mtime).isoformat()
@@ -19,6 +19,9 @@ from .report_generator import ReportGenerator
 from .sources import get_default_registry
 from .knowledge_saver import KnowledgeSaver
 
+# Crawler validator files, kept next to the knowledge base index
+CRAWL_CACHE_DIRNAME = ".crawl_cache"
+
 
 @dataclass
 class PipelineResult:
@@ -61,12 +64,15 @@ class WeeklyPipeline:
     Attributes:
         days_back: Number of days to look back when crawling.
         enable_llm_meeting: Whether to enable LLM-based expert meetings.
+        crawl_cache_dir: Directory keeping crawler ETag/Last-Modified
+            validators between runs.
     """
 
     def __init__(
         self,
         days_back: int = 7,
         enable_llm_meeting: bool = True,
+        crawl_cache_dir: Optional[str] = None,
     ) -> None:
         """Initialize the WeeklyPipeline.
 
@@ -74,18 +80,24 @@ class WeeklyPipeline:
             days_back: Number of days to look back when crawling (default: 7).
             enable_llm_meeting: Whether to enable LLM-based expert meetings
                                for complex content routing (default: True).
+            crawl_cache_dir: Directory for crawler validators, so unchanged
+                            feeds are answered with 304 on the next run
+                            (default: .crawl_cache in the knowledge base).
         """
         self.days_back = days_back
         self.enable_llm_meeting = enable_llm_meeting
 
         # Initialize components
-        self._registry = get_default_registry()
+        self._knowledge_saver = KnowledgeSaver()
+        self.crawl_cache_dir = crawl_cache_dir or str(
+            self._knowledge_saver.base_path / CRAWL_CACHE_DIRNAME
+        )
+        self._registry = get_default_registry(cache_dir=self.crawl_cache_dir)
         self._preprocessor = Preprocessor()
         self._classifier = RuleBasedClassifier()
         self._expert_meeting: Optional[ExpertMeeting] = None
         self._analyzer: Optional[ExpertAnalyzer] = None
         self._report_generator = ReportGenerator()
-        self._knowledge_saver = KnowledgeSaver()
 
         # Pipeline state
         self._errors: List[str] = []
@@ -110,7 +122,7 @@ class WeeklyPipeline:
         crawled = await self._stage_crawl()
 
         # Stage 2: Preprocess
-        preprocessed = self._stage_preprocess(crawled)
+        preprocessed = await self._stage_preprocess(crawled)
 
         # Stage 3: Classify
         classified = self._stage_classify(preprocessed)
@@ -162,7 +174,7 @@ class WeeklyPipeline:
             except Exception:
                 pass
 
-    def _stage_preprocess(
+    async def _stage_preprocess(
         self, crawled: List[CrawledContent]
     ) -> List[PreprocessedContent]:
         """Stage 2: Preprocess and deduplicate crawled content.
@@ -174,11 +186,14 @@ class WeeklyPipeline:
             List of preprocessed content items.
         """
         try:
-            # Deduplicate first
+            # Deduplicate first, so exact copies are never parsed
             unique = self._preprocessor.deduplicate(crawled)
 
             # Then preprocess
-            preprocessed = self._preprocessor.preprocess_batch(unique)
+            preprocessed = await self._preprocessor.preprocess_batch_async(unique)
+
+            # Drop copies that only differed in markup, by the cached hash
+            preprocessed = self._preprocessor.deduplicate_preprocessed(preprocessed)
 
             # Filter out empty content
             return [p for p in preprocessed if p.word_count > 0]
@@ -198,13 +213,12 @@ class WeeklyPipeline:
             List of classification results.
         """
         try:
-            results = []
-            for content in preprocessed:
-                # Use both title and content for classification
-                text = f"{content.clean_title} {content.clean_content}"
-                result = self._classifier.classify(text)
-                results.append(result)
-            return results
+            # Use both title and content for classification
+            texts = [
+                f"{content.clean_title} {content.clean_content}"
+                for content in preprocessed
+            ]
+            return self._classifier.classify_batch(texts)
         except Exception as e:
             self._errors.append(f"Classify stage error: {str(e)}")
             return []
@@ -237,24 +251,35 @@ class WeeklyPipeline:
                 self._expert_meeting = ExpertMeeting()
 
             # Find content that needs LLM meeting
-            for content, classification in zip(preprocessed, classified):
-                if classification.needs_llm_meeting:
-                    try:
-                        meeting_result = await self._expert_meeting.conduct_meeting(
-                            content=content.clean_content[:3000],
-                            title=content.clean_title,
-                            source=content.original.source,
-                        )
-
-                        # Register any new experts proposed
-                        for proposal in meeting_result.new_expert_proposals:
-                            if register_dynamic_expert(proposal):
-                                new_experts.append(proposal.suggested_name)
-
-                    except Exception as e:
-                        self._errors.append(
-                            f"Meeting error for '{content.clean_title}': {str(e)}"
-                        )
+            needs_meeting = [
+                content
+                for content, classification in zip(preprocessed, classified)
+                if classification.needs_llm_meeting
+            ]
+
+            # Meetings run concurrently; results come back in content order
+            meeting_results = await self._expert_meeting.conduct_meetings(
+                [
+                    (
+                        content.clean_content[:3000],
+                        content.clean_title,
+                        content.original.source,
+                    )
+                    for content in needs_meeting
+                ]
+            )
+
+            for content, meeting_result in zip(needs_meeting, meeting_results):
+                if meeting_result.error is not None:
+                    self._errors.append(
+                        f"Meeting error for '{content.clean_title}': {meeting_result.error}"
+                    )
+                    continue
+
+                # Register any new experts proposed
+                for proposal in meeting_result.new_expert_proposals:
+                    if register_dynamic_expert(proposal):
+                        new_experts.append(proposal.suggested_name)
 
             return new_experts
 
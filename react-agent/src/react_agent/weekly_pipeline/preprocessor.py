@@ -4,15 +4,70 @@ This module provides functionality to clean HTML content, normalize text,
 detect language, and deduplicate crawled content.
 """
 
+import asyncio
 import hashlib
+import multiprocessing
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Tuple
 
 from bs4 import BeautifulSoup
 
 from .crawler import CrawledContent
 
+# Optional: lxml (libxml2) parses HTML much faster than html.parser
+try:
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+_HTML_PARSER = lxml_etree.HTMLParser() if LXML_AVAILABLE else None
+
+# Whitespace runs that normalize_text changes; a lone space or newline is
+# already normalized, so it is never matched or replaced
+_SPACE_RUN_RE = re.compile(r"\t[ \t]*| [ \t]+")
+_NEWLINE_RUN_RE = re.compile(r"\n\n+")
+
+# detect_language counts characters by summing the lengths of matched runs,
+# so each match covers a whole word rather than one character
+_KOREAN_RUN_RE = re.compile(r"[\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F]+")
+_LATIN_RUN_RE = re.compile(r"[a-zA-Z]+")
+
+# Optional: numpy counts letters in long documents without the regex engine
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Below this length the array setup costs more than the regexes save
+_NUMPY_MIN_LENGTH = 512
+
+
+def _count_letters_numpy(text: str) -> Tuple[int, int]:
+    """Count Hangul and all letters (Hangul + Latin) over the codepoint array."""
+    codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    korean = (
+        ((codepoints >= 0xAC00) & (codepoints <= 0xD7AF))
+        | ((codepoints >= 0x1100) & (codepoints <= 0x11FF))
+        | ((codepoints >= 0x3130) & (codepoints <= 0x318F))
+    )
+    latin = ((codepoints >= 0x41) & (codepoints <= 0x5A)) | (
+        (codepoints >= 0x61) & (codepoints <= 0x7A)
+    )
+    korean_chars = int(np.count_nonzero(korean))
+    return korean_chars, korean_chars + int(np.count_nonzero(latin))
+
+
+# Optional: xxHash3 is much faster than MD5 for dedup keys (same 32 hex chars)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 
 @dataclass
 class PreprocessedContent:
@@ -24,7 +79,7 @@ class PreprocessedContent:
         clean_title: Cleaned title without HTML tags.
         language: Detected language code ('ko' or 'en').
         word_count: Number of words in the content.
-        content_hash: MD5 hash of the cleaned content.
+        content_hash: Hash of the cleaned title and content (see compute_hash).
         extracted_keywords: List of extracted keywords.
     """
 
@@ -47,6 +102,18 @@ class Preprocessor:
     # Tags to remove completely (including their content)
     REMOVE_TAGS = ["script", "style", "nav", "footer", "header", "aside", "iframe"]
 
+    # Smaller batches finish before a process pool would have started
+    PARALLEL_THRESHOLD = 64
+
+    def __init__(self, processes: int = 1) -> None:
+        """Initialize the Preprocessor.
+
+        Args:
+            processes: Worker processes for large batches in
+                preprocess_batch (default: 1, no pool).
+        """
+        self.processes = processes
+
     def clean_html(self, html: str) -> str:
         """Clean HTML content by removing unwanted tags and extracting text.
 
@@ -62,6 +129,13 @@ class Preprocessor:
         if not html:
             return ""
 
+        if LXML_AVAILABLE:
+            try:
+                return self._clean_html_lxml(html)
+            except (lxml_etree.LxmlError, ValueError):
+                # e.g. a str with an XML encoding declaration
+                pass
+
         soup = BeautifulSoup(html, "html.parser")
 
         # Remove unwanted tags completely
@@ -74,6 +148,22 @@ class Preprocessor:
 
         return text
 
+    def _clean_html_lxml(self, html: str) -> str:
+        """Clean HTML with lxml; same text as the BeautifulSoup path.
+
+        Removed tags are emptied rather than dropped so their tail text
+        stays a separate string, as with BeautifulSoup's decompose().
+        """
+        root = lxml_etree.fromstring(html, _HTML_PARSER)
+        if root is None:
+            return ""
+
+        for element in list(root.iter(*self.REMOVE_TAGS)):
+            element.clear(keep_tail=True)
+
+        # itertext() skips comments and processing instructions, like get_text()
+        return " ".join(s for s in (t.strip() for t in root.itertext()) if s)
+
     def normalize_text(self, text: str) -> str:
         """Normalize text by removing consecutive whitespace and newlines.
 
@@ -90,11 +180,15 @@ class Preprocessor:
         if not text:
             return ""
 
+        # Already normalized (the usual case for clean_html output): only strip
+        if "\t" not in text and "  " not in text and "\n\n" not in text:
+            return text.strip()
+
         # Replace consecutive whitespace (spaces, tabs) with single space
-        text = re.sub(r"[ \t]+", " ", text)
+        text = _SPACE_RUN_RE.sub(" ", text)
 
         # Replace consecutive newlines with single newline
-        text = re.sub(r"\n+", "\n", text)
+        text = _NEWLINE_RUN_RE.sub("\n", text)
 
         # Strip leading and trailing whitespace
         text = text.strip()
@@ -116,13 +210,15 @@ class Preprocessor:
         if not text:
             return "en"
 
-        # Count Korean characters (Hangul)
-        korean_pattern = re.compile(r"[\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F]")
-        korean_chars = len(korean_pattern.findall(text))
+        if NUMPY_AVAILABLE and len(text) >= _NUMPY_MIN_LENGTH:
+            korean_chars, total_alpha = _count_letters_numpy(text)
+        else:
+            # Count Korean characters (Hangul)
+            korean_chars = sum(map(len, _KOREAN_RUN_RE.findall(text)))
 
-        # Count total alphabetic characters (excluding spaces, punctuation)
-        alpha_pattern = re.compile(r"[a-zA-Z\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F]")
-        total_alpha = len(alpha_pattern.findall(text))
+            # Count total alphabetic characters (excluding spaces, punctuation):
+            # Latin letters plus the Hangul counted above
+            total_alpha = korean_chars + sum(map(len, _LATIN_RUN_RE.findall(text)))
 
         if total_alpha == 0:
             return "en"
@@ -133,14 +229,19 @@ class Preprocessor:
         return "ko" if korean_ratio > 0.3 else "en"
 
     def compute_hash(self, text: str) -> str:
-        """Compute MD5 hash of the given text.
+        """Compute a 128-bit dedup hash of the given text.
+
+        Uses xxHash3-128 when xxhash is installed, MD5 otherwise. The hash
+        is only a dedup key, so it does not need to be cryptographic.
 
         Args:
             text: Text to hash.
 
         Returns:
-            MD5 hex digest of the text.
+            32-character hex digest of the text.
         """
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_hexdigest(text.encode("utf-8"))
         return hashlib.md5(text.encode("utf-8")).hexdigest()
 
     def count_words(self, text: str) -> int:
@@ -207,6 +308,9 @@ class Preprocessor:
         """Remove duplicate content based on title and content hash.
 
         Keeps the first occurrence of content with the same title and content.
+        Items are first bucketed by length and a short prefix of title +
+        content; only items sharing a bucket can be duplicates, so only
+        those are hashed.
 
         Args:
             contents: List of CrawledContent objects to deduplicate.
@@ -217,19 +321,57 @@ class Preprocessor:
         if not contents:
             return []
 
-        seen_hashes = set()
-        unique_contents = []
+        # Same key for any two items whose title + content are equal
+        buckets: Dict[Tuple[int, str], List[int]] = defaultdict(list)
+        for i, content in enumerate(contents):
+            title, body = content.title, content.content
+            key = (len(title) + len(body), (title[:64] + body[:64])[:64])
+            buckets[key].append(i)
+
+        keep: List[int] = []
+        for indices in buckets.values():
+            if len(indices) == 1:
+                keep.extend(indices)
+                continue
+
+            seen_hashes = set()
+            for i in indices:
+                # Compute hash from title and content
+                hash_input = contents[i].title + contents[i].content
+                content_hash = self.compute_hash(hash_input)
+
+                if content_hash not in seen_hashes:
+                    seen_hashes.add(content_hash)
+                    keep.append(i)
+
+        # Back to input order
+        keep.sort()
+        return [contents[i] for i in keep]
+
+    def deduplicate_preprocessed(
+        self, items: List[PreprocessedContent]
+    ) -> List[PreprocessedContent]:
+        """Remove duplicates by the hash preprocess() already computed.
 
-        for content in contents:
-            # Compute hash from title and content
-            hash_input = content.title + content.content
-            content_hash = self.compute_hash(hash_input)
+        Catches items whose raw HTML differed but whose cleaned title and
+        content are the same, without hashing anything again. Keeps the
+        first occurrence.
 
-            if content_hash not in seen_hashes:
-                seen_hashes.add(content_hash)
-                unique_contents.append(content)
+        Args:
+            items: List of PreprocessedContent objects to deduplicate.
+
+        Returns:
+            List of unique PreprocessedContent objects.
+        """
+        seen_hashes = set()
+        unique_items = []
 
-        return unique_contents
+        for item in items:
+            if item.content_hash not in seen_hashes:
+                seen_hashes.add(item.content_hash)
+                unique_items.append(item)
+
+        return unique_items
 
     def preprocess_batch(
         self, contents: List[CrawledContent]
@@ -242,4 +384,35 @@ class Preprocessor:
         Returns:
             List of PreprocessedContent objects.
         """
+        if self.processes > 1 and len(contents) >= self.PARALLEL_THRESHOLD:
+            # HTML parsing is CPU-bound; spread large batches over processes
+            chunksize = max(1, len(contents) // (self.processes * 4))
+            # spawn, not fork: callers run threads (preprocess_batch_async,
+            # logging, httpx) whose locks a forked child could inherit held
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(processes=self.processes) as pool:
+                return pool.map(self.preprocess, contents, chunksize=chunksize)
+
         return [self.preprocess(content) for content in contents]
+
+    async def preprocess_batch_async(
+        self, contents: List[CrawledContent]
+    ) -> List[PreprocessedContent]:
+        """Preprocess multiple contents without blocking the event loop.
+
+        HTML parsing is synchronous and CPU-bound, so each item runs in the
+        default thread pool while crawls and LLM calls keep going.
+
+        Args:
+            contents: List of CrawledContent objects to preprocess.
+
+        Returns:
+            List of PreprocessedContent objects, in input order.
+        """
+        if self.processes > 1 and len(contents) >= self.PARALLEL_THRESHOLD:
+            # The process pool does the work; one thread waits on it
+            return await asyncio.to_thread(self.preprocess_batch, contents)
+
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self.preprocess, content) for content in contents)
+        ))
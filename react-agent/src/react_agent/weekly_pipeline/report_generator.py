@@ -80,6 +80,14 @@ class ReportGenerator:
         ExpertRole.MRV_EXPERT: "📋",
     }
 
+    ROLE_NAMES: Dict[ExpertRole, str] = {
+        ExpertRole.POLICY_EXPERT: "정책/법규 전문가",
+        ExpertRole.CARBON_CREDIT_EXPERT: "탄소배출권 전문가",
+        ExpertRole.MARKET_EXPERT: "시장/거래 전문가",
+        ExpertRole.TECHNOLOGY_EXPERT: "감축기술 전문가",
+        ExpertRole.MRV_EXPERT: "MRV/검증 전문가",
+    }
+
     REPORT_TEMPLATE = """# 주간 탄소정책 브리핑
 
 **기간**: {start_date} ~ {end_date}
@@ -296,46 +304,37 @@ class ReportGenerator:
             icon = self.EXPERT_ICONS.get(role, "📌")
 
             # Format role name
-            role_names = {
-                ExpertRole.POLICY_EXPERT: "정책/법규 전문가",
-                ExpertRole.CARBON_CREDIT_EXPERT: "탄소배출권 전문가",
-                ExpertRole.MARKET_EXPERT: "시장/거래 전문가",
-                ExpertRole.TECHNOLOGY_EXPERT: "감축기술 전문가",
-                ExpertRole.MRV_EXPERT: "MRV/검증 전문가",
-            }
-            role_name = role_names.get(role, role.value)
-
-            # Format summaries
-            if section.summaries:
-                summaries = "\n".join(f"- {s}" for s in section.summaries)
-            else:
-                summaries = "- 요약 없음"
-
-            # Format key findings
-            if section.key_findings:
-                key_findings = "\n".join(f"- {f}" for f in section.key_findings)
-            else:
-                key_findings = "- 주요 발견 없음"
-
-            # Format implications
-            if section.implications:
-                implications = "\n".join(f"- {i}" for i in section.implications)
-            else:
-                implications = "- 시사점 없음"
+            role_name = self.ROLE_NAMES.get(role, role.value)
 
             section_md = self.EXPERT_SECTION_TEMPLATE.format(
                 icon=icon,
                 expert_name=section.expert_name,
                 role_name=role_name,
                 content_count=section.content_count,
-                summaries=summaries,
-                key_findings=key_findings,
-                implications=implications,
+                summaries=self._format_bullets(section.summaries, "요약 없음"),
+                key_findings=self._format_bullets(section.key_findings, "주요 발견 없음"),
+                implications=self._format_bullets(section.implications, "시사점 없음"),
             )
             sections_md.append(section_md)
 
         return "\n".join(sections_md)
 
+    @staticmethod
+    def _format_bullets(items: List[str], empty: str) -> str:
+        """Format items as a markdown bullet list.
+
+        Args:
+            items: Bullet texts.
+            empty: Text of the single bullet shown when there are no items.
+
+        Returns:
+            Markdown bullet list string.
+        """
+        if not items:
+            return f"- {empty}"
+        # One join builds every line; no f-string per item
+        return "- " + "\n- ".join(items)
+
     def save_report(self, report: WeeklyReport) -> str:
         """Save the report to a markdown file.
 
@@ -5,6 +5,7 @@ including domestic (Korean) official sources, international official sources,
 and media sources.
 """
 
+import os
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -168,7 +169,9 @@ MEDIA_SOURCES: List[SourceConfig] = [
 ]
 
 
-def create_crawler_from_config(config: SourceConfig) -> Optional[BaseCrawler]:
+def create_crawler_from_config(
+    config: SourceConfig, cache_dir: Optional[str] = None
+) -> Optional[BaseCrawler]:
     """Create a crawler instance from a source configuration.
 
     Creates an appropriate crawler based on the source configuration.
@@ -176,37 +179,51 @@ def create_crawler_from_config(config: SourceConfig) -> Optional[BaseCrawler]:
 
     Args:
         config: Source configuration to create crawler from.
+        cache_dir: Directory for the crawler's conditional GET validators,
+            one JSON file per source (default: None, in-memory only).
 
     Returns:
         A BaseCrawler instance if successful, None otherwise.
     """
     if config.rss_url:
+        cache_path = (
+            os.path.join(cache_dir, f"{config.name.replace(' ', '_')}.json")
+            if cache_dir
+            else None
+        )
         return RSSCrawler(
             name=config.name,
             base_url=config.base_url,
             rss_url=config.rss_url,
             source_type=config.source_type,
             language=config.language,
+            cache_path=cache_path,
         )
     # TODO: Add support for HTML list crawlers
     return None
 
 
-def get_default_registry() -> CrawlerRegistry:
+def get_default_registry(cache_dir: Optional[str] = None) -> CrawlerRegistry:
     """Create and return a default crawler registry with all configured sources.
 
     Creates a CrawlerRegistry and registers crawlers for all sources
     that have RSS feeds configured.
 
+    Args:
+        cache_dir: Directory persisting ETag/Last-Modified validators across
+            runs, created if missing (default: None, in-memory only).
+
     Returns:
         A CrawlerRegistry with all available crawlers registered.
     """
     registry = CrawlerRegistry()
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
 
     # Register all sources that can be crawled
     all_sources = get_all_sources()
     for config in all_sources:
-        crawler = create_crawler_from_config(config)
+        crawler = create_crawler_from_config(config, cache_dir)
         if crawler is not None:
             registry.register(crawler)
 
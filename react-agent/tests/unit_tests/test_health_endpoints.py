@@ -194,6 +194,21 @@ class TestGetMemoryUsage:
             assert isinstance(result["system_percent_used"], (int, float))
 
 
+class TestUtcTimestamp:
+    """Tests for utc_timestamp helper."""
+
+    def test_format_is_iso8601_utc(self):
+        """Timestamp should be ISO 8601 with microseconds and Z suffix."""
+        from datetime import datetime
+        from react_agent.server import utc_timestamp
+
+        ts = utc_timestamp()
+
+        assert ts.endswith("Z")
+        parsed = datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S.%fZ")
+        assert parsed.year >= 2024
+
+
 class TestHealthEndpoints:
     """Tests for health check endpoints using TestClient."""
 
@@ -244,6 +259,43 @@ class TestHealthEndpoints:
         assert "service" in data
 
 
+    def test_categories_etag_revalidation(self, client):
+        """/categories should return 304 when If-None-Match matches its ETag."""
+        first = client.get("/categories")
+        etag = first.headers["etag"]
+
+        assert "max-age" in first.headers["cache-control"]
+        second = client.get("/categories", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_assistant_echoes_id(self, client):
+        """/assistants/{id} should echo the requested ID, JSON-escaped."""
+        response = client.get('/assistants/a"b')
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["assistant_id"] == 'a"b'
+        assert data["graph_id"] == "agent"
+
+    def test_assistant_etag_revalidation(self, client):
+        """/assistants/{id} and its schemas should be immutable and revalidatable."""
+        for path in ("/assistants/agent", "/assistants/agent/schemas"):
+            first = client.get(path)
+            etag = first.headers["etag"]
+            assert "immutable" in first.headers["cache-control"]
+
+            second = client.get(path, headers={"If-None-Match": etag})
+            assert second.status_code == 304
+            assert second.content == b""
+
+    def test_thread_state_echoes_id(self, client):
+        """/threads/{id}/state should embed the thread ID in its config."""
+        response = client.get("/threads/t-9/state")
+
+        assert response.json()["config"]["configurable"]["thread_id"] == "t-9"
+
+
 class TestErrorResponses:
     """Tests for RFC 7807 error response format."""
 
@@ -0,0 +1,89 @@
+"""Unit tests for logging_config module.
+
+Tests for request context propagation into formatted log records.
+"""
+
+import json
+import logging
+import sys
+
+from react_agent.logging_config import (
+    DevelopmentFormatter,
+    JsonFormatter,
+    LogContextFilter,
+    clear_log_context,
+    set_log_context,
+)
+
+
+def _record(message: str = "hello") -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+class TestLogContextFilter:
+    """Tests for LogContextFilter."""
+
+    def teardown_method(self):
+        clear_log_context()
+
+    def test_context_captured_at_log_time(self):
+        """Context should be taken when the record is filtered, not when it is formatted."""
+        set_log_context(request_id="abc123")
+        record = _record()
+        assert LogContextFilter().filter(record) is True
+
+        clear_log_context()
+        output = json.loads(JsonFormatter().format(record))
+
+        assert output["context"] == {"request_id": "abc123"}
+        assert "extra" not in output
+
+    def test_development_formatter_uses_record_context(self):
+        """Development output should include the captured context."""
+        set_log_context(thread_id="t-1")
+        record = _record()
+        LogContextFilter().filter(record)
+        clear_log_context()
+
+        assert "thread_id=t-1" in DevelopmentFormatter(use_colors=False).format(record)
+
+    def test_unfiltered_record_falls_back_to_live_context(self):
+        """Records that bypassed the filter should still get the current context."""
+        set_log_context(request_id="live")
+
+        output = json.loads(JsonFormatter().format(_record()))
+
+        assert output["context"] == {"request_id": "live"}
+
+
+class TestQueueLogging:
+    """Tests for the QueueHandler/QueueListener setup."""
+
+    def test_root_logs_through_queue(self):
+        """setup_logging should install a queue handler backed by a running listener."""
+        from logging.handlers import QueueHandler
+
+        from react_agent import logging_config
+
+        logging_config.setup_logging(force_json=True)
+
+        handlers = logging.getLogger().handlers
+        assert len(handlers) == 1 and isinstance(handlers[0], QueueHandler)
+        assert logging_config._queue_listener is not None
+
+    def test_prepare_keeps_exc_info_for_formatter(self):
+        """Queued records should keep exc_info so the listener formats the traceback."""
+        import queue
+
+        from react_agent.logging_config import _ContextQueueHandler
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed %s", ("x",), sys.exc_info())
+
+        prepared = _ContextQueueHandler(queue.Queue()).prepare(record)
+
+        assert prepared.getMessage() == "failed x"
+        assert prepared.args is None
+        assert "ValueError: boom" in json.loads(JsonFormatter().format(prepared))["exception"]
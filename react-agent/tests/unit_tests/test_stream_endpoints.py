@@ -0,0 +1,346 @@
+"""Unit tests for the LangGraph Cloud compatible run/thread endpoints.
+
+Tests the SSE wire format of /threads/{thread_id}/runs/stream, the
+streaming branch of /threads/{thread_id}/runs and thread history with a
+mocked graph.
+"""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessageChunk, HumanMessage
+
+
+def _parse_sse(text: str):
+    """Parse an SSE body into a list of (event, data) tuples."""
+    events = []
+    for frame in text.split("\n\n"):
+        if not frame.strip() or frame.startswith(":"):
+            continue
+        event, data = None, None
+        for line in frame.split("\n"):
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+        events.append((event, data))
+    return events
+
+
+async def _fake_astream(graph_input, config=None, stream_mode=None):
+    """Yield a token chunk, a tool-call-only chunk and a values snapshot."""
+    yield ("messages", (AIMessageChunk(content="안녕"), {"langgraph_node": "agent"}))
+    yield ("messages", (AIMessageChunk(content="", tool_call_chunks=[
+        {"name": "search", "args": "", "id": "call_1", "index": 0}
+    ]), {}))
+    yield ("values", {"messages": [HumanMessage(content="hi")], "count": 1})
+
+
+@pytest.fixture
+def client():
+    """Create test client with a mocked graph."""
+    with patch("react_agent.server.graph") as mock_graph:
+        mock_graph.astream = _fake_astream
+        with patch("react_agent.server.get_rag_tool"):
+            from react_agent.server import app
+            yield TestClient(app)
+
+
+def _payload(stream: bool = False):
+    return {
+        "input": {"messages": [{"type": "human", "content": [{"type": "text", "text": "hi"}]}]},
+        "config": {"configurable": {"model": "claude-haiku-4-5"}},
+        "stream": stream,
+    }
+
+
+class TestRunsStream:
+    """Tests for POST /threads/{thread_id}/runs/stream."""
+
+    def test_event_sequence(self, client):
+        """Stream should emit metadata, messages, values and end in order."""
+        response = client.post("/threads/t-1/runs/stream", json=_payload())
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        names = [name for name, _ in events]
+        assert names == ["metadata", "messages", "values", "end"]
+
+    def test_metadata_frame(self, client):
+        """Metadata frame should carry run_id and thread_id."""
+        response = client.post("/threads/t-1/runs/stream", json=_payload())
+
+        _, metadata = _parse_sse(response.text)[0]
+        assert metadata["thread_id"] == "t-1"
+        assert metadata["run_id"]
+
+    def test_messages_frame_preserves_unicode(self, client):
+        """Token frames should be [message, metadata] with raw UTF-8 text."""
+        response = client.post("/threads/t-1/runs/stream", json=_payload())
+
+        assert "안녕" in response.text
+        _, (msg, metadata) = _parse_sse(response.text)[1]
+        assert msg["content"] == [{"type": "text", "text": "안녕"}]
+        assert metadata["langgraph_node"] == "agent"
+
+    def test_values_frame(self, client):
+        """Values frame should contain serialized state."""
+        response = client.post("/threads/t-1/runs/stream", json=_payload())
+
+        _, values = _parse_sse(response.text)[2]
+        assert values["count"] == 1
+        assert values["messages"][0]["content"] == [{"type": "text", "text": "hi"}]
+
+    def test_graph_config(self):
+        """Graph config should carry model, category and thread_id."""
+        captured = {}
+
+        async def capture_astream(graph_input, config=None, stream_mode=None):
+            captured.update(config)
+            yield ("values", {"count": 1})
+
+        payload = _payload()
+        payload["config"] = {}
+        payload["input"]["context"] = {"category": "탄소배출권"}
+        with patch("react_agent.server.graph") as mock_graph:
+            mock_graph.astream = capture_astream
+            from react_agent.server import app
+            TestClient(app).post("/threads/t-5/runs/stream", json=payload)
+
+        assert captured == {"configurable": {
+            "model": "claude-haiku-4-5", "category": "탄소배출권", "thread_id": "t-5"
+        }}
+
+
+    def test_completion_log_fields_structured(self, client, caplog):
+        """The completion record should carry duration and chunk count as fields."""
+        import logging
+
+        with caplog.at_level(logging.INFO, logger="react_agent.server"):
+            client.post("/threads/t-1/runs/stream", json=_payload())
+
+        record = next(r for r in caplog.records if r.getMessage() == "Stream completed")
+        assert record.chunk_count == 3
+        assert isinstance(record.duration_seconds, float)
+
+
+class TestValuesEncoder:
+    """Tests for per-key reuse of values-mode JSON fragments."""
+
+    def test_matches_full_serialization(self):
+        """Frames should decode to the same payload as a one-shot dump."""
+        from react_agent.server import _ValuesEncoder
+
+        state = {"messages": [HumanMessage(content="hi")], "count": 1, "context": None}
+        _, values = _parse_sse(_ValuesEncoder().frame(state).decode())[0]
+
+        assert values["count"] == 1
+        assert values["context"] is None
+        assert values["messages"][0]["content"] == [{"type": "text", "text": "hi"}]
+
+    def test_in_place_mutation_re_encoded(self):
+        """A list or dict mutated in place and returned again must not go stale."""
+        from react_agent.server import _ValuesEncoder
+
+        items = [0]
+        meta = {"step": 1}
+        encoder = _ValuesEncoder()
+        encoder.frame({"items": items, "meta": meta})
+        items.append(1)
+        meta["step"] = 2
+        _, values = _parse_sse(encoder.frame({"items": items, "meta": meta}).decode())[0]
+
+        assert values == {"items": [0, 1], "meta": {"step": 2}}
+
+    def test_same_id_message_replacement_re_encoded(self):
+        """A message replaced under the same id must not send the old content."""
+        from langchain_core.messages import AIMessage
+        from react_agent.server import _ValuesEncoder
+
+        encoder = _ValuesEncoder()
+        encoder.frame({"messages": [AIMessage(content="draft", id="m1")]})
+        frame = encoder.frame({"messages": [AIMessage(content="final", id="m1")]})
+        _, values = _parse_sse(frame.decode())[0]
+
+        assert values["messages"][0]["content"] == [{"type": "text", "text": "final"}]
+
+    def test_equal_scalars_of_other_type_not_reused(self):
+        """True and 1 compare equal but must keep their own JSON."""
+        from react_agent.server import _ValuesEncoder
+
+        encoder = _ValuesEncoder()
+        encoder.frame({"flag": 1})
+        _, values = _parse_sse(encoder.frame({"flag": True}).decode())[0]
+
+        assert values["flag"] is True
+
+
+class TestRunsStreamingBranch:
+    """Tests for POST /threads/{thread_id}/runs with stream=True."""
+
+    def test_event_sequence(self, client):
+        """Streaming run should emit the same frame sequence."""
+        response = client.post("/threads/t-2/runs", json=_payload(stream=True))
+
+        assert response.status_code == 200
+        names = [name for name, _ in _parse_sse(response.text)]
+        assert names == ["metadata", "messages", "values", "end"]
+
+
+class TestRunsNonStreaming:
+    """Tests for POST /threads/{thread_id}/runs with stream=False."""
+
+    def test_run_envelope(self):
+        """Run response should wrap the final state with run metadata."""
+        from unittest.mock import AsyncMock
+
+        with patch("react_agent.server.graph") as mock_graph:
+            mock_graph.ainvoke = AsyncMock(return_value={"messages": [HumanMessage(content="hi")]})
+            from react_agent.server import app
+            response = TestClient(app).post("/threads/t-8/runs", json=_payload())
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["thread_id"] == "t-8"
+        assert data["status"] == "success"
+        assert data["run_id"]
+        assert data["values"]["messages"][0]["content"] == [{"type": "text", "text": "hi"}]
+
+
+class TestStreamErrors:
+    """Both run endpoints should report graph failures as an SSE error frame."""
+
+    @pytest.mark.parametrize("path,stream", [
+        ("/threads/t-6/runs/stream", False),
+        ("/threads/t-6/runs", True),
+    ])
+    def test_error_frame(self, path, stream):
+        """A failing graph should end the stream with metadata then error."""
+        async def failing_astream(graph_input, config=None, stream_mode=None):
+            raise RuntimeError("boom")
+            yield
+
+        with patch("react_agent.server.graph") as mock_graph:
+            mock_graph.astream = failing_astream
+            from react_agent.server import app
+            response = TestClient(app).post(path, json=_payload(stream=stream))
+
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["metadata", "error"]
+        assert events[1][1]["error"] == "boom"
+
+    def test_error_counted_once_per_failure(self):
+        """Stream failures should increment the memoized ERROR_COUNT child."""
+        from react_agent import server
+
+        async def failing_astream(graph_input, config=None, stream_mode=None):
+            raise RuntimeError("boom")
+            yield
+
+        with patch("react_agent.server.graph") as mock_graph:
+            mock_graph.astream = failing_astream
+            client = TestClient(server.app)
+            client.post("/threads/t-7/runs/stream", json=_payload())
+            child = server._ERROR_COUNT_CHILDREN[("RuntimeError", "/threads/runs/stream")]
+            before = child._value.get()
+            client.post("/threads/t-7/runs/stream", json=_payload())
+
+        assert child._value.get() == before + 1
+
+
+class TestKeepAlive:
+    """Tests for SSE keep-alive pings while the graph is idle."""
+
+    def test_ping_sent_while_idle(self):
+        """An idle graph should produce ': ping' comment frames."""
+        import asyncio
+
+        async def slow_astream(graph_input, config=None, stream_mode=None):
+            await asyncio.sleep(0.05)
+            yield ("values", {"count": 1})
+
+        with patch("react_agent.server.graph") as mock_graph, \
+                patch("react_agent.server.SSE_PING_INTERVAL_SECONDS", 0.01):
+            mock_graph.astream = slow_astream
+            from react_agent.server import app
+            response = TestClient(app).post("/threads/t-3/runs/stream", json=_payload())
+
+        assert ": ping\n\n" in response.text
+        names = [name for name, _ in _parse_sse(response.text)]
+        assert names == ["metadata", "values", "end"]
+
+
+class TestFrameCoalescing:
+    """Tests for batching of token frames into fewer writes."""
+
+    def _pace(self, frames):
+        import asyncio
+        from react_agent.server import _pace_frames
+
+        async def source():
+            for frame in frames:
+                yield frame
+
+        async def collect():
+            return [chunk async for chunk in _pace_frames(source())]
+
+        return asyncio.run(collect())
+
+    def test_token_frames_coalesced_in_order(self):
+        """Consecutive messages frames should be flushed together with the next frame."""
+        frames = [
+            b"event: metadata\ndata: {}\n\n",
+            b'event: messages\ndata: ["a"]\n\n',
+            b'event: messages\ndata: ["b"]\n\n',
+            b"event: end\ndata: {}\n\n",
+        ]
+
+        chunks = self._pace(frames)
+
+        assert chunks == [frames[0], b"".join(frames[1:])]
+
+    def test_buffer_flushed_at_size_limit(self):
+        """A buffer reaching SSE_COALESCE_BYTES should be flushed immediately."""
+        from react_agent.server import SSE_COALESCE_BYTES
+
+        frame = b'event: messages\ndata: ["' + b"x" * SSE_COALESCE_BYTES + b'"]\n\n'
+
+        chunks = self._pace([frame, frame])
+
+        assert chunks == [frame, frame]
+
+
+class TestThreadHistory:
+    """Tests for /threads/{thread_id}/history."""
+
+    def _state(self, checkpoint_id):
+        state = MagicMock()
+        state.values = {"messages": [HumanMessage(content="hi")]}
+        state.config = {"configurable": {"thread_id": "t-4", "checkpoint_id": checkpoint_id}}
+        return state
+
+    def test_history_cached_per_checkpoint(self):
+        """Repeat polls of the same checkpoint should skip re-serialization."""
+        from react_agent import server
+
+        server._HISTORY_CACHE.clear()
+        with patch("react_agent.server.graph") as mock_graph, \
+                patch("react_agent.server.message_to_dict", wraps=server.message_to_dict) as spy:
+            mock_graph.get_state.return_value = self._state("cp-1")
+            client = TestClient(server.app)
+
+            first = client.get("/threads/t-4/history")
+            second = client.get("/threads/t-4/history")
+            assert spy.call_count == 1
+
+            mock_graph.get_state.return_value = self._state("cp-2")
+            client.get("/threads/t-4/history")
+            assert spy.call_count == 2
+
+        assert first.json() == second.json()
+        snapshot = first.json()[0]
+        assert snapshot["values"]["messages"][0]["content"] == [{"type": "text", "text": "hi"}]
+        assert snapshot["config"] == {"configurable": {"thread_id": "t-4"}}
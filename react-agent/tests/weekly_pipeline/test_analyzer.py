@@ -3,10 +3,12 @@
 Tests run without LLM calls - focuses on structure and parsing logic.
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from langchain_core.messages import AIMessageChunk
 
 from react_agent.agents.expert_panel.config import ExpertRole
 from react_agent.weekly_pipeline.analyzer import (
@@ -19,6 +21,21 @@ from react_agent.weekly_pipeline.crawler import CrawledContent
 from react_agent.weekly_pipeline.preprocessor import PreprocessedContent
 
 
+def _stream_chunks(ainvoke, size=5):
+    """Serve an ainvoke-style mock through astream in small text chunks.
+
+    The mock still records one call per stream, and the chunk size splits
+    section headers across chunk boundaries.
+    """
+    async def astream(messages):
+        response = await ainvoke(messages)
+        text = response.content
+        for start in range(0, len(text), size):
+            yield AIMessageChunk(content=text[start:start + size])
+
+    return astream
+
+
 class TestAnalysisResult:
     """Test AnalysisResult dataclass."""
 
@@ -205,6 +222,62 @@ NDC 목표 상향
         assert len(result.key_findings) >= 1
         assert len(result.implications) >= 1
 
+    def test_parse_sections_single_pass(self, analyzer):
+        """Test that _parse_sections splits every header into its own section."""
+        response = """서문
+## 요약
+요약 본문
+
+## 주요 발견
+- 발견 A
+* 발견 B
+
+## 시사점
+- 시사점 A"""
+        sections = analyzer._parse_sections(response)
+
+        assert sections == {
+            "요약": "요약 본문",
+            "주요 발견": "- 발견 A\n* 발견 B",
+            "시사점": "- 시사점 A",
+        }
+        assert analyzer._parse_list_items(sections["주요 발견"]) == ["발견 A", "발견 B"]
+        assert analyzer._extract_section(response, "없음") == ""
+
+    def test_parse_analysis_deeper_headers(self, analyzer, sample_preprocessed_content):
+        """Test that ### headers parse like ## headers."""
+        from react_agent.weekly_pipeline.analyzer import _SectionStreamParser
+
+        response = "### 요약\n요약 본문입니다.\n\n### 주요 발견\n- 발견1\n- 발견2\n\n#### 시사점\n- 시사1\n"
+
+        result = analyzer._parse_analysis(
+            response=response,
+            expert_role=ExpertRole.POLICY_EXPERT,
+            content=sample_preprocessed_content,
+        )
+
+        assert result.summary == "요약 본문입니다."
+        assert result.key_findings == ["발견1", "발견2"]
+        assert result.implications == ["시사1"]
+        parser = _SectionStreamParser()
+        parser.feed(response)
+        assert parser.close()[1] == analyzer._parse_sections(response)
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 1000])
+    def test_stream_parser_matches_batch_parser(self, analyzer, size):
+        """Test that incremental parsing equals _parse_sections for any chunking."""
+        from react_agent.weekly_pipeline.analyzer import _SectionStreamParser
+
+        response = "서문\n## 요약\n요약 본문\n\n## 주요 발견\n- 발견 A\n## 요약\n중복\n## 시사점\n- 시사점 A"
+        parser = _SectionStreamParser()
+        for start in range(0, len(response), size):
+            parser.feed(response[start:start + size])
+
+        text, sections = parser.close()
+
+        assert text == response
+        assert sections == analyzer._parse_sections(response)
+
     def test_parse_analysis_empty_response(
         self, analyzer, sample_preprocessed_content
     ):
@@ -258,6 +331,7 @@ NDC 목표 상향
         ) as mock_chat:
             mock_instance = MagicMock()
             mock_instance.ainvoke = AsyncMock(return_value=mock_response)
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
             mock_chat.return_value = mock_instance
 
             # Create a new analyzer with the mocked LLM
@@ -271,6 +345,165 @@ NDC 목표 상향
             assert result.expert_role == ExpertRole.POLICY_EXPERT
             mock_instance.ainvoke.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_analyze_caches_expert_prefix(
+        self, sample_preprocessed_content
+    ):
+        """Test that the expert prefix is a cached system block and content goes last."""
+        mock_response = MagicMock()
+        mock_response.content = "## 요약\n결과"
+        with patch(
+            "react_agent.weekly_pipeline.analyzer.ChatAnthropic"
+        ) as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = AsyncMock(return_value=mock_response)
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
+            mock_chat.return_value = mock_instance
+
+            test_analyzer = ExpertAnalyzer()
+            await test_analyzer.analyze(
+                content=sample_preprocessed_content,
+                expert_role=ExpertRole.POLICY_EXPERT,
+            )
+
+            system, human = mock_instance.ainvoke.call_args.args[0]
+            block = system.content[0]
+            assert block["cache_control"] == {"type": "ephemeral"}
+            assert "## 응답 형식" in block["text"]
+            assert sample_preprocessed_content.clean_title not in block["text"]
+            assert sample_preprocessed_content.clean_title in human.content
+            assert system.content == test_analyzer._system_blocks[ExpertRole.POLICY_EXPERT]
+
+    @pytest.mark.asyncio
+    async def test_analyze_reuses_cached_result(
+        self, sample_preprocessed_content
+    ):
+        """Test that a repeated (expert, content) pair skips the LLM call."""
+        mock_response = MagicMock()
+        mock_response.content = "## 요약\n결과"
+        with patch(
+            "react_agent.weekly_pipeline.analyzer.ChatAnthropic"
+        ) as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = AsyncMock(return_value=mock_response)
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
+            mock_chat.return_value = mock_instance
+
+            test_analyzer = ExpertAnalyzer()
+            first = await test_analyzer.analyze(
+                sample_preprocessed_content, ExpertRole.POLICY_EXPERT
+            )
+            second = await test_analyzer.analyze(
+                sample_preprocessed_content, ExpertRole.POLICY_EXPERT
+            )
+            await test_analyzer.analyze(
+                sample_preprocessed_content, ExpertRole.MARKET_EXPERT
+            )
+
+        assert second is first
+        assert mock_instance.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_does_not_cache_errors(
+        self, sample_preprocessed_content
+    ):
+        """Test that failed analyses are retried on the next call."""
+        with patch(
+            "react_agent.weekly_pipeline.analyzer.ChatAnthropic"
+        ) as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = AsyncMock(side_effect=ValueError("bad request"))
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
+            mock_chat.return_value = mock_instance
+
+            test_analyzer = ExpertAnalyzer()
+            for _ in range(2):
+                result = await test_analyzer.analyze(
+                    sample_preprocessed_content, ExpertRole.POLICY_EXPERT
+                )
+                assert result.error is not None
+
+        assert mock_instance.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_does_not_cache_empty_results(
+        self, sample_preprocessed_content
+    ):
+        """Test that a response with no sections is retried on the next call."""
+        mock_response = MagicMock()
+        mock_response.content = ""
+        with patch(
+            "react_agent.weekly_pipeline.analyzer.ChatAnthropic"
+        ) as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = AsyncMock(return_value=mock_response)
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
+            mock_chat.return_value = mock_instance
+
+            test_analyzer = ExpertAnalyzer()
+            for _ in range(2):
+                result = await test_analyzer.analyze(
+                    sample_preprocessed_content, ExpertRole.POLICY_EXPERT
+                )
+                assert result.confidence == 0.0
+
+        assert mock_instance.ainvoke.call_count == 2
+
+    @pytest.mark.parametrize(
+        "confidence,needs_meeting,length,fast",
+        [
+            (0.8, False, 100, True),
+            (0.5, False, 100, False),
+            (0.8, True, 100, False),
+            (0.8, False, 5000, False),
+        ],
+    )
+    def test_select_llm_routes_easy_contents_to_fast_model(
+        self, sample_preprocessed_content, confidence, needs_meeting, length, fast
+    ):
+        """Test that only short, confident single-expert contents use the fast model."""
+        with patch("react_agent.weekly_pipeline.analyzer.ChatAnthropic") as mock_chat:
+            mock_chat.side_effect = lambda model, **kwargs: MagicMock(model=model)
+            test_analyzer = ExpertAnalyzer()
+
+        sample_preprocessed_content.clean_content = "가" * length
+        classification = ClassificationResult(
+            primary_expert=ExpertRole.POLICY_EXPERT,
+            primary_score=0.5,
+            confidence=confidence,
+            needs_llm_meeting=needs_meeting,
+        )
+
+        llm = test_analyzer._select_llm(sample_preprocessed_content, classification)
+
+        assert llm is (test_analyzer.llm_fast if fast else test_analyzer.llm)
+        assert test_analyzer._select_llm(sample_preprocessed_content, None) is test_analyzer.llm
+
+    @pytest.mark.asyncio
+    async def test_analyze_truncates_long_content(
+        self, sample_preprocessed_content
+    ):
+        """Test that content beyond max_content_chars is cut at a paragraph break."""
+        mock_response = MagicMock()
+        mock_response.content = "## 요약\n결과"
+        sample_preprocessed_content.clean_content = "첫 문단\n\n" + "가" * 100
+        with patch(
+            "react_agent.weekly_pipeline.analyzer.ChatAnthropic"
+        ) as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = AsyncMock(return_value=mock_response)
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
+            mock_chat.return_value = mock_instance
+
+            test_analyzer = ExpertAnalyzer(max_content_chars=50)
+            await test_analyzer.analyze(
+                sample_preprocessed_content, ExpertRole.POLICY_EXPERT
+            )
+
+        _, human = mock_instance.ainvoke.call_args.args[0]
+        assert human.content.endswith("첫 문단\n\n[...이하 생략...]\n")
+        assert "가" not in human.content
+
     @pytest.mark.asyncio
     async def test_analyze_handles_llm_error(
         self, analyzer, sample_preprocessed_content
@@ -281,6 +514,7 @@ NDC 목표 상향
         ) as mock_chat:
             mock_instance = MagicMock()
             mock_instance.ainvoke = AsyncMock(side_effect=Exception("API 오류"))
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
             mock_chat.return_value = mock_instance
 
             # Create a new analyzer with the mocked LLM
@@ -294,6 +528,83 @@ NDC 목표 상향
             assert result.error is not None
             assert "API 오류" in result.error or "오류" in result.error
 
+    @staticmethod
+    def _api_error(error_cls, status_code):
+        import httpx
+
+        response = httpx.Response(
+            status_code, request=httpx.Request("POST", "https://api.anthropic.com")
+        )
+        return error_cls("error", response=response, body=None)
+
+    @pytest.mark.asyncio
+    async def test_analyze_retries_transient_errors(
+        self, sample_preprocessed_content
+    ):
+        """Test that rate-limit errors are retried with backoff before succeeding."""
+        import anthropic
+
+        mock_response = MagicMock()
+        mock_response.content = "## 요약\n재시도 결과"
+        rate_limited = self._api_error(anthropic.RateLimitError, 429)
+
+        with patch(
+            "react_agent.weekly_pipeline.analyzer.ChatAnthropic"
+        ) as mock_chat, patch(
+            "react_agent.weekly_pipeline.analyzer.asyncio.sleep", new=AsyncMock()
+        ) as mock_sleep:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = AsyncMock(
+                side_effect=[rate_limited, rate_limited, mock_response]
+            )
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
+            mock_chat.return_value = mock_instance
+
+            test_analyzer = ExpertAnalyzer(retry_attempts=3)
+            result = await test_analyzer.analyze(
+                content=sample_preprocessed_content,
+                expert_role=ExpertRole.POLICY_EXPERT,
+            )
+
+        assert result.error is None
+        assert result.summary == "재시도 결과"
+        assert mock_instance.ainvoke.call_count == 3
+        assert mock_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_does_not_retry_client_errors(
+        self, sample_preprocessed_content
+    ):
+        """Test that non-retryable API errors fail on the first attempt."""
+        import anthropic
+
+        bad_request = self._api_error(anthropic.BadRequestError, 400)
+
+        with patch(
+            "react_agent.weekly_pipeline.analyzer.ChatAnthropic"
+        ) as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = AsyncMock(side_effect=bad_request)
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
+            mock_chat.return_value = mock_instance
+
+            test_analyzer = ExpertAnalyzer(retry_attempts=3)
+            result = await test_analyzer.analyze(
+                content=sample_preprocessed_content,
+                expert_role=ExpertRole.POLICY_EXPERT,
+            )
+
+        assert result.error is not None
+        assert mock_instance.ainvoke.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_with_retry_without_attempts_raises(self, analyzer):
+        """Test that zero attempts raise instead of returning None."""
+        analyzer.retry_attempts = 0
+
+        with pytest.raises(ValueError, match="retry_attempts"):
+            await analyzer._stream_with_retry(analyzer.llm, [])
+
     @pytest.mark.asyncio
     async def test_analyze_batch_mocked(
         self,
@@ -317,6 +628,7 @@ NDC 목표 상향
         ) as mock_chat:
             mock_instance = MagicMock()
             mock_instance.ainvoke = AsyncMock(return_value=mock_response)
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
             mock_chat.return_value = mock_instance
 
             # Create a new analyzer with the mocked LLM
@@ -382,6 +694,7 @@ NDC 목표 상향
         ) as mock_chat:
             mock_instance = MagicMock()
             mock_instance.ainvoke = AsyncMock(return_value=mock_response)
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
             mock_chat.return_value = mock_instance
 
             # Create a new analyzer with the mocked LLM
@@ -398,6 +711,159 @@ NDC 목표 상향
             assert results[2].expert_role == ExpertRole.TECHNOLOGY_EXPERT
 
 
+    @pytest.mark.asyncio
+    async def test_analyze_batch_groups_by_expert(
+        self,
+        sample_preprocessed_content,
+    ):
+        """Test that each expert bucket's first request completes before the rest start."""
+        mock_response = MagicMock()
+        mock_response.content = "## 요약\n결과"
+        roles = [
+            ExpertRole.POLICY_EXPERT,
+            ExpertRole.MARKET_EXPERT,
+            ExpertRole.POLICY_EXPERT,
+            ExpertRole.POLICY_EXPERT,
+        ]
+        contents = [
+            PreprocessedContent(
+                original=sample_preprocessed_content.original,
+                clean_content=f"내용 {i}",
+                clean_title=f"제목 {i}",
+                language="ko",
+                word_count=2,
+                content_hash=f"hash-{i}",
+            )
+            for i in range(len(roles))
+        ]
+        classifications = [
+            ClassificationResult(primary_expert=role, primary_score=0.8)
+            for role in roles
+        ]
+        events = []
+
+        async def fake_ainvoke(messages):
+            title = messages[1].content.split("제목: ")[1].split("\n")[0]
+            events.append(("start", title))
+            await asyncio.sleep(0)
+            events.append(("end", title))
+            return mock_response
+
+        with patch(
+            "react_agent.weekly_pipeline.analyzer.ChatAnthropic"
+        ) as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = fake_ainvoke
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
+            mock_chat.return_value = mock_instance
+
+            test_analyzer = ExpertAnalyzer()
+            results = await test_analyzer.analyze_batch(
+                contents=contents,
+                classifications=classifications,
+            )
+
+        # Results keep input order
+        assert [r.content_id for r in results] == [c.content_hash for c in contents]
+        assert [r.expert_role for r in results] == roles
+        # The policy bucket's first request finished before the rest started
+        assert events.index(("end", "제목 0")) < events.index(("start", "제목 2"))
+        assert events.index(("end", "제목 0")) < events.index(("start", "제목 3"))
+
+
+    @pytest.mark.asyncio
+    async def test_analyze_batch_deduplicates_contents(
+        self,
+        sample_preprocessed_content,
+        sample_classification_result,
+    ):
+        """Test that repeated contents in one batch share a single LLM call."""
+        mock_response = MagicMock()
+        mock_response.content = "## 요약\n결과"
+        calls = 0
+
+        async def fake_ainvoke(messages):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return mock_response
+
+        with patch(
+            "react_agent.weekly_pipeline.analyzer.ChatAnthropic"
+        ) as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = fake_ainvoke
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
+            mock_chat.return_value = mock_instance
+
+            other = PreprocessedContent(
+                original=sample_preprocessed_content.original,
+                clean_content="다른 내용",
+                clean_title="다른 제목",
+                language="ko",
+                word_count=2,
+                content_hash="other-hash",
+            )
+            test_analyzer = ExpertAnalyzer()
+            results = await test_analyzer.analyze_batch(
+                contents=[other] + [sample_preprocessed_content] * 3,
+                classifications=[sample_classification_result] * 4,
+            )
+
+        assert len(results) == 4
+        assert results[1] is results[2] is results[3]
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_batch_bounded_concurrency(
+        self,
+        sample_preprocessed_content,
+        sample_classification_result,
+    ):
+        """Test that in-flight LLM calls never exceed max_concurrency."""
+        mock_response = MagicMock()
+        mock_response.content = "## 요약\n결과"
+        in_flight = 0
+        peak = 0
+
+        async def fake_ainvoke(messages):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return mock_response
+
+        with patch(
+            "react_agent.weekly_pipeline.analyzer.ChatAnthropic"
+        ) as mock_chat:
+            mock_instance = MagicMock()
+            mock_instance.ainvoke = fake_ainvoke
+            mock_instance.astream = _stream_chunks(mock_instance.ainvoke)
+            mock_chat.return_value = mock_instance
+
+            contents = [
+                PreprocessedContent(
+                    original=sample_preprocessed_content.original,
+                    clean_content=f"내용 {i}",
+                    clean_title=f"제목 {i}",
+                    language="ko",
+                    word_count=2,
+                    content_hash=f"hash-{i}",
+                )
+                for i in range(10)
+            ]
+            test_analyzer = ExpertAnalyzer(max_concurrency=2, batch_size=4)
+            results = await test_analyzer.analyze_batch(
+                contents=contents,
+                classifications=[sample_classification_result] * 10,
+            )
+
+        assert len(results) == 10
+        assert all(r.error is None for r in results)
+        assert peak == 2
+
+
 class TestAnalysisPrompt:
     """Test ANALYSIS_PROMPT template."""
 
@@ -421,3 +887,16 @@ class TestAnalysisPrompt:
         assert "테스트 제목" in formatted
         assert "테스트 출처" in formatted
         assert "테스트 내용" in formatted
+
+    def test_content_prompt_render_matches_format(self):
+        """Test that the pre-split content prompt renders like str.format."""
+        from react_agent.weekly_pipeline.analyzer import (
+            ANALYSIS_CONTENT_PROMPT,
+            _render_content_prompt,
+        )
+
+        rendered = _render_content_prompt("제목 {x}", "출처", "내용 {}")
+
+        assert rendered == ANALYSIS_CONTENT_PROMPT.format(
+            title="제목 {x}", source="출처", content="내용 {}"
+        )
@@ -212,6 +212,48 @@ class TestRuleBasedClassifier:
         assert score == 0.0
         assert matched == []
 
+    def test_classify_no_match_uses_default(self, classifier):
+        """Test that unmatched content gets the default expert and needs a meeting."""
+        result = classifier.classify("오늘 날씨가 좋습니다")
+
+        assert result.primary_expert == classifier.DEFAULT_EXPERT
+        assert result.confidence == 0.0
+        assert result.needs_llm_meeting is True
+        assert result.matched_keywords == {}
+        assert set(result.all_scores) == set(classifier.expert_keywords)
+        assert result.reason.endswith("기본 할당")
+
+    def test_ascii_keywords_match_whole_tokens(self, classifier):
+        """Test that ASCII keywords match tokens, including before Korean particles."""
+        result = classifier.classify("NDC에 따른 scope 산정")
+        policy = result.matched_keywords.get(ExpertRole.POLICY_EXPERT, [])
+
+        assert "NDC" in policy
+        assert "COP" not in policy
+
+    @pytest.mark.parametrize("text,expert,keyword", [
+        ("Countries updated their NDCs", ExpertRole.POLICY_EXPERT, "NDC"),
+        ("Trading of ITMOs and CERs", ExpertRole.CARBON_CREDIT_EXPERT, "CER"),
+        ("EUAs fell 3%", ExpertRole.MARKET_EXPERT, "EUA"),
+    ])
+    def test_plural_acronyms_match(self, classifier, text, expert, keyword):
+        """Test that pluralised acronyms still match their keyword."""
+        result = classifier.classify(text)
+
+        assert result.primary_expert == expert
+        assert keyword in result.matched_keywords[expert]
+
+    @pytest.mark.parametrize("text,expert,keyword", [
+        ("COP28 합의 발표", ExpertRole.POLICY_EXPERT, "COP"),
+        ("Scope1 배출량 보고", ExpertRole.MRV_EXPERT, "Scope"),
+    ])
+    def test_numbered_acronyms_match(self, classifier, text, expert, keyword):
+        """Test that acronyms followed by digits still match their keyword."""
+        result = classifier.classify(text)
+
+        assert result.primary_expert == expert
+        assert keyword in result.matched_keywords[expert]
+
     def test_classify_batch(self, classifier):
         """Test batch classification of multiple texts."""
         texts = [
@@ -234,6 +276,27 @@ class TestRuleBasedClassifier:
 
         assert results == []
 
+    def test_automaton_matches_substring_scan(self, classifier):
+        """Test that the Aho-Corasick path yields the same result as the substring scan."""
+        if classifier._automaton is None:
+            pytest.skip("pyahocorasick not installed")
+
+        fallback = RuleBasedClassifier()
+        fallback._automaton = None
+        texts = [
+            "파리협정 NDC 정책 분석과 EU ETS 가격 동향",
+            "CCUS 탄소포집 기술 및 MRV 검증 체계",
+            "COP28 scope 3 K-ETS 배출권",
+            "오늘 날씨가 좋습니다",
+            "",
+        ]
+
+        for text in texts:
+            fast, slow = classifier.classify(text), fallback.classify(text)
+            assert fast.all_scores == slow.all_scores
+            assert fast.matched_keywords == slow.matched_keywords
+            assert fast.primary_expert == slow.primary_expert
+
     def test_thresholds(self, classifier):
         """Test that thresholds are set correctly."""
         assert classifier.LOW_CONFIDENCE_THRESHOLD == 0.3
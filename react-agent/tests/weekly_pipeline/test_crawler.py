@@ -169,6 +169,39 @@ class TestCrawlerRegistry:
         assert content1 in all_content
         assert content2 in all_content
 
+    @pytest.mark.asyncio
+    async def test_crawl_all_runs_concurrently_and_skips_failures(self):
+        """Test that crawlers overlap and a failing crawler does not stop the rest."""
+        import asyncio
+
+        registry = CrawlerRegistry()
+        content = CrawledContent(
+            title="Article",
+            content="Content",
+            url="https://example.com/1",
+            source="slow",
+            published_date=datetime.now(),
+        )
+        failing_started = asyncio.Event()
+
+        async def slow_crawl(days_back=7):
+            # Sequential crawling would time out here: the failing crawler
+            # has not been started yet
+            await asyncio.wait_for(failing_started.wait(), timeout=1)
+            return [content]
+
+        async def failing_crawl(days_back=7):
+            failing_started.set()
+            raise RuntimeError("feed down")
+
+        for name, crawl in (("slow", slow_crawl), ("failing", failing_crawl)):
+            crawler = MagicMock(spec=BaseCrawler)
+            crawler.name = name
+            crawler.crawl = crawl
+            registry.register(crawler)
+
+        assert await registry.crawl_all(days_back=7) == [content]
+
     @pytest.mark.asyncio
     async def test_close_all(self):
         """Test closing all crawlers."""
@@ -193,6 +226,42 @@ class TestCrawlerRegistry:
         mock_crawler2.close.assert_called_once()
 
 
+    @pytest.mark.asyncio
+    async def test_registered_crawlers_share_client(self):
+        """Test that registered crawlers share one client closed by close_all."""
+        registry = CrawlerRegistry()
+        crawlers = [
+            RSSCrawler(
+                name=f"rss{i}",
+                base_url="https://example.com",
+                rss_url=f"https://example.com/{i}.xml",
+                source_type="rss",
+                timeout=5.0 * (i + 1),
+            )
+            for i in range(2)
+        ]
+        for crawler in crawlers:
+            registry.register(crawler)
+
+        shared = await crawlers[0]._get_client()
+        assert await crawlers[1]._get_client() is shared
+
+        response = MagicMock()
+        response.text = "<rss/>"
+        with patch.object(shared, "get", AsyncMock(return_value=response)) as mock_get:
+            await crawlers[1].fetch_page("https://example.com/1.xml")
+        # The shared client still honours each crawler's own timeout
+        mock_get.assert_called_once_with("https://example.com/1.xml", timeout=10.0)
+
+        await crawlers[0].close()
+        assert not shared.is_closed
+
+        await registry.close_all()
+        assert shared.is_closed
+        assert registry.get_client() is not shared
+        await registry.close_all()
+
+
 class TestRSSCrawler:
     """Test RSSCrawler class."""
 
@@ -225,6 +294,187 @@ class TestRSSCrawler:
 
         assert crawler.timeout == 60.0
 
+    @staticmethod
+    def _feed_bytes():
+        """An EUC-KR encoded RSS 2.0 feed with one recent and one stale item."""
+        from datetime import timedelta
+        from email.utils import format_datetime
+
+        recent = format_datetime(datetime.now().astimezone())
+        stale = format_datetime((datetime.now() - timedelta(days=60)).astimezone())
+        return f"""<?xml version="1.0" encoding="EUC-KR"?>
+<rss version="2.0"><channel>
+<item><title>배출권 할당 발표</title><link>https://example.com/1</link>
+<description>본문</description><pubDate>{recent}</pubDate><category>정책</category></item>
+<item><title>오래된 기사</title><link>https://example.com/2</link>
+<pubDate>{stale}</pubDate></item>
+</channel></rss>""".encode("euc-kr")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_lxml", [False, True])
+    async def test_crawl_parses_feed_bytes(self, monkeypatch, use_lxml):
+        """Test that crawl parses an encoded feed with either XML backend."""
+        from react_agent.weekly_pipeline import crawler as crawler_module
+
+        if use_lxml and not crawler_module.LXML_AVAILABLE:
+            pytest.skip("lxml not installed")
+        monkeypatch.setattr(crawler_module, "LXML_AVAILABLE", use_lxml)
+        crawler = RSSCrawler(
+            name="test_rss",
+            base_url="https://example.com",
+            rss_url="https://example.com/feed.xml",
+            source_type="rss",
+        )
+
+        feed = self._feed_bytes()
+        with patch.object(crawler, "fetch_bytes", AsyncMock(return_value=feed)), \
+                patch.object(crawler, "fetch_page", AsyncMock(return_value=feed.decode("euc-kr"))):
+            contents = await crawler.crawl(days_back=7)
+
+        assert [c.title for c in contents] == ["배출권 할당 발표"]
+        assert contents[0].url == "https://example.com/1"
+        assert contents[0].content == "본문"
+        assert contents[0].category == "정책"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_lxml", [False, True])
+    async def test_crawl_parses_atom_feed(self, monkeypatch, use_lxml):
+        """Test Atom field fallbacks: link href, content before summary, updated date."""
+        from react_agent.weekly_pipeline import crawler as crawler_module
+
+        if use_lxml and not crawler_module.LXML_AVAILABLE:
+            pytest.skip("lxml not installed")
+        monkeypatch.setattr(crawler_module, "LXML_AVAILABLE", use_lxml)
+        updated = datetime.now().astimezone().isoformat()
+        feed = f"""<feed xmlns="http://www.w3.org/2005/Atom">
+<entry><title>Atom 기사</title><link href="https://example.com/a"/>
+<summary>요약</summary><content>본문</content><updated>{updated}</updated>
+<category term="market"/></entry></feed>"""
+        crawler = RSSCrawler(
+            name="test_atom",
+            base_url="https://example.com",
+            rss_url="https://example.com/atom.xml",
+            source_type="rss",
+        )
+
+        with patch.object(crawler, "fetch_bytes", AsyncMock(return_value=feed.encode())), \
+                patch.object(crawler, "fetch_page", AsyncMock(return_value=feed)):
+            contents = await crawler.crawl(days_back=7)
+
+        assert len(contents) == 1
+        assert contents[0].title == "Atom 기사"
+        assert contents[0].url == "https://example.com/a"
+        assert contents[0].content == "본문"
+        assert contents[0].category == "market"
+
+    @pytest.mark.asyncio
+    async def test_crawl_cutoff_spans_month_boundary(self):
+        """Test that days_back is subtracted across month boundaries."""
+        from datetime import timedelta
+        from email.utils import format_datetime
+
+        from react_agent.weekly_pipeline import crawler as crawler_module
+
+        now = datetime(2025, 3, 2, 15, 0)
+        feed = f"""<rss><channel>
+<item><title>in range</title><pubDate>{format_datetime(now - timedelta(days=5))}</pubDate></item>
+<item><title>too old</title><pubDate>{format_datetime(now - timedelta(days=9))}</pubDate></item>
+</channel></rss>"""
+        crawler = RSSCrawler(
+            name="test_rss",
+            base_url="https://example.com",
+            rss_url="https://example.com/feed.xml",
+            source_type="rss",
+        )
+
+        with patch.object(crawler_module, "datetime", wraps=datetime) as mock_datetime, \
+                patch.object(crawler, "fetch_bytes", AsyncMock(return_value=feed.encode())), \
+                patch.object(crawler, "fetch_page", AsyncMock(return_value=feed)):
+            mock_datetime.now.return_value = now
+            contents = await crawler.crawl(days_back=7)
+
+        assert [c.title for c in contents] == ["in range"]
+
+    def test_lxml_items_released_while_streaming(self):
+        """Test that lxml streaming drops processed items from the tree."""
+        from react_agent.weekly_pipeline import crawler as crawler_module
+
+        if not crawler_module.LXML_AVAILABLE:
+            pytest.skip("lxml not installed")
+        feed = b"<rss><channel>" + b"<item><title>t</title></item>" * 5 + b"</channel></rss>"
+
+        # At most the previous, already cleared item is still attached
+        earlier = [
+            [len(prev) for prev in item.itersiblings(preceding=True)]
+            for item in crawler_module._iter_feed_items(feed)
+        ]
+
+        assert earlier == [[]] + [[0]] * 4
+
+    @pytest.mark.asyncio
+    async def test_crawl_ignores_malformed_feed(self):
+        """Test that an unparseable feed yields no content instead of raising."""
+        crawler = RSSCrawler(
+            name="test_rss",
+            base_url="https://example.com",
+            rss_url="https://example.com/feed.xml",
+            source_type="rss",
+        )
+
+        with patch.object(crawler, "fetch_bytes", AsyncMock(return_value=b"<rss><item>")), \
+                patch.object(crawler, "fetch_page", AsyncMock(return_value="<rss><item>")):
+            assert await crawler.crawl() == []
+
+    @pytest.mark.asyncio
+    async def test_crawl_keeps_items_before_stream_error(self):
+        """Test that items parsed before a truncated tail are still returned."""
+        from react_agent.weekly_pipeline import crawler as crawler_module
+
+        if not crawler_module.LXML_AVAILABLE:
+            pytest.skip("lxml not installed")
+        crawler = RSSCrawler(
+            name="test_rss",
+            base_url="https://example.com",
+            rss_url="https://example.com/feed.xml",
+            source_type="rss",
+        )
+        feed = b"<rss><channel><item><title>first</title></item><item><title>cut"
+
+        with patch.object(crawler, "fetch_bytes", AsyncMock(return_value=feed)):
+            contents = await crawler.crawl()
+
+        assert [c.title for c in contents] == ["first"]
+
+    def test_parse_item_skips_stale_and_malformed(self):
+        """Test that _parse_item returns None instead of raising."""
+        from xml.etree import ElementTree
+
+        from react_agent.weekly_pipeline import crawler as crawler_module
+        from react_agent.weekly_pipeline.crawler import _parse_item
+
+        # Items come from whichever XML backend the crawler uses
+        backend = crawler_module.lxml_etree if crawler_module.LXML_AVAILABLE else ElementTree
+        item = backend.fromstring(
+            "<item><title>t</title><pubDate>Mon, 10 Feb 2025 12:00:00 +0900</pubDate></item>"
+        )
+        crawler = RSSCrawler(
+            name="src",
+            base_url="https://example.com",
+            rss_url="https://example.com/feed.xml",
+            source_type="rss",
+        )
+        kwargs = dict(source_name="src", language="ko", parse_date=crawler._parse_rss_date)
+
+        def broken_date(date_str):
+            raise ValueError(date_str)
+
+        kept = _parse_item(item, cutoff_date=datetime(2025, 2, 1), **kwargs)
+        assert kept is not None and kept.title == "t" and kept.source == "src"
+        assert _parse_item(item, cutoff_date=datetime(2025, 3, 1), **kwargs) is None
+        assert _parse_item(
+            item, "src", "ko", datetime(2025, 2, 1), parse_date=broken_date
+        ) is None
+
     def test_parse_rss_date_rfc822(self):
         """Test parsing RFC 822 date format."""
         crawler = RSSCrawler(
@@ -260,6 +510,29 @@ class TestRSSCrawler:
         assert result.day == 10
 
 
+    def test_parse_rss_date_cached_and_fallback(self):
+        """Test that parsed dates are cached but the now() fallback is not."""
+        from react_agent.weekly_pipeline.crawler import _parse_date_cached
+
+        crawler = RSSCrawler(
+            name="test_rss",
+            base_url="https://example.com",
+            rss_url="https://example.com/feed.xml",
+            source_type="rss",
+        )
+        _parse_date_cached.cache_clear()
+
+        first = crawler._parse_rss_date("Mon, 10 Feb 2025 12:00:00 +0900")
+        assert crawler._parse_rss_date("Mon, 10 Feb 2025 12:00:00 +0900") is first
+        assert _parse_date_cached.cache_info().hits == 1
+
+        # Day-first RFC 822 without a weekday still parses
+        assert crawler._parse_rss_date("10 Feb 2025 12:00:00 +0900") == first
+
+        before = datetime.now()
+        assert crawler._parse_rss_date("not a date") >= before
+        assert _parse_date_cached("not a date") is None
+
 class TestBaseCrawler:
     """Test BaseCrawler abstract class."""
 
@@ -297,6 +570,96 @@ class TestBaseCrawler:
             assert result == "<html>Test</html>"
             mock_client.get.assert_called_once_with("https://example.com/page")
 
+    @pytest.mark.asyncio
+    async def test_fetch_page_bounded_concurrency(self):
+        """Test that in-flight requests never exceed max_concurrency."""
+        import asyncio
+
+        crawler = RSSCrawler(
+            name="test_rss",
+            base_url="https://example.com",
+            rss_url="https://example.com/feed.xml",
+            source_type="rss",
+            max_concurrency=2,
+        )
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            response = MagicMock()
+            response.text = url
+            return response
+
+        with patch.object(crawler, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.get = fake_get
+            mock_get_client.return_value = mock_client
+
+            results = await asyncio.gather(
+                *(crawler.fetch_page(f"https://example.com/{i}") for i in range(6))
+            )
+
+        assert results == [f"https://example.com/{i}" for i in range(6)]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_page_conditional_get(self, tmp_path):
+        """Test that validators are sent back and a 304 returns the cached body."""
+        import httpx
+
+        cache_path = str(tmp_path / "http_cache.json")
+        crawler = RSSCrawler(
+            name="test_rss",
+            base_url="https://example.com",
+            rss_url="https://example.com/feed.xml",
+            source_type="rss",
+            cache_path=cache_path,
+        )
+        request = httpx.Request("GET", "https://example.com/feed.xml")
+        first = httpx.Response(
+            200,
+            content="피드".encode("euc-kr"),
+            headers={
+                "ETag": '"v1"',
+                "Last-Modified": "Mon, 06 Jan 2025 00:00:00 GMT",
+                "Content-Type": "application/rss+xml; charset=euc-kr",
+            },
+            request=request,
+        )
+        not_modified = httpx.Response(304, request=request)
+
+        with patch.object(crawler, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.get = AsyncMock(side_effect=[first, not_modified])
+            mock_get_client.return_value = mock_client
+
+            assert await crawler.fetch_page("https://example.com/feed.xml") == "피드"
+            assert await crawler.fetch_bytes("https://example.com/feed.xml") == "피드".encode("euc-kr")
+
+        mock_client.get.assert_called_with(
+            "https://example.com/feed.xml",
+            headers={
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Mon, 06 Jan 2025 00:00:00 GMT",
+            },
+        )
+
+        # Validators survive a restart through cache_path
+        await crawler.close()
+        reloaded = RSSCrawler(
+            name="test_rss",
+            base_url="https://example.com",
+            rss_url="https://example.com/feed.xml",
+            source_type="rss",
+            cache_path=cache_path,
+        )
+        assert reloaded._cond_cache == crawler._cond_cache
+
     @pytest.mark.asyncio
     async def test_fetch_page_error(self):
         """Test fetch_page method with error."""
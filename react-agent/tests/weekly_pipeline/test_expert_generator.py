@@ -52,6 +52,17 @@ class TestDynamicExpertRole:
         assert role1 != role3
 
 
+    def test_dynamic_expert_role_immutable(self):
+        """Test that roles are frozen and carry no per-instance __dict__."""
+        import dataclasses
+
+        role = DynamicExpertRole(value="hydrogen_expert")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            role.value = "battery_expert"
+        assert not hasattr(role, "__dict__")
+        assert role != "hydrogen_expert"
+
 class TestExpertGenerator:
     """Test ExpertGenerator class."""
 
@@ -191,6 +202,30 @@ class TestInferDomain:
         assert domain is not None
         assert len(domain) > 0
 
+    def test_automaton_matches_substring_scan(self, monkeypatch):
+        """Test that the Aho-Corasick path infers the same domain as the fallback."""
+        from react_agent.weekly_pipeline import expert_generator
+
+        if expert_generator._DOMAIN_AUTOMATON is None:
+            pytest.skip("pyahocorasick not installed")
+
+        generator = ExpertGenerator()
+        cases = [
+            ["신재생 에너지", "전력 시장"],
+            ["FTA 통상", "금융 투자"],
+            ["무역 무역 무역", "금융 투자"],
+            ["기타 분야"],
+            # Every 통상 keyword: the later domains are skipped by the fallback
+            ["통상 무역 수출 수입 관세 FTA WTO", "금융 투자 자본"],
+        ]
+        fast = [generator._infer_domain(expertise) for expertise in cases]
+        monkeypatch.setattr(expert_generator, "_DOMAIN_AUTOMATON", None)
+        slow = [generator._infer_domain(expertise) for expertise in cases]
+
+        assert fast == slow
+        assert fast[2] == "금융"
+        assert fast[4] == "통상"
+
 
 class TestModuleFunctions:
     """Test module-level functions for dynamic expert management."""
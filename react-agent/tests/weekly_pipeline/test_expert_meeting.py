@@ -107,6 +107,125 @@ class TestExpertMeeting:
         # Should contain expert names
         assert "Dr." in expert_list
 
+    @pytest.mark.asyncio
+    async def test_conduct_meeting_reuses_cached_system_prompt(self):
+        """Test that every meeting sends the same prompt-cached system block."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        response = MagicMock()
+        response.content = '{"assigned_experts": ["policy_expert"]}'
+        with patch(
+            "react_agent.weekly_pipeline.expert_meeting.ChatAnthropic"
+        ) as mock_chat:
+            mock_chat.return_value.ainvoke = AsyncMock(return_value=response)
+            meeting = ExpertMeeting()
+            with patch.object(meeting, "_get_expert_list") as mock_list:
+                await meeting.conduct_meeting("내용", "제목", "출처")
+                await meeting.conduct_meeting("내용2", "제목2", "출처")
+                mock_list.assert_not_called()
+
+        calls = mock_chat.return_value.ainvoke.call_args_list
+        first, second = (call.args[0][0].content for call in calls)
+        assert first == second
+        assert first[0]["cache_control"] == {"type": "ephemeral"}
+        assert "policy_expert" in first[0]["text"]
+
+    @pytest.mark.asyncio
+    async def test_conduct_meeting_caches_results(self):
+        """Test that repeated content reuses the meeting result until it expires."""
+        from datetime import timedelta
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        valid = MagicMock(content='{"assigned_experts": ["market_expert"]}')
+        invalid = MagicMock(content="not json")
+        with patch(
+            "react_agent.weekly_pipeline.expert_meeting.ChatAnthropic"
+        ) as mock_chat:
+            ainvoke = AsyncMock(return_value=valid)
+            mock_chat.return_value.ainvoke = ainvoke
+            meeting = ExpertMeeting()
+
+            first = await meeting.conduct_meeting("내용", "제목", "출처A")
+            first.assigned_experts.append(ExpertRole.POLICY_EXPERT)
+            second = await meeting.conduct_meeting("내용", "제목", "출처B")
+            # A copy: the caller's change above did not reach the cache
+            assert second is not first
+            assert second.assigned_experts == [ExpertRole.MARKET_EXPERT]
+            assert ainvoke.await_count == 1
+
+            # Expired entries trigger a fresh meeting
+            with patch.object(ExpertMeeting, "CACHE_TTL", timedelta(seconds=-1)):
+                await meeting.conduct_meeting("새 내용", "제목", "출처A")
+                await meeting.conduct_meeting("새 내용", "제목", "출처A")
+            assert ainvoke.await_count == 3
+
+            # Parse failures are not cached
+            ainvoke.return_value = invalid
+            await meeting.conduct_meeting("실패", "제목", "출처A")
+            await meeting.conduct_meeting("실패", "제목", "출처A")
+            assert ainvoke.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_conduct_meetings_bounded_and_ordered(self):
+        """Test that batch meetings keep order, cap concurrency and absorb failures."""
+        import asyncio
+        from unittest.mock import patch
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_meeting(content, title, source):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            if title == "bad":
+                raise RuntimeError("rate limited")
+            return MeetingResult(
+                assigned_experts=[ExpertRole.MARKET_EXPERT],
+                new_expert_proposals=[],
+                reasoning=title,
+                consensus_score=1.0,
+            )
+
+        with patch("react_agent.weekly_pipeline.expert_meeting.ChatAnthropic"):
+            meeting = ExpertMeeting(max_concurrency=2)
+        titles = ["a", "bad", "c", "d", "e"]
+        with patch.object(meeting, "conduct_meeting", side_effect=fake_meeting):
+            results = await meeting.conduct_meetings(
+                [("내용", title, "출처") for title in titles]
+            )
+
+        assert peak == 2
+        assert [r.reasoning for r in results if r.error is None] == ["a", "c", "d", "e"]
+        assert results[1].error == "rate limited"
+        assert results[1].assigned_experts == [ExpertRole.POLICY_EXPERT]
+
+    @pytest.mark.asyncio
+    async def test_conduct_meetings_reraises_cancellation(self):
+        """Test that a cancelled meeting is re-raised, not returned as a result."""
+        import asyncio
+        from unittest.mock import patch
+
+        async def fake_meeting(content, title, source):
+            if title == "cancelled":
+                raise asyncio.CancelledError()
+            return MeetingResult(
+                assigned_experts=[ExpertRole.MARKET_EXPERT],
+                new_expert_proposals=[],
+                reasoning=title,
+                consensus_score=1.0,
+            )
+
+        with patch("react_agent.weekly_pipeline.expert_meeting.ChatAnthropic"):
+            meeting = ExpertMeeting()
+        with patch.object(meeting, "conduct_meeting", side_effect=fake_meeting):
+            with pytest.raises(asyncio.CancelledError):
+                await meeting.conduct_meetings(
+                    [("내용", title, "출처") for title in ["a", "cancelled"]]
+                )
+
     def test_parse_response_valid_json(self):
         """Test _parse_response with valid JSON response."""
         meeting = ExpertMeeting()
@@ -193,3 +312,16 @@ class TestExpertMeeting:
         assert isinstance(result, MeetingResult)
         assert ExpertRole.MRV_EXPERT in result.assigned_experts
         assert result.consensus_score == 0.88
+
+    @pytest.mark.parametrize("response", [
+        '{"assigned_experts": ["mrv_expert"], "consensus_score": "high"}',
+        '["mrv_expert"]',
+    ])
+    def test_parse_response_unexpected_shape(self, response):
+        """Test that well-formed but unexpected JSON falls back instead of raising."""
+        meeting = ExpertMeeting()
+
+        result = meeting._parse_response(response)
+
+        assert result.assigned_experts == [ExpertRole.POLICY_EXPERT]
+        assert result.consensus_score == 0.0
@@ -0,0 +1,284 @@
+"""Tests for knowledge base saver module."""
+
+from datetime import datetime
+
+import pytest
+
+from react_agent.agents.expert_panel.config import ExpertRole
+from react_agent.weekly_pipeline.classifier import ClassificationResult
+from react_agent.weekly_pipeline.crawler import CrawledContent
+from react_agent.weekly_pipeline.knowledge_saver import (
+    KnowledgeSaver,
+    get_content_hash,
+    sanitize_filename,
+)
+from react_agent.weekly_pipeline.preprocessor import PreprocessedContent
+
+
+def _content(title: str, body: str, content_hash: str) -> PreprocessedContent:
+    return PreprocessedContent(
+        original=CrawledContent(
+            title=title,
+            content=body,
+            url="https://example.com/1",
+            source="환경부",
+            published_date=datetime(2025, 2, 10),
+        ),
+        clean_content=body,
+        clean_title=title,
+        language="ko",
+        word_count=len(body.split()),
+        content_hash=content_hash,
+    )
+
+
+class TestSanitizeFilename:
+    """Test sanitize_filename function."""
+
+    @pytest.mark.parametrize("title,expected", [
+        ("2025년  NDC: 상향/조정?", "2025년_NDC_상향조정"),
+        ("  배출권 -- 할당  ", "배출권_--_할당"),
+        ("!!!", "untitled"),
+        ("Korea ETS:\tK-ETS  price/update!", "Korea_ETS_K-ETS_priceupdate"),
+        ("snake_case __ title_", "snake_case____title"),
+        ("\u1100\u1161\u11a8 \ud0c4\uc18c", "\uac01_\ud0c4\uc18c"),
+    ])
+    def test_sanitize_filename(self, title, expected):
+        """Test that invalid characters are dropped and spaces collapsed."""
+        assert sanitize_filename(title) == expected
+
+    def test_sanitize_filename_truncates(self):
+        """Test that long titles are cut without a trailing underscore."""
+        assert sanitize_filename("가" * 5 + " " + "나" * 10, max_length=6) == "가" * 5
+
+
+def test_get_content_hash():
+    """Test that the hash is the MD5 prefix and the same for str and bytes."""
+    digest = get_content_hash("탄소배출권 본문")
+
+    # Existing knowledge bases name their files with this suffix
+    assert digest == "897e5117"
+    assert get_content_hash("탄소배출권 본문".encode("utf-8")) == digest
+    assert get_content_hash("다른 본문") != digest
+
+
+class TestKnowledgeSaver:
+    """Test KnowledgeSaver class."""
+
+    @pytest.fixture
+    def saver(self, tmp_path):
+        """Create a KnowledgeSaver writing under a temporary directory."""
+        return KnowledgeSaver(base_path=tmp_path)
+
+    @pytest.fixture
+    def classification(self):
+        """Create a policy expert classification."""
+        return ClassificationResult(
+            primary_expert=ExpertRole.POLICY_EXPERT,
+            primary_score=0.8,
+        )
+
+    def test_gitkeep_only_in_empty_folders(self, tmp_path):
+        """Test that .gitkeep is added to empty category folders only."""
+        (tmp_path / "시장거래").mkdir()
+        (tmp_path / "시장거래" / "doc.md").write_text("x", encoding="utf-8")
+
+        KnowledgeSaver(base_path=tmp_path)
+
+        assert (tmp_path / "정책법규" / ".gitkeep").exists()
+        assert not (tmp_path / "시장거래" / ".gitkeep").exists()
+
+    def test_save_content_writes_document(self, saver, classification):
+        """Test that a new content is written under its category folder."""
+        path = saver.save_content(_content("NDC 상향", "정부 발표 본문", "h1"), classification)
+
+        assert path is not None
+        text = open(path, encoding="utf-8").read()
+        assert "# NDC 상향" in text
+        assert "정책법규" in path
+
+    def test_save_content_keeps_existing_file(self, saver, classification):
+        """Test that an existing file is reported but not overwritten."""
+        content = _content("NDC 상향", "정부 발표 본문", "h1")
+        path = saver.save_content(content, classification)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("edited")
+
+        # A fresh saver has no in-memory hashes, so it reaches the file check
+        again = KnowledgeSaver(base_path=saver.base_path).save_content(content, classification)
+
+        assert again == path
+        assert open(path, encoding="utf-8").read() == "edited"
+
+    def test_save_batch_skips_duplicates(self, saver, classification):
+        """Test that save_batch counts each content hash once."""
+        contents = [
+            _content("NDC 상향", "본문", "h1"),
+            _content("NDC 상향", "본문", "h1"),
+            _content("배출권 할당", "다른 본문", "h2"),
+        ]
+
+        assert saver.save_batch(contents, [classification] * 3) == 2
+
+    def test_save_batch_concurrent_duplicates_written_once(self, tmp_path, classification):
+        """Test that threaded save_batch claims each hash before writing."""
+        saver = KnowledgeSaver(base_path=tmp_path, max_workers=4)
+        contents = [_content("NDC 상향", "본문", "h1") for _ in range(8)]
+
+        assert saver.save_batch(contents, [classification] * 8) == 1
+        assert len(list((tmp_path / "정책법규").glob("*.md"))) == 1
+
+    def test_failed_save_releases_hash(self, saver, classification):
+        """Test that a failed write does not mark the content as saved."""
+        from unittest.mock import patch
+
+        content = _content("NDC 상향", "본문", "h1")
+        with patch.object(saver, "_build_document_head", side_effect=RuntimeError("disk")):
+            assert saver.save_content(content, classification) is None
+
+        assert saver.save_content(content, classification) is not None
+
+    def test_build_document_layout(self, saver):
+        """Test frontmatter, analysis sections and original content in order."""
+        from react_agent.weekly_pipeline.analyzer import AnalysisResult
+
+        classification = ClassificationResult(
+            primary_expert=ExpertRole.POLICY_EXPERT,
+            primary_score=0.8,
+            secondary_expert=ExpertRole.MRV_EXPERT,
+        )
+        analysis = AnalysisResult(
+            expert_role=ExpertRole.POLICY_EXPERT,
+            content_id="h1",
+            summary="요약문",
+            key_findings=["발견1", "발견2"],
+            implications=[],
+            confidence=0.9,
+        )
+
+        document = saver._build_document(_content("NDC {상향}", "본문", "h1"), classification, analysis)
+
+        assert document.startswith('---\ntitle: "NDC {상향}"\nsource: "환경부"\n')
+        assert 'word_count: 1\nrelated_categories: "mrv_expert"\n---\n\n# NDC {상향}\n' in document
+        assert "## 전문가 분석\n\n### 요약\n요약문\n\n### 주요 발견\n- 발견1\n- 발견2\n\n## 원문 내용\n\n본문\n" in document
+        assert "시사점" not in document
+
+    def test_partial_write_removed(self, saver, classification):
+        """Test that a failed write leaves no truncated document behind."""
+        from unittest.mock import patch
+
+        content = _content("NDC 상향", "본문", "h1")
+        with patch("react_agent.weekly_pipeline.knowledge_saver.os.write", side_effect=OSError("disk full")):
+            assert saver.save_content(content, classification) is None
+
+        assert list((saver.base_path / "정책법규").glob("*.md")) == []
+        assert saver.save_content(content, classification) is not None
+
+    def test_index_skips_known_content_across_runs(self, saver, classification):
+        """Test that a later run finds saved content by hash before building it."""
+        from unittest.mock import patch
+
+        path = saver.save_content(_content("NDC 상향", "본문", "h1"), classification)
+
+        next_run = KnowledgeSaver(base_path=saver.base_path)
+        with patch.object(next_run, "_build_document_head") as build:
+            # Same content under a new title still maps to the saved file
+            again = next_run.save_content(_content("NDC 상향 (재게시)", "본문", "h1"), classification)
+
+        assert again == path
+        build.assert_not_called()
+
+    def test_index_independent_of_content_hash_algorithm(self, saver, classification):
+        """Test that the index matches when content_hash was computed differently."""
+        from unittest.mock import patch
+
+        path = saver.save_content(_content("NDC 상향", "본문", "xxh3-digest"), classification)
+
+        # e.g. the next run has no xxhash and content_hash falls back to MD5
+        next_run = KnowledgeSaver(base_path=saver.base_path)
+        with patch.object(next_run, "_build_document_head") as build:
+            again = next_run.save_content(_content("NDC 상향", "본문", "md5-digest"), classification)
+
+        assert again == path
+        build.assert_not_called()
+
+    def test_index_entry_for_deleted_file_is_rewritten(self, saver, classification):
+        """Test that an index row whose file is gone does not block saving."""
+        import os
+
+        content = _content("NDC 상향", "본문", "h1")
+        path = saver.save_content(content, classification)
+        os.remove(path)
+
+        assert KnowledgeSaver(base_path=saver.base_path).save_content(content, classification) == path
+        assert os.path.exists(path)
+
+    def test_get_statistics(self, saver, classification):
+        """Test document counts per category and the latest modification time."""
+        market = ClassificationResult(primary_expert=ExpertRole.MARKET_EXPERT, primary_score=0.5)
+        saver.save_content(_content("NDC 상향", "본문", "h1"), classification)
+        saver.save_content(_content("배출권 할당", "다른 본문", "h2"), classification)
+        saver.save_content(_content("가격 동향", "시장 본문", "h3"), market)
+
+        stats = saver.get_statistics()
+
+        assert stats["total_documents"] == 3
+        assert stats["by_category"]["정책법규"] == 2
+        assert stats["by_category"]["시장거래"] == 1
+        assert stats["by_category"]["MRV검증"] == 0
+        assert stats["last_updated"] is not None
+
+    def test_save_batch_formats_crawl_date_once(self, saver, classification):
+        """Test that every document in a batch carries the batch's crawl date."""
+        from unittest.mock import patch
+
+        from react_agent.weekly_pipeline import knowledge_saver as saver_module
+
+        contents = [_content(f"제목{i}", f"본문{i}", f"h{i}") for i in range(3)]
+        with patch.object(saver_module, "datetime", wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 2, 17, 9, 0)
+            assert saver.save_batch(contents, [classification] * 3) == 3
+
+        assert mock_datetime.now.call_count == 1
+        for path in (saver.base_path / "정책법규").glob("*.md"):
+            assert 'crawled_date: "2025-02-17"' in path.read_text(encoding="utf-8")
+
+    def test_save_content_dynamic_role_uses_other_folder(self, saver):
+        """Test that roles outside ExpertRole still resolve to the fallback folder."""
+        from react_agent.weekly_pipeline.expert_generator import DynamicExpertRole
+
+        classification = ClassificationResult(
+            primary_expert=DynamicExpertRole("trade_expert"),
+            primary_score=0.7,
+        )
+
+        path = saver.save_content(_content("CBAM 동향", "본문", "h1"), classification)
+
+        assert path is not None
+        assert "기타" in path
+
+    def test_save_batch_durable_syncs_folders_once(self, saver, classification):
+        """Test that durable save_batch syncs each file and each folder once."""
+        from unittest.mock import patch
+
+        from react_agent.weekly_pipeline import knowledge_saver as saver_module
+
+        contents = [_content(f"제목{i}", f"본문{i}", f"h{i}") for i in range(3)]
+        with patch.object(saver_module.os, "fsync", wraps=saver_module.os.fsync) as fsync, \
+                patch.object(saver_module, "_fsync_directory") as fsync_directory:
+            assert saver.save_batch(contents, [classification] * 3, durable=True) == 3
+
+        assert fsync.call_count == 3
+        fsync_directory.assert_called_once_with(str(saver.base_path / "정책법규"))
+
+    def test_saved_file_matches_build_document(self, saver, classification):
+        """Test that the chunked write produces exactly the built document."""
+        content = _content("NDC 상향", "정부 발표 본문\n둘째 줄", "h1")
+
+        path = saver.save_content(content, classification, None)
+
+        expected = saver._build_document(
+            content, classification, None, datetime.now().strftime("%Y-%m-%d")
+        )
+        with open(path, encoding="utf-8", newline="") as f:
+            assert f.read() == expected
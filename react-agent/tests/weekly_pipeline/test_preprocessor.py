@@ -83,6 +83,24 @@ class TestPreprocessor:
         assert "Paragraph 1" in result
         assert "Paragraph 2" in result
 
+    @pytest.mark.parametrize("html", [
+        "a<script>x</script>b<!-- note -->c",
+        "<div><nav><a>메뉴</a></nav>본문 &amp; 내용<footer>f</footer>끝</div>",
+        "<p>unclosed <b>bold",
+        "<?xml version='1.0' encoding='utf-8'?><p>선언</p>",
+        "   ",
+    ])
+    def test_clean_html_backends_agree(self, monkeypatch, preprocessor, html):
+        """Test that the lxml and BeautifulSoup paths extract the same text."""
+        from react_agent.weekly_pipeline import preprocessor as preprocessor_module
+
+        if not preprocessor_module.LXML_AVAILABLE:
+            pytest.skip("lxml not installed")
+        with_lxml = preprocessor.clean_html(html)
+        monkeypatch.setattr(preprocessor_module, "LXML_AVAILABLE", False)
+
+        assert preprocessor.clean_html(html) == with_lxml
+
     def test_normalize_text_removes_consecutive_spaces(self, preprocessor):
         """Test that normalize_text removes consecutive spaces."""
         text = "Hello    World    Test"
@@ -108,6 +126,25 @@ class TestPreprocessor:
 
         assert result == "Hello World"
 
+    @pytest.mark.parametrize("text,expected", [
+        ("a\tb", "a b"),
+        ("a \t b", "a b"),
+        ("a b\nc", "a b\nc"),
+        ("a\n\n \n\nb", "a\n \nb"),
+    ])
+    def test_normalize_text_whitespace_runs(self, preprocessor, text, expected):
+        """Test that tabs and mixed runs collapse while single separators stay."""
+        assert preprocessor.normalize_text(text) == expected
+
+    def test_normalize_text_clean_input_skips_regex(self, monkeypatch, preprocessor):
+        """Test that already-normalized text is only stripped."""
+        from react_agent.weekly_pipeline import preprocessor as preprocessor_module
+
+        monkeypatch.setattr(preprocessor_module, "_SPACE_RUN_RE", None)
+        monkeypatch.setattr(preprocessor_module, "_NEWLINE_RUN_RE", None)
+
+        assert preprocessor.normalize_text(" 이미 정리된 문장\n다음 줄 ") == "이미 정리된 문장\n다음 줄"
+
     def test_detect_language_korean(self, preprocessor):
         """Test that detect_language returns 'ko' for Korean text."""
         korean_text = "안녕하세요. 오늘 날씨가 좋습니다. 탄소중립 정책에 대해 알아봅시다."
@@ -129,14 +166,63 @@ class TestPreprocessor:
 
         assert result == "ko"
 
+    @pytest.mark.parametrize("text,expected", [
+        ("ab가", "ko"),       # 1/3 Korean
+        ("abc가", "en"),      # 1/4 Korean
+        ("ㄱ abcd 12", "en"),   # jamo count as Korean: 1/5
+        ("ㄱㄴ ab", "ko"),
+        ("123 !!", "en"),
+    ])
+    def test_detect_language_ratio(self, preprocessor, text, expected):
+        """Test the 30% Korean character threshold on short mixed text."""
+        assert preprocessor.detect_language(text) == expected
+
+    @pytest.mark.parametrize("text", [
+        "배출권 거래 시장 동향 ETS market price update 2025년 😀 " * 40,
+        "ㄱㄴㄷ ᄀᄁ abc XYZ 가힣 Ω é " * 50,
+        "market price update 2025 " * 40,
+    ])
+    def test_detect_language_numpy_matches_regex(self, monkeypatch, preprocessor, text):
+        """Test that long texts get the same language with and without numpy."""
+        from react_agent.weekly_pipeline import preprocessor as preprocessor_module
+
+        if not preprocessor_module.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        regex_counts = (
+            sum(map(len, preprocessor_module._KOREAN_RUN_RE.findall(text))),
+            sum(map(len, preprocessor_module._KOREAN_RUN_RE.findall(text)))
+            + sum(map(len, preprocessor_module._LATIN_RUN_RE.findall(text))),
+        )
+        assert preprocessor_module._count_letters_numpy(text) == regex_counts
+
+        with_numpy = preprocessor.detect_language(text)
+        monkeypatch.setattr(preprocessor_module, "NUMPY_AVAILABLE", False)
+
+        assert preprocessor.detect_language(text) == with_numpy
+
     def test_compute_hash(self, preprocessor):
-        """Test that compute_hash generates consistent MD5 hash."""
+        """Test that compute_hash generates a consistent 128-bit hash."""
         text = "Test content for hashing"
         hash1 = preprocessor.compute_hash(text)
         hash2 = preprocessor.compute_hash(text)
 
         assert hash1 == hash2
-        assert len(hash1) == 32  # MD5 hex digest length
+        assert len(hash1) == 32  # 128-bit hex digest length
+
+    @pytest.mark.parametrize("use_xxhash", [False, True])
+    def test_compute_hash_backends(self, monkeypatch, preprocessor, use_xxhash):
+        """Test that both hash backends give 32 hex characters."""
+        from react_agent.weekly_pipeline import preprocessor as preprocessor_module
+
+        if use_xxhash and not preprocessor_module.XXHASH_AVAILABLE:
+            pytest.skip("xxhash not installed")
+        monkeypatch.setattr(preprocessor_module, "XXHASH_AVAILABLE", use_xxhash)
+
+        digest = preprocessor.compute_hash("탄소배출권 본문")
+
+        assert len(digest) == 32
+        int(digest, 16)
+        assert digest != preprocessor.compute_hash("다른 본문")
 
     def test_compute_hash_different_content(self, preprocessor):
         """Test that compute_hash generates different hashes for different content."""
@@ -263,6 +349,58 @@ class TestPreprocessor:
 
         assert len(result) == 5
 
+    def test_deduplicate_hashes_only_colliding_items(self, monkeypatch, preprocessor):
+        """Test that only prefilter collisions are hashed, keeping input order."""
+        now = datetime.now()
+
+        def make(title, content):
+            return CrawledContent(
+                title=title,
+                content=content,
+                url="https://example.com",
+                source="source",
+                published_date=now,
+            )
+
+        long_body = "공통 본문 " * 20
+        contents = [
+            make("짧은 제목", "본문"),
+            make("A", long_body + "x"),
+            make("다른 길이의 제목", "본문"),
+            make("A", long_body + "y"),
+            make("A", long_body + "x"),
+        ]
+        hashed = []
+        original = preprocessor.compute_hash
+        monkeypatch.setattr(
+            preprocessor, "compute_hash", lambda text: hashed.append(text) or original(text)
+        )
+
+        result = preprocessor.deduplicate(contents)
+
+        assert result == contents[:4]
+        assert len(hashed) == 3
+
+    def test_deduplicate_preprocessed_uses_cached_hash(self, monkeypatch, preprocessor):
+        """Test that markup-only variants are dropped without rehashing."""
+        now = datetime.now()
+        contents = [
+            CrawledContent(
+                title="Title",
+                content=content,
+                url="https://example.com",
+                source="source",
+                published_date=now,
+            )
+            for content in ["<p>Same text</p>", "<div>Same  text</div>", "<p>Other</p>"]
+        ]
+        preprocessed = preprocessor.preprocess_batch(contents)
+        monkeypatch.setattr(preprocessor, "compute_hash", None)
+
+        result = preprocessor.deduplicate_preprocessed(preprocessed)
+
+        assert result == [preprocessed[0], preprocessed[2]]
+
     def test_preprocess_batch(self, preprocessor):
         """Test that preprocess_batch processes multiple contents."""
         now = datetime.now()
@@ -284,6 +422,69 @@ class TestPreprocessor:
             assert isinstance(preprocessed, PreprocessedContent)
             assert f"Content {i}" in preprocessed.clean_content
 
+    def test_preprocess_batch_process_pool(self, monkeypatch):
+        """Test that the process pool path returns the serial results in order."""
+        now = datetime.now()
+        contents = [
+            CrawledContent(
+                title=f"Title {i}",
+                content=f"<p>Content {i}</p>",
+                url=f"https://example.com/{i}",
+                source="source",
+                published_date=now,
+            )
+            for i in range(6)
+        ]
+        preprocessor = Preprocessor(processes=2)
+        monkeypatch.setattr(Preprocessor, "PARALLEL_THRESHOLD", 4)
+
+        assert preprocessor.preprocess_batch(contents) == Preprocessor().preprocess_batch(contents)
+
+    def test_preprocess_batch_process_pool_uses_spawn(self, monkeypatch):
+        """Test that the pool never forks the (multithreaded) caller."""
+        import multiprocessing
+
+        contexts = []
+        get_context = multiprocessing.get_context
+
+        def record(method=None):
+            contexts.append(method)
+            return get_context(method)
+
+        monkeypatch.setattr(multiprocessing, "get_context", record)
+        monkeypatch.setattr(Preprocessor, "PARALLEL_THRESHOLD", 1)
+
+        Preprocessor(processes=2).preprocess_batch([
+            CrawledContent(
+                title="Title",
+                content="<p>Content</p>",
+                url="https://example.com",
+                source="source",
+                published_date=datetime.now(),
+            )
+        ])
+
+        assert contexts == ["spawn"]
+
+    @pytest.mark.asyncio
+    async def test_preprocess_batch_async_matches_sync(self, preprocessor):
+        """Test that the threaded batch keeps input order and results."""
+        now = datetime.now()
+        contents = [
+            CrawledContent(
+                title=f"Title {i}",
+                content=f"<p>Content {i}</p><script>x</script>",
+                url=f"https://example.com/{i}",
+                source="source",
+                published_date=now,
+            )
+            for i in range(20)
+        ]
+
+        result = await preprocessor.preprocess_batch_async(contents)
+
+        assert result == preprocessor.preprocess_batch(contents)
+
 
 class TestPreprocessedContent:
     """Test PreprocessedContent dataclass."""
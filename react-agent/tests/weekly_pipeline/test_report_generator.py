@@ -201,6 +201,18 @@ class TestReportGenerator:
         assert icons[ExpertRole.TECHNOLOGY_EXPERT] == "⚡"
         assert icons[ExpertRole.MRV_EXPERT] == "📋"
 
+    def test_role_names_cover_all_roles(self):
+        """Test that ROLE_NAMES has a display name for every expert role."""
+        assert set(ReportGenerator.ROLE_NAMES) == set(ExpertRole)
+
+    @pytest.mark.parametrize("items,expected", [
+        (["첫째", "둘째"], "- 첫째\n- 둘째"),
+        ([], "- 없음"),
+    ])
+    def test_format_bullets(self, items, expected):
+        """Test bullet list formatting with the empty placeholder."""
+        assert ReportGenerator._format_bullets(items, "없음") == expected
+
     def test_report_template_exists(self):
         """Test that REPORT_TEMPLATE is defined."""
         assert hasattr(ReportGenerator, "REPORT_TEMPLATE")
@@ -124,6 +124,25 @@ class TestWeeklyPipeline:
         assert hasattr(pipeline, "_stage_report")
 
 
+    def test_stage_classify_uses_title_and_content(self):
+        """Test that classify stage scores title and content together, in order."""
+        from types import SimpleNamespace
+
+        pipeline = WeeklyPipeline()
+        contents = [
+            SimpleNamespace(clean_title="NDC 상향", clean_content="파리협정 이행"),
+            SimpleNamespace(clean_title="시장 동향", clean_content="배출권 가격 상승"),
+        ]
+
+        results = pipeline._stage_classify(contents)
+
+        expected = [
+            pipeline._classifier.classify(f"{c.clean_title} {c.clean_content}")
+            for c in contents
+        ]
+        assert [r.primary_expert for r in results] == [r.primary_expert for r in expected]
+        assert [r.matched_keywords for r in results] == [r.matched_keywords for r in expected]
+
 class TestPipelineScheduler:
     """Test PipelineScheduler class."""
 
@@ -156,6 +156,35 @@ class TestGetDefaultRegistry:
         assert len(crawlers) >= 1
 
 
+    @pytest.mark.asyncio
+    async def test_get_default_registry_persists_validators(self, tmp_path) -> None:
+        """Test that a second run's registry sends the first run's ETag."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        import httpx
+
+        def response(url, **kwargs):
+            request = httpx.Request("GET", url)
+            return httpx.Response(200, content=b"<rss/>", headers={"ETag": '"v1"'}, request=request)
+
+        cache_dir = str(tmp_path / "crawl_cache")
+        url = DOMESTIC_SOURCES[0].rss_url
+        with patch("react_agent.weekly_pipeline.crawler._create_client") as create_client:
+            client = MagicMock()
+            client.get = AsyncMock(side_effect=response)
+            client.aclose = AsyncMock()
+            create_client.return_value = client
+
+            first_run = get_default_registry(cache_dir=cache_dir)
+            await first_run.get(DOMESTIC_SOURCES[0].name).fetch_page(url)
+            await first_run.close_all()
+
+            second_run = get_default_registry(cache_dir=cache_dir)
+            await second_run.get(DOMESTIC_SOURCES[0].name).fetch_page(url)
+
+        assert client.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
 class TestCreateCrawlerFromConfig:
     """Tests for create_crawler_from_config function."""
 